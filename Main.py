@@ -4,21 +4,39 @@ import wx.grid
 import pandas as pd
 import webbrowser
 import re
+import unicodedata
 from typing import Dict, List, Tuple
+from types import MappingProxyType
 import os
 import sys
 import json
+import time
+import hashlib
+import io
+import zipfile
+import threading
+from collections import OrderedDict
+import tempfile
+import shutil
+import sqlite3
+import multiprocessing
+from pathlib import Path
 import pyperclip
 import matplotlib
+import matplotlib.colors
 import wx.adv
 
 matplotlib.use('WXAgg')
 from matplotlib.figure import Figure
+from matplotlib.widgets import SpanSelector
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
 from matplotlib.backends.backend_wxagg import NavigationToolbar2WxAgg as NavigationToolbar
 import numpy as np
 import platform
 import wx.html2
+import atlas
+from page_cache import PageCache
+from downloads import DownloadJob, DownloadManager
 
 
 # Standalone icon helper (replaces libraries.Utilities.set_app_icon)
@@ -37,7 +55,2783 @@ def set_app_icon(frame):
             pass
 
 
+def get_cache_dir(*parts):
+    """Return (creating it if needed) a KherveDB cache folder.
+
+    Caches live in a 'cache' folder next to config.json; when that location is not
+    writable (e.g. a read-only install folder) ~/.khervedb/cache is used instead.
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+
+    for root in (os.path.join(base_path, 'cache'),
+                 os.path.join(os.path.expanduser('~'), '.khervedb', 'cache')):
+        path = os.path.join(root, *parts)
+        try:
+            os.makedirs(path, exist_ok=True)
+            if os.access(path, os.W_OK):
+                return path
+        except OSError:
+            continue
+    return tempfile.mkdtemp(prefix='khervedb_')
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """SHA-1 of a file's contents (used to key caches of data derived from it)"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """On-disk cache of values derived from one dataset, keyed by the data file's hash.
+
+    A changed data file gets a new hash and therefore a fresh cache folder, so
+    cached results never go stale.
+    """
+
+    def __init__(self, dataset_hash):
+        self.dataset_hash = dataset_hash
+        self.directory = get_cache_dir('datasets', dataset_hash[:16])
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def load_json(self, name):
+        """Return the cached JSON value for name, or None if missing or unreadable"""
+        try:
+            with open(self.path(name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('dataset_hash') != self.dataset_hash:
+            return None
+        return data.get('value')
+
+    def save_json(self, name, value):
+        tmp_path = self.path(name) + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'dataset_hash': self.dataset_hash, 'value': value}, f)
+            os.replace(tmp_path, self.path(name))
+        except OSError as e:
+            print(f"Could not write cache {name}: {e}")
+
+    def load_frame(self, name):
+        """Return a cached DataFrame (parquet), or None if missing or unreadable"""
+        try:
+            return pd.read_parquet(self.path(name))
+        except Exception:
+            return None
+
+    def save_frame(self, name, frame):
+        tmp_path = self.path(name) + '.tmp'
+        try:
+            frame.to_parquet(tmp_path)
+            os.replace(tmp_path, self.path(name))
+        except Exception as e:
+            print(f"Could not write cache {name}: {e}")
+
+
+MAIN_LINES_CACHE_NAME = 'main_lines_v1.json'  # dataset cache entry of compute_main_lines()
+
+
+def compute_main_lines(df):
+    """Most-referenced line per element and its median BE, from one groupby.
+
+    Returns {element: [line, median_be, count]}; ties between lines go to the
+    alphabetically first line so the result is stable.
+    """
+    stats = (df.groupby(['Element', 'Line'], observed=True)['BE (eV)']
+             .agg(count='size', median='median')
+             .reset_index())
+    stats = stats.sort_values(['Element', 'count', 'Line'], ascending=[True, False, True])
+    main = stats.drop_duplicates('Element')
+    return {str(element): [str(line), None if pd.isna(median) else float(median), int(count)]
+            for element, line, count, median in main[['Element', 'Line', 'count', 'median']].itertuples(index=False)}
+
+
+def _text_column(records, column):
+    if column not in records.columns:
+        return pd.Series('', index=records.index)
+    return records[column].fillna('').astype(str).str.strip()
+
+
+def format_records(records, style):
+    """Clipboard text for database rows, built column-wise in one pass.
+
+    style is 'tsv' (the grid columns with a header row), 'references' (one
+    'Element Line - BE eV - Formula - Name - Journal' line per row) or 'bibtex'
+    (@misc entries keyed by first author surname and year).
+    """
+    if style == 'tsv':
+        columns = [column for column in ('Element', 'Line', 'BE (eV)', 'Formula', 'Name', 'Journal', 'Author')
+                   if column in records.columns]
+        return records[columns].to_csv(sep='\t', index=False, float_format='%.2f', lineterminator='\n')
+
+    be = records['BE (eV)']
+    be_text = be.map('{:.2f}'.format).where(be.notna(), '')
+    element, line = _text_column(records, 'Element'), _text_column(records, 'Line')
+    formula, name = _text_column(records, 'Formula'), _text_column(records, 'Name')
+    journal = _text_column(records, 'Journal')
+
+    if style == 'references':
+        lines = element + ' ' + line + ' - ' + be_text + ' eV - ' + formula + ' - ' + name + ' - ' + journal
+        return '\n'.join(lines)
+
+    author = _text_column(records, 'Author')
+    year = journal.str.extract(r'\((\d{4})\)\s*$', expand=False).fillna('')
+    surname = author.str.extract(r"^([^\W\d_][\w'-]*)", expand=False).fillna('')
+    # Cite keys are ASCII: fold accents the way AuthorIndex.tokenize does
+    surname = (surname.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+               .str.replace(r'[^A-Za-z0-9-]', '', regex=True))
+    keys = surname.where(surname != '', 'NIST') + year + '_' + records.index.astype(str)
+    # 'Surname I.J., Surname K., et al.': split after the initials only
+    authors = (author.str.replace(r',\s*et al\.?$', ' and others', regex=True)
+               .str.replace(r'(?<=[.A-Z]),\s*', ' and ', regex=True))
+    # Leave out empty fields rather than writing 'author = {}'
+    author_field = ('  author = {' + authors + '},\n').where(authors != '', '')
+    year_field = ('  year = {' + year + '},\n').where(year != '', '')
+    entries = ('@misc{' + keys + ',\n'
+               + author_field
+               + '  title = {' + name.where(name != '', formula) + '},\n'
+               + '  howpublished = {' + journal + '},\n'
+               + year_field
+               + '  note = {' + element + ' ' + line + ' BE = ' + be_text + ' eV, ' + formula + '}\n}')
+    return '\n\n'.join(entries)
+
+
+class LineStatistics:
+    """Binding-energy statistics for every (Element, Line) group of the dataset.
+
+    Computed once for all groups (count, mean, median, std, MAD, min, max,
+    5/25/75/95 % quantiles and the 1/u^2 weighted mean over rows with an energy
+    uncertainty) and cached per dataset, so the XPS tab, plot overlay and
+    exports only do index lookups.
+    """
+
+    COLUMNS = ['count', 'mean', 'median', 'std', 'mad', 'min', 'max',
+               'q05', 'q25', 'q75', 'q95', 'weighted_mean', 'n_weighted']
+    CACHE_NAME = 'line_stats_v1.parquet'
+
+    def __init__(self, table):
+        self.table = table
+
+    @classmethod
+    def compute(cls, df):
+        data = df[['Element', 'Line', 'BE (eV)']].copy()
+        if 'Energy Uncertainty' in df.columns:
+            uncertainty = pd.to_numeric(df['Energy Uncertainty'], errors='coerce')
+        else:
+            uncertainty = pd.Series(np.nan, index=df.index)
+        data = data[data['BE (eV)'].notna()]
+        keys = [data['Element'], data['Line']]
+        be = data['BE (eV)']
+
+        grouped = be.groupby(keys, observed=True, sort=True)
+        table = grouped.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+
+        quantiles = grouped.quantile([0.05, 0.25, 0.75, 0.95]).unstack()
+        quantiles.columns = ['q05', 'q25', 'q75', 'q95']
+        table = table.join(quantiles)
+
+        table['mad'] = (be - grouped.transform('median')).abs().groupby(keys, observed=True).median()
+
+        # Inverse-variance weighted mean over rows reporting a positive uncertainty
+        u = uncertainty.reindex(data.index)
+        weights = (1.0 / u ** 2).where(u > 0, 0.0)
+        weight_sum = weights.groupby(keys, observed=True).sum()
+        table['weighted_mean'] = ((weights * be).groupby(keys, observed=True).sum() / weight_sum
+                                  ).where(weight_sum > 0)
+        table['n_weighted'] = (weights > 0).groupby(keys, observed=True).sum()
+
+        table.index.names = ['Element', 'Line']
+        return cls(table[cls.COLUMNS])
+
+    @classmethod
+    def load(cls, df, dataset_cache):
+        """Read the statistics from the dataset cache, computing them on a miss"""
+        table = dataset_cache.load_frame(cls.CACHE_NAME)
+        if table is not None and list(table.columns) == cls.COLUMNS:
+            return cls(table)
+        stats = cls.compute(df)
+        dataset_cache.save_frame(cls.CACHE_NAME, stats.table)
+        return stats
+
+    def for_element(self, element):
+        """Statistics of all lines of an element (DataFrame indexed by Line)"""
+        try:
+            return self.table.xs(element, level='Element')
+        except KeyError:
+            return self.table.iloc[0:0].droplevel('Element')
+
+    def get(self, element, line):
+        """Statistics of one (element, line) group as a Series, or None"""
+        try:
+            return self.table.loc[(element, line)]
+        except KeyError:
+            return None
+
+
+class CitationIndex:
+    """Journal citations ('Surf. Sci. 318, 97 (1994)') split into typed columns.
+
+    The free-text Journal column is parsed once per dataset (each distinct string
+    only once) into Journal Abbrev, Volume, Page and Year, cached with the dataset.
+    Year filters use a SortedIndex and journal filters compare integer codes.
+    """
+
+    COLUMNS = ['Journal Abbrev', 'Volume', 'Page', 'Year']
+    CACHE_NAME = 'citations_v1.parquet'
+    # "<abbrev> [<volume>[,]] <page>[,] (<year>)"; abbreviations may end in a number ('Part 1')
+    PATTERN = (r'^\s*(?P<abbrev>.*?\S),?\s+(?:(?P<volume>[A-Za-z]?\d[\w-]*),?\s+)?'
+               r'(?P<page>[A-Za-z]?\d[\w-]*)\s*,?\s*\((?P<year>\d{4})\)\s*$')
+
+    def __init__(self, table):
+        self.table = table
+        self.years = table['Year'].to_numpy(dtype=float, na_value=np.nan)
+        self.year_index = SortedIndex(self.years)
+        self.journal_codes, self.journals = pd.factorize(table['Journal Abbrev'], sort=True)
+        # Combine per-column codes: factorize maps missing values (e.g. <NA> years) to -1
+        self.publication_codes = pd.factorize(pd.MultiIndex.from_arrays(
+            [pd.factorize(table[column])[0] for column in table.columns]))[0]
+
+    @classmethod
+    def parse(cls, journal):
+        """Parse a Journal column into a DataFrame of COLUMNS (same index)"""
+        codes, citations = pd.factorize(journal)
+        citations = pd.Series(citations, dtype=object).astype(str).str.strip()
+        parts = citations.str.extract(cls.PATTERN)
+        # Books and truncated entries: keep the text, take the last year-like number
+        year = parts['year'].fillna(citations.str.extract(r'.*\b((?:19|20)\d{2})\b', expand=False))
+        abbrev = parts['abbrev'].fillna(citations.str.replace(r'\s*\(?\b(?:19|20)\d{2}\)?\s*$', '', regex=True))
+        parsed = pd.DataFrame({'Journal Abbrev': abbrev, 'Volume': parts['volume'], 'Page': parts['page'],
+                               'Year': pd.to_numeric(year).astype('Int16')})
+        # Expand back to one row per record; missing citations stay empty
+        table = parsed.reindex(codes).set_axis(journal.index)
+        table.loc[codes < 0, 'Journal Abbrev'] = None
+        return table[cls.COLUMNS]
+
+    @classmethod
+    def load(cls, df, dataset_cache):
+        """Read the parsed citations from the dataset cache, parsing them on a miss"""
+        table = dataset_cache.load_frame(cls.CACHE_NAME)
+        if table is None or list(table.columns) != cls.COLUMNS or not table.index.equals(df.index):
+            table = cls.parse(df['Journal'])
+            dataset_cache.save_frame(cls.CACHE_NAME, table)
+        return cls(table)
+
+    def mask(self, year_range=None, journal=None):
+        """Boolean row mask for a (first, last) year range and/or a journal abbreviation"""
+        mask = np.ones(len(self.years), dtype=bool)
+        if year_range:
+            mask &= self.year_index.mask(*year_range)
+        if journal:
+            code = self.journals.get_loc(journal) if journal in self.journals else -2
+            mask &= self.journal_codes == code
+        return mask
+
+    def year_counts(self, mask):
+        """(years, references, publications) per year for the rows in mask"""
+        rows = np.flatnonzero(mask & ~np.isnan(self.years))
+        if not len(rows):
+            return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0, dtype=int)
+        years = self.years[rows].astype(int)
+        first = years.min()
+        references = np.bincount(years - first)
+        # One count per distinct citation (several lines/compounds share a paper)
+        _, unique_rows = np.unique(self.publication_codes[rows], return_index=True)
+        publications = np.bincount(years[unique_rows] - first, minlength=len(references))
+        return np.arange(first, first + len(references)), references, publications
+
+
+class NumericMetadata:
+    """Instrument and specimen metadata as typed float columns for range filtering.
+
+    Float columns are used as they are; text fields are parsed once per dataset
+    (cached with it): the X-ray source becomes a photon energy in eV (Al K-alpha,
+    Mg K-alpha, He I, or the reported X-ray Energy for other sources), 'Use Mono'
+    a 0/1 flag and the specimen temperature its first number in K. Each column
+    gets a SortedIndex on first use, so a range filter is two binary searches.
+    """
+
+    # label -> (unit, format)
+    FIELDS = OrderedDict([
+        ('Energy Uncertainty', ('eV', '%.2f')),
+        ('Overal Energy Resolution (eV)', ('eV', '%.2f')),
+        ('Full Width at Half-maximum Intensity (eV)', ('eV', '%.2f')),
+        ('Gaussian Width (eV)', ('eV', '%.2f')),
+        ('Lorentzian Width (eV)', ('eV', '%.2f')),
+        ('Photon Energy (eV)', ('eV', '%.1f')),
+        ('Monochromated', ('', '%.0f')),
+        ('Specimen Temperature (K)', ('K', '%.0f')),
+    ])
+    CACHE_NAME = 'metadata_v1.parquet'
+    ANODE_ENERGIES = {'al': 1486.6, 'mg': 1253.6, 'he i': 21.22, 'he ii': 40.81}
+    SOURCES = OrderedDict([('Al K-alpha', 1486.6), ('Mg K-alpha', 1253.6), ('He I', 21.22)])
+
+    def __init__(self, table):
+        self.table = table
+        self._indexes = {}
+
+    @staticmethod
+    def _first_number(text):
+        return pd.to_numeric(text.astype('string').str.extract(r'(\d+(?:\.\d+)?)', expand=False),
+                             errors='coerce').astype(float)
+
+    @classmethod
+    def parse(cls, df):
+        """Typed metadata columns for df (same index)"""
+        table = pd.DataFrame(index=df.index)
+        for field in cls.FIELDS:
+            if field in df.columns:
+                table[field] = pd.to_numeric(df[field], errors='coerce').astype(float)
+
+        if 'Excitation Energy' in df.columns:
+            source = df['Excitation Energy'].astype('string').str.strip().str.lower()
+            photon = source.map(cls.ANODE_ENERGIES).astype(float)
+            # A bare number is already an energy; dual-anode entries ('Al/Mg') stay unknown
+            photon = photon.fillna(pd.to_numeric(source, errors='coerce').astype(float))
+            if 'X-ray Energy' in df.columns:
+                other = source.str.startswith('other', na=False) | source.isna()
+                photon = photon.where(~other, cls._first_number(df['X-ray Energy']))
+            table['Photon Energy (eV)'] = photon
+        if 'Use Mono' in df.columns:
+            mono = df['Use Mono'].astype('string').str.strip().str.lower()
+            table['Monochromated'] = mono.map({'yes': 1.0, 'no': 0.0}).astype(float)
+        if 'Specimen Temperature (K)' in df.columns:
+            table['Specimen Temperature (K)'] = cls._first_number(df['Specimen Temperature (K)'])
+        return table[[field for field in cls.FIELDS if field in table.columns]]
+
+    @classmethod
+    def load(cls, df, dataset_cache):
+        """Read the typed columns from the dataset cache, parsing them on a miss"""
+        table = dataset_cache.load_frame(cls.CACHE_NAME)
+        if table is None or not table.index.equals(df.index):
+            table = cls.parse(df)
+            dataset_cache.save_frame(cls.CACHE_NAME, table)
+        return cls(table)
+
+    def index(self, field):
+        if field not in self._indexes:
+            self._indexes[field] = SortedIndex(self.table[field].to_numpy())
+        return self._indexes[field]
+
+    def mask(self, ranges):
+        """Boolean row mask for {field: (lo, hi)} (either bound may be None)"""
+        mask = np.ones(len(self.table), dtype=bool)
+        for field, (lo, hi) in ranges.items():
+            if field in self.table.columns:
+                mask &= self.index(field).mask(lo, hi)
+        return mask
+
+    @staticmethod
+    def describe(ranges):
+        parts = []
+        for field, (lo, hi) in ranges.items():
+            name = re.sub(r'\s*\(.*\)$', '', field)
+            if lo is not None and hi is not None:
+                parts.append(f"{name} {lo:g}-{hi:g}" if lo != hi else f"{name} = {lo:g}")
+            elif lo is not None:
+                parts.append(f"{name} >= {lo:g}")
+            else:
+                parts.append(f"{name} <= {hi:g}")
+        return ", ".join(parts)
+
+
+class FacetIndex:
+    """Packed per-value bitmaps for categorical fields.
+
+    Every value of every facet field has a bitmap (np.packbits, one bit per row).
+    Selecting values ORs their bitmaps within a field and ANDs across fields.
+    Counting the rows per value for the current query is an AND plus
+    np.bitwise_count over all bitmaps at once, with no groupby. A field's counts
+    ignore that field's own selection, so its other values stay visible.
+    """
+
+    def __init__(self, columns):
+        self.size = len(next(iter(columns.values()))) if columns else 0
+        self.values = OrderedDict()
+        self.bitmaps = {}
+        for label, column in columns.items():
+            codes, uniques = pd.factorize(column)
+            totals = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            order = np.argsort(-totals, kind='stable')  # most common values first
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            rows = np.flatnonzero(codes >= 0)
+            one_hot = np.zeros((len(uniques), self.size), dtype=bool)
+            one_hot[rank[codes[rows]], rows] = True
+            self.values[label] = [str(value) for value in uniques[order]]
+            self.bitmaps[label] = np.packbits(one_hot, axis=1)
+
+    def _selected_bits(self, selection):
+        """{field: OR of the selected values' bitmaps} for fields with a selection"""
+        bits = {}
+        for label, chosen in selection.items():
+            positions = [i for i, value in enumerate(self.values.get(label, [])) if value in chosen]
+            if positions:
+                bits[label] = np.bitwise_or.reduce(self.bitmaps[label][positions], axis=0)
+            elif chosen:
+                bits[label] = np.zeros(self.bitmaps[label].shape[1], dtype=np.uint8)
+        return bits
+
+    def mask(self, selection):
+        """Boolean row mask for {field: set of values}"""
+        mask = np.ones(self.size, dtype=bool)
+        for bits in self._selected_bits(selection).values():
+            mask &= np.unpackbits(bits, count=self.size).astype(bool)
+        return mask
+
+    def counts(self, query_mask, selection):
+        """{field: array of row counts per value} for rows in query_mask and the other fields' selections"""
+        query = np.packbits(query_mask)
+        selected = self._selected_bits(selection)
+        counts = {}
+        for label, bitmaps in self.bitmaps.items():
+            bits = query
+            for other, other_bits in selected.items():
+                if other != label:
+                    bits = bits & other_bits
+            counts[label] = np.bitwise_count(bitmaps & bits).sum(axis=1, dtype=np.int64)
+        return counts
+
+
+class SubsetBundle:
+    """Self-describing '.kdbundle' file holding a subset of the database.
+
+    The bundle is a zip with the rows as dictionary-encoded, zstd-compressed parquet,
+    a manifest.json (row count, columns, elements, description, data checksum) and the
+    per-dataset indexes (main lines, line statistics, parsed citations and metadata)
+    computed for the subset. When a bundle is opened the indexes are copied into its
+    dataset cache, so nothing is recomputed on the receiving machine.
+    """
+
+    EXTENSION = '.kdbundle'
+    FORMAT_VERSION = 1
+    DATA_NAME = 'data.parquet'
+    MANIFEST_NAME = 'manifest.json'
+    INDEX_PREFIX = 'indexes/'
+
+    @classmethod
+    def write(cls, path, df, description='', source_hash=None):
+        """Write df (all columns) as a bundle; returns the manifest"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        subset = df.reset_index(drop=True)
+        table = pa.Table.from_pandas(subset, preserve_index=False)
+        string_columns = [field.name for field in table.schema if pa.types.is_string(field.type)]
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, compression='zstd', use_dictionary=string_columns)
+        data = buffer.getvalue()
+
+        stats_buffer = io.BytesIO()
+        LineStatistics.compute(subset).table.to_parquet(stats_buffer)
+        citations_buffer = io.BytesIO()
+        CitationIndex.parse(subset['Journal']).to_parquet(citations_buffer)
+        metadata_buffer = io.BytesIO()
+        NumericMetadata.parse(subset).to_parquet(metadata_buffer)
+        indexes = {
+            MAIN_LINES_CACHE_NAME: json.dumps(compute_main_lines(subset)).encode('utf-8'),
+            LineStatistics.CACHE_NAME: stats_buffer.getvalue(),
+            CitationIndex.CACHE_NAME: citations_buffer.getvalue(),
+            NumericMetadata.CACHE_NAME: metadata_buffer.getvalue(),
+        }
+
+        manifest = {
+            'format': 'KherveDB subset bundle',
+            'version': cls.FORMAT_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'description': description,
+            'source_dataset_hash': source_hash,
+            'rows': len(subset),
+            'columns': [str(column) for column in subset.columns],
+            'elements': sorted(str(element) for element in subset['Element'].dropna().unique()),
+            'data_sha1': hashlib.sha1(data).hexdigest(),
+            'indexes': sorted(indexes),
+        }
+
+        tmp_path = path + '.tmp'
+        try:
+            # Parquet is already compressed; store the members as they are
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_STORED) as bundle:
+                bundle.writestr(cls.MANIFEST_NAME, json.dumps(manifest, indent=2))
+                bundle.writestr(cls.DATA_NAME, data)
+                for name, payload in indexes.items():
+                    bundle.writestr(cls.INDEX_PREFIX + name, payload)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return manifest
+
+    @classmethod
+    def read(cls, path, dataset_cache):
+        """Return (DataFrame, manifest), seeding dataset_cache with the bundled indexes"""
+        with zipfile.ZipFile(path) as bundle:
+            manifest = json.loads(bundle.read(cls.MANIFEST_NAME))
+            if manifest.get('version', 0) > cls.FORMAT_VERSION:
+                raise ValueError(f"{os.path.basename(path)} needs a newer KherveDB (bundle version "
+                                 f"{manifest.get('version')})")
+            data = bundle.read(cls.DATA_NAME)
+            if hashlib.sha1(data).hexdigest() != manifest.get('data_sha1'):
+                raise ValueError(f"{os.path.basename(path)} is corrupted (checksum mismatch)")
+            df = pd.read_parquet(io.BytesIO(data))
+
+            for name in manifest.get('indexes', []):
+                if os.path.exists(dataset_cache.path(name)):
+                    continue
+                payload = bundle.read(cls.INDEX_PREFIX + name)
+                if name.endswith('.json'):
+                    dataset_cache.save_json(name, json.loads(payload))
+                else:
+                    try:
+                        with open(dataset_cache.path(name), 'wb') as f:
+                            f.write(payload)
+                    except OSError as e:
+                        print(f"Could not write cache {name}: {e}")
+        return df, manifest
+
+
+class ElementSummary:
+    """Per-element aggregates behind the periodic table heat map.
+
+    Reference counts and distinct lines come from one groupby over Element, the
+    main-line BE spread (IQR) from LineStatistics; search match counts are a
+    bincount of the precomputed element codes under a row mask.
+    """
+
+    METRICS = [('off', "Off (Element Categories)"),
+               ('references', "Reference Count"),
+               ('lines', "Distinct Lines"),
+               ('spread', "Main-Line BE Spread (IQR)"),
+               ('matches', "Search Matches")]
+    LOG_SCALED = {'references', 'matches'}
+    TOP_FORMULAS = 5
+    TOOLTIP_LINES = 8
+
+    def __init__(self, df, line_stats, main_lines):
+        codes, symbols = pd.factorize(df['Element'])
+        self.codes = codes
+        self.symbols = [str(symbol) for symbol in symbols]
+
+        per_element = df.groupby('Element')['Line'].agg(['size', 'nunique'])
+        main_keys = pd.MultiIndex.from_tuples([(element, line[0]) for element, line in main_lines.items()],
+                                              names=['Element', 'Line'])
+        main_stats = line_stats.table.reindex(main_keys)
+        spread = pd.Series((main_stats['q75'] - main_stats['q25']).to_numpy(),
+                           index=main_keys.get_level_values('Element'))
+
+        self.metrics = {'references': per_element['size'],
+                        'lines': per_element['nunique'],
+                        'spread': spread}
+
+        # Plain-Python lookups for the tile tooltips (no DataFrame access on hover)
+        self.main_lines = main_lines
+        self.line_counts = {}
+        for (element, line), count in df.groupby(['Element', 'Line']).size().sort_values(ascending=False).items():
+            self.line_counts.setdefault(element, []).append((line, int(count)))
+        self.top_formulas = {}
+        formula_counts = df.groupby(['Element', 'Formula']).size().sort_values(ascending=False)
+        for (element, formula), count in formula_counts.groupby(level='Element').head(self.TOP_FORMULAS).items():
+            self.top_formulas.setdefault(element, []).append((formula, int(count)))
+        self._tooltips = {}
+
+    def metric(self, name, mask=None):
+        """Series of metric values indexed by element ('matches' needs the current search mask)"""
+        if name == 'matches':
+            codes = self.codes[mask.to_numpy()] if mask is not None else self.codes
+            counts = np.bincount(codes[codes >= 0], minlength=len(self.symbols))
+            return pd.Series(counts, index=self.symbols)
+        return self.metrics[name]
+
+    def tooltip(self, element):
+        """Summary text for an element tile, built on first request and memoized"""
+        text = self._tooltips.get(element)
+        if text is None:
+            text = self._tooltips[element] = self._build_tooltip(element)
+        return text
+
+    def _build_tooltip(self, element):
+        record = get_element_record(element)
+        header = f"{element} - {record.properties.get('Name', element)} (Z={record.atomic_number})"
+        line_counts = self.line_counts.get(element)
+        if not line_counts:
+            return f"{header}\nNo references in the database"
+
+        total = sum(count for _, count in line_counts)
+        parts = [header, f"{total} references, {len(line_counts)} lines"]
+
+        main_line = self.main_lines.get(element)
+        if main_line and main_line[1] is not None:
+            parts.append(f"Main line {main_line[0]}: median {main_line[1]:.2f} eV ({main_line[2]} refs)")
+
+        shown = ", ".join(f"{line} ({count})" for line, count in line_counts[:self.TOOLTIP_LINES])
+        if len(line_counts) > self.TOOLTIP_LINES:
+            shown += ", ..."
+        parts.append(f"Lines: {shown}")
+
+        formulas = self.top_formulas.get(element)
+        if formulas:
+            parts.append("Top formulas: " + ", ".join(f"{formula} ({count})" for formula, count in formulas))
+        return "\n".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Element registry: static per-element data, built once at import
+# ---------------------------------------------------------------------------
+
+_ATOMIC_NUMBERS = {
+    'H': 1, 'He': 2, 'Li': 3, 'Be': 4, 'B': 5, 'C': 6, 'N': 7, 'O': 8, 'F': 9, 'Ne': 10,
+    'Na': 11, 'Mg': 12, 'Al': 13, 'Si': 14, 'P': 15, 'S': 16, 'Cl': 17, 'Ar': 18,
+    'K': 19, 'Ca': 20, 'Sc': 21, 'Ti': 22, 'V': 23, 'Cr': 24, 'Mn': 25, 'Fe': 26,
+    'Co': 27, 'Ni': 28, 'Cu': 29, 'Zn': 30, 'Ga': 31, 'Ge': 32, 'As': 33, 'Se': 34,
+    'Br': 35, 'Kr': 36, 'Rb': 37, 'Sr': 38, 'Y': 39, 'Zr': 40, 'Nb': 41, 'Mo': 42,
+    'Tc': 43, 'Ru': 44, 'Rh': 45, 'Pd': 46, 'Ag': 47, 'Cd': 48, 'In': 49, 'Sn': 50,
+    'Sb': 51, 'Te': 52, 'I': 53, 'Xe': 54, 'Cs': 55, 'Ba': 56, 'La': 57, 'Ce': 58,
+    'Pr': 59, 'Nd': 60, 'Pm': 61, 'Sm': 62, 'Eu': 63, 'Gd': 64, 'Tb': 65, 'Dy': 66,
+    'Ho': 67, 'Er': 68, 'Tm': 69, 'Yb': 70, 'Lu': 71, 'Hf': 72, 'Ta': 73, 'W': 74,
+    'Re': 75, 'Os': 76, 'Ir': 77, 'Pt': 78, 'Au': 79, 'Hg': 80, 'Tl': 81, 'Pb': 82,
+    'Bi': 83, 'Po': 84, 'At': 85, 'Rn': 86, 'Fr': 87, 'Ra': 88, 'Ac': 89, 'Th': 90,
+    'Pa': 91, 'U': 92, 'Np': 93, 'Pu': 94, 'Am': 95, 'Cm': 96, 'Bk': 97, 'Cf': 98,
+    'Es': 99, 'Fm': 100, 'Md': 101, 'No': 102, 'Lr': 103, 'Rf': 104, 'Db': 105,
+    'Sg': 106, 'Bh': 107, 'Hs': 108, 'Mt': 109, 'Ds': 110, 'Rg': 111, 'Cn': 112,
+    'Nh': 113, 'Fl': 114, 'Mc': 115, 'Lv': 116, 'Ts': 117, 'Og': 118
+}
+
+# Main XPS core level and its binding energy (eV) used on the periodic table tiles
+_MAIN_CORE_LEVELS = {
+    'H': 'N.D.', 'He': 'N.D.', 'Li': '1s', 'Be': '1s', 'B': '1s', 'C': '1s', 'N': '1s', 'O': '1s', 'F': '1s',
+    'Ne': '1s',
+    'Na': '1s', 'Mg': '2p', 'Al': '2p', 'Si': '2p', 'P': '2p3/2', 'S': '2p3/2', 'Cl': '2p3/2', 'Ar': '2p3/2',
+    'K': '2p3/2', 'Ca': '2p3/2', 'Sc': '2p3/2', 'Ti': '2p3/2', 'V': '2p3/2', 'Cr': '2p3/2', 'Mn': '2p3/2',
+    'Fe': '2p3/2',
+    'Co': '2p3/2', 'Ni': '2p3/2', 'Cu': '2p3/2', 'Zn': '2p3/2', 'Ga': '2p3/2', 'Ge': '3d', 'As': '3d5/2',
+    'Se': '3d5/2',
+    'Br': '3d5/2', 'Kr': '3d5/2', 'Rb': '3d5/2', 'Sr': '3d5/2', 'Y': '3d5/2', 'Zr': '3d5/2', 'Nb': '3d5/2',
+    'Mo': '3d5/2',
+    'Tc': '3d5/2', 'Ru': '3d5/2', 'Rh': '3d5/2', 'Pd': '3d5/2', 'Ag': '3d5/2', 'Cd': '3d5/2', 'In': '3d5/2',
+    'Sn': '3d5/2',
+    'Sb': '3d5/2', 'Te': '3d5/2', 'I': '3d5/2', 'Xe': '3d5/2', 'Cs': '3d5/2', 'Ba': '3d5/2', 'La': '3d5/2',
+    'Ce': '3d5/2',
+    'Pr': '3d5/2', 'Nd': '3d5/2', 'Pm': '3d5/2', 'Sm': '3d5/2', 'Eu': '3d5/2', 'Gd': '4d', 'Tb': '4d',
+    'Dy': '4d',
+    'Ho': '4d', 'Er': '4d', 'Tm': '4d', 'Yb': '4d', 'Lu': '4f7/2', 'Hf': '4f7/2', 'Ta': '4f7/2', 'W': '4f7/2',
+    'Re': '4f7/2', 'Os': '4f7/2', 'Ir': '4f7/2', 'Pt': '4f7/2', 'Au': '4f7/2', 'Hg': '4f7/2', 'Tl': '4f7/2',
+    'Pb': '4f7/2',
+    'Bi': '4f7/2', 'Po': '4f7/2', 'At': '4f7/2', 'Rn': '4f7/2', 'Fr': '4f7/2', 'Ra': '4f7/2', 'Ac': '4f7/2',
+    'Th': '4f7/2',
+    'Pa': '4f7/2', 'U': '4f7/2', 'Np': '4f7/2', 'Pu': '4f7/2', 'Am': '4f7/2', 'Cm': '4f7/2', 'Bk': '4f7/2',
+    'Cf': '4f7/2',
+    'Es': '4f7/2', 'Fm': '4f7/2', 'Md': '4f7/2', 'No': '4f7/2', 'Lr': '4f7/2'
+}
+
+_MAIN_CORE_BINDING_ENERGIES = {
+    'H': 'N.D.', 'He': 'N.D.', 'Li': '56', 'Be': '112', 'B': '189', 'C': '285', 'N': '398', 'O': '531',
+    'F': '685', 'Ne': '863',
+    'Na': '1072', 'Mg': '50', 'Al': '73', 'Si': '99', 'P': '130', 'S': '164', 'Cl': '199', 'Ar': '242',
+    'K': '294', 'Ca': '347', 'Sc': '399', 'Ti': '454', 'V': '512', 'Cr': '574', 'Mn': '639', 'Fe': '707',
+    'Co': '778', 'Ni': '853', 'Cu': '933', 'Zn': '1022', 'Ga': '1117', 'Ge': '29', 'As': '42', 'Se': '57',
+    'Br': '69', 'Kr': '87', 'Rb': '111', 'Sr': '134', 'Y': '158', 'Zr': '179', 'Nb': '202', 'Mo': '228',
+    'Tc': 'N.D.', 'Ru': '280', 'Rh': '307', 'Pd': '335', 'Ag': '368', 'Cd': '405', 'In': '444', 'Sn': '485',
+    'Sb': '528', 'Te': '573', 'I': '619', 'Xe': '670', 'Cs': '726', 'Ba': '781', 'La': '836', 'Ce': '884',
+    'Pr': '932', 'Nd': '981', 'Pm': '1033', 'Sm': '1081', 'Eu': '1126', 'Gd': '140', 'Tb': '146', 'Dy': '152',
+    'Ho': '160', 'Er': '167', 'Tm': '175', 'Yb': '182', 'Lu': '7', 'Hf': '14', 'Ta': '22', 'W': '31',
+    'Re': '40', 'Os': '51', 'Ir': '61', 'Pt': '71', 'Au': '84', 'Hg': '101', 'Tl': '118', 'Pb': '137',
+    'Bi': '157', 'Po': 'N.D.', 'At': 'N.D.', 'Rn': 'N.D.', 'Fr': 'N.D.', 'Ra': 'N.D.', 'Ac': '307', 'Th': '333',
+    'Pa': '358', 'U': '377', 'Np': '403', 'Pu': '425', 'Am': '448', 'Cm': '472', 'Bk': '499', 'Cf': '523',
+    'Es': '550', 'Fm': 'N.D.', 'Md': 'N.D.', 'No': 'N.D.', 'Lr': 'N.D.'
+}
+
+_LANTHANIDES = ['La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
+_ACTINIDES = ['Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr']
+
+# Categories used for tile colours
+_ELEMENT_CATEGORIES = {
+    'H': 'nonmetal', 'He': 'noble_gas',
+    'Li': 'alkali_metal', 'Be': 'alkaline_earth',
+    'B': 'metalloid', 'C': 'nonmetal', 'N': 'nonmetal', 'O': 'nonmetal',
+    'F': 'halogen', 'Ne': 'noble_gas',
+    'Na': 'alkali_metal', 'Mg': 'alkaline_earth',
+    'Al': 'post_transition', 'Si': 'metalloid', 'P': 'nonmetal',
+    'S': 'nonmetal', 'Cl': 'halogen', 'Ar': 'noble_gas',
+    'K': 'alkali_metal', 'Ca': 'alkaline_earth',
+    'Sc': 'transition_metal', 'Ti': 'transition_metal', 'V': 'transition_metal',
+    'Cr': 'transition_metal', 'Mn': 'transition_metal', 'Fe': 'transition_metal',
+    'Co': 'transition_metal', 'Ni': 'transition_metal', 'Cu': 'transition_metal',
+    'Zn': 'transition_metal', 'Ga': 'post_transition', 'Ge': 'metalloid',
+    'As': 'metalloid', 'Se': 'nonmetal', 'Br': 'halogen', 'Kr': 'noble_gas',
+    'Rb': 'alkali_metal', 'Sr': 'alkaline_earth',
+    'Y': 'transition_metal', 'Zr': 'transition_metal', 'Nb': 'transition_metal',
+    'Mo': 'transition_metal', 'Tc': 'transition_metal', 'Ru': 'transition_metal',
+    'Rh': 'transition_metal', 'Pd': 'transition_metal', 'Ag': 'transition_metal',
+    'Cd': 'transition_metal', 'In': 'post_transition', 'Sn': 'post_transition',
+    'Sb': 'metalloid', 'Te': 'metalloid', 'I': 'halogen', 'Xe': 'noble_gas',
+    'Cs': 'alkali_metal', 'Ba': 'alkaline_earth',
+    'Hf': 'transition_metal', 'Ta': 'transition_metal', 'W': 'transition_metal',
+    'Re': 'transition_metal', 'Os': 'transition_metal', 'Ir': 'transition_metal',
+    'Pt': 'transition_metal', 'Au': 'transition_metal', 'Hg': 'transition_metal',
+    'Tl': 'post_transition', 'Pb': 'post_transition', 'Bi': 'post_transition',
+    'Po': 'metalloid', 'At': 'halogen', 'Rn': 'noble_gas',
+    'Fr': 'alkali_metal', 'Ra': 'alkaline_earth',
+    'Rf': 'transition_metal', 'Db': 'transition_metal', 'Sg': 'transition_metal',
+    'Bh': 'transition_metal', 'Hs': 'transition_metal', 'Mt': 'transition_metal',
+    'Ds': 'transition_metal', 'Rg': 'transition_metal', 'Cn': 'transition_metal',
+    'Nh': 'post_transition', 'Fl': 'post_transition', 'Mc': 'post_transition',
+    'Lv': 'post_transition', 'Ts': 'post_transition', 'Og': 'noble_gas'
+}
+_ELEMENT_CATEGORIES.update({element: 'lanthanide' for element in _LANTHANIDES})
+_ELEMENT_CATEGORIES.update({element: 'actinide' for element in _ACTINIDES})
+
+# Element names as used in the xpsfitting.com labels
+_XPS_FITTING_NAMES = {
+    'H': 'Hydrogen', 'He': 'Helium', 'Li': 'Lithium', 'Be': 'Beryllium', 'B': 'Boron',
+    'C': 'carbon', 'N': 'Nitrogen', 'O': 'Oxygen', 'F': 'Fluorine', 'Ne': 'Neon',
+    'Na': 'Sodium', 'Mg': 'Magnesium', 'Al': 'Aluminum', 'Si': 'Silicon', 'P': 'Phosphorus',
+    'S': 'Sulphur', 'Cl': 'Chlorine', 'Ar': 'Argon', 'K': 'Potassium', 'Ca': 'Calcium',
+    'Sc': 'Scandium', 'Ti': 'Titanium', 'V': 'Vanadium', 'Cr': 'Chromium', 'Mn': 'Manganese',
+    'Fe': 'Iron', 'Co': 'Cobalt', 'Ni': 'Nickel', 'Cu': 'Copper', 'Zn': 'Zinc',
+    'Ga': 'Gallium', 'Ge': 'Germanium', 'As': 'Arsenic', 'Se': 'Selenium', 'Br': 'Bromine',
+    'Kr': 'Krypton', 'Rb': 'Rubidium', 'Sr': 'Strontium', 'Y': 'Yttrium', 'Zr': 'Zirconium',
+    'Nb': 'Niobium', 'Mo': 'Molybdenum', 'Tc': 'Technetium', 'Ru': 'Ruthenium', 'Rh': 'Rhodium',
+    'Pd': 'Palladium', 'Ag': 'Silver', 'Cd': 'Cadmium', 'In': 'Indium', 'Sn': 'Tin',
+    'Sb': 'Antimony', 'Te': 'Tellurium', 'I': 'Iodine', 'Xe': 'Xenon', 'Cs': 'Caesium',
+    'Ba': 'Barium', 'La': 'Lanthanum', 'Ce': 'Cerium', 'Pr': 'Praseodymium', 'Nd': 'Neodymium',
+    'Pm': 'Promethium', 'Sm': 'Samarium', 'Eu': 'Europium', 'Gd': 'Gadolinium', 'Tb': 'Terbium',
+    'Dy': 'Dysprosium', 'Ho': 'Holmium', 'Er': 'Erbium', 'Tm': 'Thulium', 'Yb': 'Ytterbium',
+    'Lu': 'Lutetium', 'Hf': 'Hafnium', 'Ta': 'Tantalum', 'W': 'Tungsten', 'Re': 'Rhenium',
+    'Os': 'Osmium', 'Ir': 'Iridium', 'Pt': 'Platinum', 'Au': 'Gold', 'Hg': 'Mercury',
+    'Tl': 'Thallium', 'Pb': 'Lead', 'Bi': 'Bismuth', 'Po': 'Polonium', 'At': 'Astatine',
+    'Rn': 'Radon', 'Fr': 'Francium', 'Ra': 'Radium', 'Ac': 'Actinium', 'Th': 'Thorium',
+    'Pa': 'Protactinium', 'U': 'Uranium', 'Np': 'Neptunium', 'Pu': 'Plutonium', 'Am': 'Americium',
+    'Cm': 'Curium', 'Bk': 'Berkelium', 'Cf': 'Californium', 'Es': 'Einsteinium', 'Fm': 'Fermium',
+    'Md': 'Mendelevium', 'No': 'Nobelium', 'Lr': 'Lawrencium'
+}
+
+# Category paths for Thermo Fisher periodic table URLs
+_THERMO_PATHS = {
+    'H': 'non-metal/hydrogen', 'He': 'noble-gas/helium', 'Li': 'alkali-metal/lithium',
+    'Be': 'alkaline-earth-metal/beryllium', 'B': 'metalloid/boron', 'C': 'non-metal/carbon',
+    'N': 'non-metal/nitrogen', 'O': 'non-metal/oxygen', 'F': 'halogen/fluorine',
+    'Ne': 'noble-gas/neon', 'Na': 'alkali-metal/sodium', 'Mg': 'alkaline-earth-metal/magnesium',
+    'Al': 'other-metal/aluminium', 'Si': 'metalloid/silicon', 'P': 'non-metal/phosphorus',
+    'S': 'non-metal/sulfur', 'Cl': 'halogen/chlorine', 'Ar': 'noble-gas/argon',
+    'K': 'alkali-metal/potassium', 'Ca': 'alkaline-earth-metal/calcium',
+    'Sc': 'transition-metal/scandium', 'Ti': 'transition-metal/titanium',
+    'V': 'transition-metal/vanadium', 'Cr': 'transition-metal/chromium',
+    'Mn': 'transition-metal/manganese', 'Fe': 'transition-metal/iron',
+    'Co': 'transition-metal/cobalt', 'Ni': 'transition-metal/nickel',
+    'Cu': 'transition-metal/copper', 'Zn': 'transition-metal/zinc',
+    'Ga': 'other-metal/gallium', 'Ge': 'metalloid/germanium',
+    'As': 'metalloid/arsenic', 'Se': 'non-metal/selenium', 'Br': 'halogen/bromine',
+    'Kr': 'noble-gas/krypton', 'Rb': 'alkali-metal/rubidium',
+    'Sr': 'alkaline-earth-metal/strontium', 'Y': 'transition-metal/yttrium',
+    'Zr': 'transition-metal/zirconium', 'Nb': 'transition-metal/niobium',
+    'Mo': 'transition-metal/molybdenum', 'Tc': 'transition-metal/technetium',
+    'Ru': 'transition-metal/ruthenium', 'Rh': 'transition-metal/rhodium',
+    'Pd': 'transition-metal/palladium', 'Ag': 'transition-metal/silver',
+    'Cd': 'transition-metal/cadmium', 'In': 'other-metal/indium',
+    'Sn': 'other-metal/tin', 'Sb': 'metalloid/antimony',
+    'Te': 'metalloid/tellurium', 'I': 'halogen/iodine', 'Xe': 'noble-gas/xenon',
+    'Cs': 'alkali-metal/cesium', 'Ba': 'alkaline-earth-metal/barium',
+    'La': 'lanthanide-rare-earth/lanthanum', 'Ce': 'lanthanide-rare-earth/cerium', 'Pr': 'lanthanide-rare-earth/praseodymium',
+    'Nd': 'lanthanide-rare-earth/neodymium', 'Pm': 'lanthanide-rare-earth/promethium', 'Sm': 'lanthanide-rare-earth/samarium',
+    'Eu': 'lanthanide-rare-earth/europium', 'Gd': 'lanthanide-rare-earth/gadolinium', 'Tb': 'lanthanide-rare-earth/terbium',
+    'Dy': 'lanthanide-rare-earth/dysprosium', 'Ho': 'lanthanide-rare-earth/holmium', 'Er': 'lanthanide-rare-earth/erbium',
+    'Tm': 'lanthanide-rare-earth/thulium', 'Yb': 'lanthanide-rare-earth/ytterbium', 'Lu': 'lanthanide-rare-earth/lutetium',
+    'Hf': 'transition-metal/hafnium', 'Ta': 'transition-metal/tantalum',
+    'W': 'transition-metal/tungsten', 'Re': 'transition-metal/rhenium',
+    'Os': 'transition-metal/osmium', 'Ir': 'transition-metal/iridium',
+    'Pt': 'transition-metal/platinum', 'Au': 'transition-metal/gold',
+    'Hg': 'transition-metal/mercury', 'Tl': 'other-metal/thallium',
+    'Pb': 'other-metal/lead', 'Bi': 'other-metal/bismuth',
+    'Po': 'metalloid/polonium', 'At': 'halogen/astatine', 'Rn': 'noble-gas/radon',
+    'Fr': 'alkali-metal/francium', 'Ra': 'alkaline-earth-metal/radium',
+    'Ac': 'actinide/actinium', 'Th': 'actinide/thorium', 'Pa': 'actinide/protactinium',
+    'U': 'actinide/uranium', 'Np': 'actinide/neptunium', 'Pu': 'actinide/plutonium',
+    'Am': 'actinide/americium', 'Cm': 'actinide/curium', 'Bk': 'actinide/berkelium',
+    'Cf': 'actinide/californium', 'Es': 'actinide/einsteinium', 'Fm': 'actinide/fermium',
+    'Md': 'actinide/mendelevium', 'No': 'actinide/nobelium', 'Lr': 'actinide/lawrencium'
+}
+
+# Lowercase element names used by Harwell XPS Guru
+_HARWELL_NAMES = {
+    'H': 'hydrogen', 'He': 'helium', 'Li': 'lithium', 'Be': 'beryllium', 'B': 'boron',
+    'C': 'carbon', 'N': 'nitrogen', 'O': 'oxygen', 'F': 'fluorine', 'Ne': 'neon',
+    'Na': 'sodium', 'Mg': 'magnesium', 'Al': 'aluminium', 'Si': 'silicon', 'P': 'phosphorus',
+    'S': 'sulfur', 'Cl': 'chlorine', 'Ar': 'argon', 'K': 'potassium', 'Ca': 'calcium',
+    'Sc': 'scandium', 'Ti': 'titanium', 'V': 'vanadium', 'Cr': 'chromium', 'Mn': 'manganese',
+    'Fe': 'iron', 'Co': 'cobalt', 'Ni': 'nickel', 'Cu': 'copper', 'Zn': 'zinc',
+    'Ga': 'gallium', 'Ge': 'germanium', 'As': 'arsenic', 'Se': 'selenium', 'Br': 'bromine',
+    'Kr': 'krypton', 'Rb': 'rubidium', 'Sr': 'strontium', 'Y': 'yttrium', 'Zr': 'zirconium',
+    'Nb': 'niobium', 'Mo': 'molybdenum', 'Tc': 'technetium', 'Ru': 'ruthenium', 'Rh': 'rhodium',
+    'Pd': 'palladium', 'Ag': 'silver', 'Cd': 'cadmium', 'In': 'indium', 'Sn': 'tin',
+    'Sb': 'antimony', 'Te': 'tellurium', 'I': 'iodine', 'Xe': 'xenon', 'Cs': 'caesium',
+    'Ba': 'barium', 'La': 'lanthanum', 'Ce': 'cerium', 'Pr': 'praseodymium', 'Nd': 'neodymium',
+    'Pm': 'promethium', 'Sm': 'samarium', 'Eu': 'europium', 'Gd': 'gadolinium', 'Tb': 'terbium',
+    'Dy': 'dysprosium', 'Ho': 'holmium', 'Er': 'erbium', 'Tm': 'thulium', 'Yb': 'ytterbium',
+    'Lu': 'lutetium', 'Hf': 'hafnium', 'Ta': 'tantalum', 'W': 'tungsten', 'Re': 'rhenium',
+    'Os': 'osmium', 'Ir': 'iridium', 'Pt': 'platinum', 'Au': 'gold', 'Hg': 'mercury',
+    'Tl': 'thallium', 'Pb': 'lead', 'Bi': 'bismuth', 'Po': 'polonium', 'At': 'astatine',
+    'Rn': 'radon', 'Fr': 'francium', 'Ra': 'radium', 'Ac': 'actinium', 'Th': 'thorium',
+    'Pa': 'protactinium', 'U': 'uranium', 'Np': 'neptunium', 'Pu': 'plutonium', 'Am': 'americium',
+    'Cm': 'curium', 'Bk': 'berkelium', 'Cf': 'californium', 'Es': 'einsteinium', 'Fm': 'fermium',
+    'Md': 'mendelevium', 'No': 'nobelium', 'Lr': 'lawrencium'
+}
+
+# Comprehensive database of element properties based on reference tables
+_ELEMENT_PROPERTIES = {
+    "H": {
+        "Name": "Hydrogen",
+        "Atomic Number": 1,
+        "Atomic Mass": "1.00794 u",
+        "Density": "0.0708 g/cm³",
+        "Melting Point": "-259.34 °C",
+        "Boiling Point": "-252.87 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 2.20,
+        "Atomic Radius": "53 pm",
+        "Ionization Energy": "13.598 eV",
+        "Specific Heat": "14.304 J/(g·K)",
+        "Group": 1,
+        "Period": 1,
+        "Category": "Nonmetal",
+        "Common Core Levels": "1s",
+        "Most Intense Line": "1s",
+        "Typical FWHM": "0.9-1.2 eV",
+        "Chemical Shift Range": "0-3 eV"
+    },
+    "He": {
+        "Name": "Helium",
+        "Atomic Number": 2,
+        "Atomic Mass": "4.002602 u",
+        "Density": "0.122 g/cm³",
+        "Melting Point": "— °C",
+        "Boiling Point": "-268.93 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": "N/A",
+        "Atomic Radius": "31 pm",
+        "Ionization Energy": "24.587 eV",
+        "Specific Heat": "5.193 J/(g·K)",
+        "Group": 18,
+        "Period": 1,
+        "Category": "Noble Gas"
+    },
+    "Li": {
+        "Name": "Lithium",
+        "Atomic Number": 3,
+        "Atomic Mass": "6.941 u",
+        "Density": "0.534 g/cm³",
+        "Melting Point": "180.50 °C",
+        "Boiling Point": "1342 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "1s² 2s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.98,
+        "Atomic Radius": "167 pm",
+        "Ionization Energy": "5.392 eV",
+        "Specific Heat": "3.582 J/(g·K)",
+        "Group": 1,
+        "Period": 2,
+        "Category": "Alkali Metal"
+    },
+    "Be": {
+        "Name": "Beryllium",
+        "Atomic Number": 4,
+        "Atomic Mass": "9.012182 u",
+        "Density": "1.848 g/cm³",
+        "Melting Point": "1287 °C",
+        "Boiling Point": "2471 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "1s² 2s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.57,
+        "Atomic Radius": "112 pm",
+        "Ionization Energy": "9.323 eV",
+        "Specific Heat": "1.825 J/(g·K)",
+        "Group": 2,
+        "Period": 2,
+        "Category": "Alkaline Earth Metal"
+    },
+    "B": {
+        "Name": "Boron",
+        "Atomic Number": 5,
+        "Atomic Mass": "10.811 u",
+        "Density": "2.34 g/cm³",
+        "Melting Point": "2075 °C",
+        "Boiling Point": "4000 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "1s² 2s² 2p¹",
+        "Ground State": "²P°₁/₂",
+        "Electronegativity": 2.04,
+        "Atomic Radius": "87 pm",
+        "Ionization Energy": "8.298 eV",
+        "Specific Heat": "1.026 J/(g·K)",
+        "Group": 13,
+        "Period": 2,
+        "Category": "Metalloid"
+    },
+    "C": {
+        "Name": "Carbon",
+        "Atomic Number": 6,
+        "Atomic Mass": "12.0107 u",
+        "Density": "1.9-2.3 (graphite) g/cm³",
+        "Melting Point": "4492 (10.3 MPa) °C",
+        "Boiling Point": "3825ᵇ °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "1s² 2s² 2p²",
+        "Ground State": "³P₀",
+        "Electronegativity": 2.55,
+        "Atomic Radius": "67 pm",
+        "Ionization Energy": "11.260 eV",
+        "Specific Heat": "0.709 J/(g·K)",
+        "Group": 14,
+        "Period": 2,
+        "Category": "Nonmetal",
+        "Common Core Levels": "1s, 2s, 2p",
+        "Most Intense Line": "1s",
+        "Typical FWHM": "0.8-1.2 eV",
+        "Chemical Shift Range": "0-10 eV"
+    },
+    "N": {
+        "Name": "Nitrogen",
+        "Atomic Number": 7,
+        "Atomic Mass": "14.00674 u",
+        "Density": "0.808 g/cm³",
+        "Melting Point": "-210.00 °C",
+        "Boiling Point": "-195.79 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s² 2s² 2p³",
+        "Ground State": "⁴S°₃/₂",
+        "Electronegativity": 3.04,
+        "Atomic Radius": "56 pm",
+        "Ionization Energy": "14.534 eV",
+        "Specific Heat": "1.040 J/(g·K)",
+        "Group": 15,
+        "Period": 2,
+        "Category": "Nonmetal"
+    },
+    "O": {
+        "Name": "Oxygen",
+        "Atomic Number": 8,
+        "Atomic Mass": "15.9994 u",
+        "Density": "1.14 g/cm³",
+        "Melting Point": "-218.79 °C",
+        "Boiling Point": "-182.95 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s² 2s² 2p⁴",
+        "Ground State": "³P₂",
+        "Electronegativity": 3.44,
+        "Atomic Radius": "48 pm",
+        "Ionization Energy": "13.618 eV",
+        "Specific Heat": "0.918 J/(g·K)",
+        "Group": 16,
+        "Period": 2,
+        "Category": "Nonmetal",
+        "Common Core Levels": "1s, 2s, 2p",
+        "Most Intense Line": "1s",
+        "Typical FWHM": "0.9-1.3 eV",
+        "Chemical Shift Range": "0-8 eV"
+    },
+    "F": {
+        "Name": "Fluorine",
+        "Atomic Number": 9,
+        "Atomic Mass": "18.9984032 u",
+        "Density": "1.50 g/cm³",
+        "Melting Point": "-219.62 °C",
+        "Boiling Point": "-188.12 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s² 2s² 2p⁵",
+        "Ground State": "²P°₃/₂",
+        "Electronegativity": 3.98,
+        "Atomic Radius": "42 pm",
+        "Ionization Energy": "17.423 eV",
+        "Specific Heat": "0.824 J/(g·K)",
+        "Group": 17,
+        "Period": 2,
+        "Category": "Halogen"
+    },
+    "Ne": {
+        "Name": "Neon",
+        "Atomic Number": 10,
+        "Atomic Mass": "20.1797 u",
+        "Density": "1.207 g/cm³",
+        "Melting Point": "-248.59 °C",
+        "Boiling Point": "-246.08 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "1s² 2s² 2p⁶",
+        "Ground State": "¹S₀",
+        "Electronegativity": "N/A",
+        "Atomic Radius": "38 pm",
+        "Ionization Energy": "21.565 eV",
+        "Specific Heat": "1.030 J/(g·K)",
+        "Group": 18,
+        "Period": 2,
+        "Category": "Noble Gas"
+    },
+    "Na": {
+        "Name": "Sodium",
+        "Atomic Number": 11,
+        "Atomic Mass": "22.989770 u",
+        "Density": "0.971 g/cm³",
+        "Melting Point": "97.80 °C",
+        "Boiling Point": "883 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.93,
+        "Atomic Radius": "190 pm",
+        "Ionization Energy": "5.139 eV",
+        "Specific Heat": "1.228 J/(g·K)",
+        "Group": 1,
+        "Period": 3,
+        "Category": "Alkali Metal"
+    },
+    "Mg": {
+        "Name": "Magnesium",
+        "Atomic Number": 12,
+        "Atomic Mass": "24.3050 u",
+        "Density": "1.738 g/cm³",
+        "Melting Point": "650 °C",
+        "Boiling Point": "1090 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.31,
+        "Atomic Radius": "145 pm",
+        "Ionization Energy": "7.646 eV",
+        "Specific Heat": "1.023 J/(g·K)",
+        "Group": 2,
+        "Period": 3,
+        "Category": "Alkaline Earth Metal"
+    },
+    "Al": {
+        "Name": "Aluminum",
+        "Atomic Number": 13,
+        "Atomic Mass": "26.981538 u",
+        "Density": "2.6989 g/cm³",
+        "Melting Point": "660.32 °C",
+        "Boiling Point": "2519 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s² 3p¹",
+        "Ground State": "²P°₁/₂",
+        "Electronegativity": 1.61,
+        "Atomic Radius": "118 pm",
+        "Ionization Energy": "5.986 eV",
+        "Specific Heat": "0.897 J/(g·K)",
+        "Group": 13,
+        "Period": 3,
+        "Category": "Post-Transition Metal"
+    },
+    "Si": {
+        "Name": "Silicon",
+        "Atomic Number": 14,
+        "Atomic Mass": "28.0855 u",
+        "Density": "2.3325 g/cm³",
+        "Melting Point": "1414 °C",
+        "Boiling Point": "3265 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s² 3p²",
+        "Ground State": "³P₀",
+        "Electronegativity": 1.90,
+        "Atomic Radius": "111 pm",
+        "Ionization Energy": "8.152 eV",
+        "Specific Heat": "0.705 J/(g·K)",
+        "Group": 14,
+        "Period": 3,
+        "Category": "Metalloid"
+    },
+    "P": {
+        "Name": "Phosphorus",
+        "Atomic Number": 15,
+        "Atomic Mass": "30.973761 u",
+        "Density": "1.82 g/cm³",
+        "Melting Point": "44.15 °C",
+        "Boiling Point": "280.5 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s² 3p³",
+        "Ground State": "⁴S°₃/₂",
+        "Electronegativity": 2.19,
+        "Atomic Radius": "98 pm",
+        "Ionization Energy": "10.487 eV",
+        "Specific Heat": "0.769 J/(g·K)",
+        "Group": 15,
+        "Period": 3,
+        "Category": "Nonmetal"
+    },
+    "S": {
+        "Name": "Sulphur",
+        "Atomic Number": 16,
+        "Atomic Mass": "32.066 u",
+        "Density": "2.07 g/cm³",
+        "Melting Point": "119.6 °C",
+        "Boiling Point": "444.60 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ne] 3s² 3p⁴",
+        "Ground State": "³P₂",
+        "Electronegativity": 2.58,
+        "Atomic Radius": "88 pm",
+        "Ionization Energy": "10.360 eV",
+        "Specific Heat": "0.710 J/(g·K)",
+        "Group": 16,
+        "Period": 3,
+        "Category": "Nonmetal"
+    },
+    "Cl": {
+        "Name": "Chlorine",
+        "Atomic Number": 17,
+        "Atomic Mass": "35.4527 u",
+        "Density": "1.56 (3.3, 6) g/cm³",
+        "Melting Point": "-101.5 °C",
+        "Boiling Point": "-34.04 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "[Ne] 3s² 3p⁵",
+        "Ground State": "²P°₃/₂",
+        "Electronegativity": 3.16,
+        "Atomic Radius": "79 pm",
+        "Ionization Energy": "12.968 eV",
+        "Specific Heat": "0.479 J/(g·K)",
+        "Group": 17,
+        "Period": 3,
+        "Category": "Halogen"
+    },
+    "Ar": {
+        "Name": "Argon",
+        "Atomic Number": 18,
+        "Atomic Mass": "39.948 u",
+        "Density": "1.40 g/cm³",
+        "Melting Point": "-189.35 °C",
+        "Boiling Point": "-185.85 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "[Ne] 3s² 3p⁶",
+        "Ground State": "¹S₀",
+        "Electronegativity": "N/A",
+        "Atomic Radius": "71 pm",
+        "Ionization Energy": "15.760 eV",
+        "Specific Heat": "0.520 J/(g·K)",
+        "Group": 18,
+        "Period": 3,
+        "Category": "Noble Gas"
+    },
+    "K": {
+        "Name": "Potassium",
+        "Atomic Number": 19,
+        "Atomic Mass": "39.0983 u",
+        "Density": "0.862 g/cm³",
+        "Melting Point": "63.5 °C",
+        "Boiling Point": "759 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 4s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.82,
+        "Atomic Radius": "243 pm",
+        "Ionization Energy": "4.341 eV",
+        "Specific Heat": "0.757 J/(g·K)",
+        "Group": 1,
+        "Period": 4,
+        "Category": "Alkali Metal"
+    },
+    "Ca": {
+        "Name": "Calcium",
+        "Atomic Number": 20,
+        "Atomic Mass": "40.078 u",
+        "Density": "1.55 g/cm³",
+        "Melting Point": "842 °C",
+        "Boiling Point": "1484 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 4s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.00,
+        "Atomic Radius": "194 pm",
+        "Ionization Energy": "6.113 eV",
+        "Specific Heat": "0.647 J/(g·K)",
+        "Group": 2,
+        "Period": 4,
+        "Category": "Alkaline Earth Metal"
+    },
+    "Sc": {
+        "Name": "Scandium",
+        "Atomic Number": 21,
+        "Atomic Mass": "44.955912 u",
+        "Density": "2.989 g/cm³",
+        "Melting Point": "1541 °C",
+        "Boiling Point": "2836 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹ 4s²",
+        "Ground State": "²D₃/₂",
+        "Electronegativity": 1.36,
+        "Atomic Radius": "184 pm",
+        "Ionization Energy": "6.561 eV",
+        "Specific Heat": "0.568 J/(g·K)",
+        "Group": 3,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Lars Fredrik Nilson",
+        "Year of Discovery": 1879
+    },
+    "Ti": {
+        "Name": "Titanium",
+        "Atomic Number": 22,
+        "Atomic Mass": "47.867 u",
+        "Density": "4.54 g/cm³",
+        "Melting Point": "1668 °C",
+        "Boiling Point": "3287 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d² 4s²",
+        "Ground State": "³F₂",
+        "Electronegativity": 1.54,
+        "Atomic Radius": "176 pm",
+        "Ionization Energy": "6.828 eV",
+        "Specific Heat": "0.523 J/(g·K)",
+        "Group": 4,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "William Gregor",
+        "Year of Discovery": 1791
+    },
+    "V": {
+        "Name": "Vanadium",
+        "Atomic Number": 23,
+        "Atomic Mass": "50.9415 u",
+        "Density": "6.11 g/cm³",
+        "Melting Point": "1910 °C",
+        "Boiling Point": "3407 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d³ 4s²",
+        "Ground State": "⁴F₃/₂",
+        "Electronegativity": 1.63,
+        "Atomic Radius": "171 pm",
+        "Ionization Energy": "6.746 eV",
+        "Specific Heat": "0.489 J/(g·K)",
+        "Group": 5,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Andrés Manuel del Río",
+        "Year of Discovery": 1801
+    },
+    "Cr": {
+        "Name": "Chromium",
+        "Atomic Number": 24,
+        "Atomic Mass": "51.9961 u",
+        "Density": "7.15 g/cm³",
+        "Melting Point": "1907 °C",
+        "Boiling Point": "2671 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d⁵ 4s¹",
+        "Ground State": "⁷S₃",
+        "Electronegativity": 1.66,
+        "Atomic Radius": "166 pm",
+        "Ionization Energy": "6.767 eV",
+        "Specific Heat": "0.449 J/(g·K)",
+        "Group": 6,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Louis Nicolas Vauquelin",
+        "Year of Discovery": 1797
+    },
+    "Mn": {
+        "Name": "Manganese",
+        "Atomic Number": 25,
+        "Atomic Mass": "54.938045 u",
+        "Density": "7.44 g/cm³",
+        "Melting Point": "1246 °C",
+        "Boiling Point": "2061 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d⁵ 4s²",
+        "Ground State": "⁶S₅/₂",
+        "Electronegativity": 1.55,
+        "Atomic Radius": "161 pm",
+        "Ionization Energy": "7.434 eV",
+        "Specific Heat": "0.479 J/(g·K)",
+        "Group": 7,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Johan Gottlieb Gahn",
+        "Year of Discovery": 1774
+    },
+    "Fe": {
+        "Name": "Iron",
+        "Atomic Number": 26,
+        "Atomic Mass": "55.845 u",
+        "Density": "7.874 g/cm³",
+        "Melting Point": "1538 °C",
+        "Boiling Point": "2861 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d⁶ 4s²",
+        "Ground State": "⁵D₄",
+        "Electronegativity": 1.83,
+        "Atomic Radius": "156 pm",
+        "Ionization Energy": "7.902 eV",
+        "Specific Heat": "0.449 J/(g·K)",
+        "Group": 8,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Co": {
+        "Name": "Cobalt",
+        "Atomic Number": 27,
+        "Atomic Mass": "58.933200 u",
+        "Density": "8.9 g/cm³",
+        "Melting Point": "1495 °C",
+        "Boiling Point": "2927 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d⁷ 4s²",
+        "Ground State": "⁴F₉/₂",
+        "Electronegativity": 1.88,
+        "Atomic Radius": "152 pm",
+        "Ionization Energy": "7.881 eV",
+        "Specific Heat": "0.421 J/(g·K)",
+        "Group": 9,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Georg Brandt",
+        "Year of Discovery": 1735
+    },
+    "Ni": {
+        "Name": "Nickel",
+        "Atomic Number": 28,
+        "Atomic Mass": "58.6934 u",
+        "Density": "8.90225 g/cm³",
+        "Melting Point": "1455 °C",
+        "Boiling Point": "2913 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d⁸ 4s²",
+        "Ground State": "³F₄",
+        "Electronegativity": 1.91,
+        "Atomic Radius": "149 pm",
+        "Ionization Energy": "7.640 eV",
+        "Specific Heat": "0.444 J/(g·K)",
+        "Group": 10,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Axel Fredrik Cronstedt",
+        "Year of Discovery": 1751
+    },
+    "Cu": {
+        "Name": "Copper",
+        "Atomic Number": 29,
+        "Atomic Mass": "63.546 u",
+        "Density": "8.96 g/cm³",
+        "Melting Point": "1084.62 °C",
+        "Boiling Point": "2562 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 1.90,
+        "Atomic Radius": "145 pm",
+        "Ionization Energy": "7.726 eV",
+        "Specific Heat": "0.385 J/(g·K)",
+        "Group": 11,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Zn": {
+        "Name": "Zinc",
+        "Atomic Number": 30,
+        "Atomic Mass": "65.39 u",
+        "Density": "7.13325 g/cm³",
+        "Melting Point": "419.53 °C",
+        "Boiling Point": "907 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.65,
+        "Atomic Radius": "142 pm",
+        "Ionization Energy": "9.394 eV",
+        "Specific Heat": "0.388 J/(g·K)",
+        "Group": 12,
+        "Period": 4,
+        "Category": "Transition Metal",
+        "Discovered By": "Andreas Sigismund Marggraf",
+        "Year of Discovery": 1746
+    },
+    # Continue with all other elements...
+    # I'll provide a few more key examples, but you should follow this pattern for all elements:
+
+    "Ga": {
+        "Name": "Gallium",
+        "Atomic Number": 31,
+        "Atomic Mass": "69.723 u",
+        "Density": "5.90429.6 g/cm³",
+        "Melting Point": "29.76 °C",
+        "Boiling Point": "2204 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p¹",
+        "Ground State": "²P₁/₂",
+        "Electronegativity": 1.81,
+        "Atomic Radius": "136 pm",
+        "Ionization Energy": "5.999 eV",
+        "Specific Heat": "0.371 J/(g·K)",
+        "Group": 13,
+        "Period": 4,
+        "Category": "Post-transition Metal",
+        "Discovered By": "Lecoq de Boisbaudran",
+        "Year of Discovery": 1875
+    },
+    "Ge": {
+    "Name": "Germanium",
+    "Atomic Number": 32,
+    "Atomic Mass": "72.61 u",
+    "Density": "5.32325 g/cm³",
+    "Melting Point": "938.25 °C",
+    "Boiling Point": "2833 °C",
+    "State at 20°C": "Solid",
+    "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p²",
+    "Ground State": "³P₀",
+    "Electronegativity": 2.01,
+    "Atomic Radius": "125 pm",
+    "Ionization Energy": "7.899 eV",
+    "Specific Heat": "0.320 J/(g·K)",
+    "Group": 14,
+    "Period": 4,
+    "Category": "Metalloid",
+    "Discovered By": "Clemens Winkler",
+    "Year of Discovery": 1886
+    },
+    "As": {
+        "Name": "Arsenic",
+        "Atomic Number": 33,
+        "Atomic Mass": "74.92160 u",
+        "Density": "5.73 g/cm³",
+        "Melting Point": "817 °C (at 28 atm)",
+        "Boiling Point": "603 °C (sublimes)",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p³",
+        "Ground State": "⁴S³/₂",
+        "Electronegativity": 2.18,
+        "Atomic Radius": "114 pm",
+        "Ionization Energy": "9.789 eV",
+        "Specific Heat": "0.329 J/(g·K)",
+        "Group": 15,
+        "Period": 4,
+        "Category": "Metalloid",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Se": {
+        "Name": "Selenium",
+        "Atomic Number": 34,
+        "Atomic Mass": "78.96 u",
+        "Density": "4.79 g/cm³",
+        "Melting Point": "220.5 °C",
+        "Boiling Point": "685 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁴",
+        "Ground State": "³P₂",
+        "Electronegativity": 2.55,
+        "Atomic Radius": "103 pm",
+        "Ionization Energy": "9.752 eV",
+        "Specific Heat": "0.321 J/(g·K)",
+        "Group": 16,
+        "Period": 4,
+        "Category": "Nonmetal",
+        "Discovered By": "Jöns Jakob Berzelius",
+        "Year of Discovery": 1817
+    },
+    "Br": {
+        "Name": "Bromine",
+        "Atomic Number": 35,
+        "Atomic Mass": "79.904 u",
+        "Density": "3.12 g/cm³",
+        "Melting Point": "-7.2 °C",
+        "Boiling Point": "58.8 °C",
+        "State at 20°C": "Liquid",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁵",
+        "Ground State": "²P₃/₂",
+        "Electronegativity": 2.96,
+        "Atomic Radius": "94 pm",
+        "Ionization Energy": "11.814 eV",
+        "Specific Heat": "0.226 J/(g·K)",
+        "Group": 17,
+        "Period": 4,
+        "Category": "Halogen",
+        "Discovered By": "Antoine Jérôme Balard",
+        "Year of Discovery": 1826
+    },
+    "Kr": {
+        "Name": "Krypton",
+        "Atomic Number": 36,
+        "Atomic Mass": "83.80 u",
+        "Density": "2.16 g/cm³",
+        "Melting Point": "-157.37 °C (at 73.2 kPa)",
+        "Boiling Point": "-153.22 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁶",
+        "Ground State": "¹S₀",
+        "Electronegativity": 3.00,
+        "Atomic Radius": "88 pm",
+        "Ionization Energy": "14.000 eV",
+        "Specific Heat": "0.248 J/(g·K)",
+        "Group": 18,
+        "Period": 4,
+        "Category": "Noble Gas",
+        "Discovered By": "William Ramsay and Morris Travers",
+        "Year of Discovery": 1898
+    },
+    "Rb": {
+        "Name": "Rubidium",
+        "Atomic Number": 37,
+        "Atomic Mass": "85.4678 u",
+        "Density": "1.532 g/cm³",
+        "Melting Point": "39.30 °C",
+        "Boiling Point": "688 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 5s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.82,
+        "Atomic Radius": "265 pm",
+        "Ionization Energy": "4.177 eV",
+        "Specific Heat": "0.363 J/(g·K)",
+        "Group": 1,
+        "Period": 5,
+        "Category": "Alkali Metal",
+        "Discovered By": "Robert Bunsen and Gustav Kirchhoff",
+        "Year of Discovery": 1861
+    },
+    "Sr": {
+        "Name": "Strontium",
+        "Atomic Number": 38,
+        "Atomic Mass": "87.62 u",
+        "Density": "2.54 g/cm³",
+        "Melting Point": "777 °C",
+        "Boiling Point": "1382 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 5s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 0.95,
+        "Atomic Radius": "219 pm",
+        "Ionization Energy": "5.695 eV",
+        "Specific Heat": "0.301 J/(g·K)",
+        "Group": 2,
+        "Period": 5,
+        "Category": "Alkaline Earth Metal",
+        "Discovered By": "Adair Crawford",
+        "Year of Discovery": 1790
+    },
+    "Y": {
+        "Name": "Yttrium",
+        "Atomic Number": 39,
+        "Atomic Mass": "88.90585 u",
+        "Density": "4.46925 g/cm³",
+        "Melting Point": "1522 °C",
+        "Boiling Point": "3345 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹ 5s²",
+        "Ground State": "²D₃/₂",
+        "Electronegativity": 1.22,
+        "Atomic Radius": "212 pm",
+        "Ionization Energy": "6.217 eV",
+        "Specific Heat": "0.298 J/(g·K)",
+        "Group": 3,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Johan Gadolin",
+        "Year of Discovery": 1794
+    },
+    "Zr": {
+        "Name": "Zirconium",
+        "Atomic Number": 40,
+        "Atomic Mass": "91.224 u",
+        "Density": "6.506 g/cm³",
+        "Melting Point": "1855 °C",
+        "Boiling Point": "4409 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d² 5s²",
+        "Ground State": "³F₂",
+        "Electronegativity": 1.33,
+        "Atomic Radius": "206 pm",
+        "Ionization Energy": "6.634 eV",
+        "Specific Heat": "0.278 J/(g·K)",
+        "Group": 4,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Martin Heinrich Klaproth",
+        "Year of Discovery": 1789
+    },
+    "Nb": {
+        "Name": "Niobium",
+        "Atomic Number": 41,
+        "Atomic Mass": "92.90638 u",
+        "Density": "8.57 g/cm³",
+        "Melting Point": "2477 °C",
+        "Boiling Point": "4744 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d⁴ 5s¹",
+        "Ground State": "⁶D₁/₂",
+        "Electronegativity": 1.6,
+        "Atomic Radius": "198 pm",
+        "Ionization Energy": "6.759 eV",
+        "Specific Heat": "0.265 J/(g·K)",
+        "Group": 5,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Charles Hatchett",
+        "Year of Discovery": 1801
+    },
+    "Mo": {
+        "Name": "Molybdenum",
+        "Atomic Number": 42,
+        "Atomic Mass": "95.94 u",
+        "Density": "10.22 g/cm³",
+        "Melting Point": "2623 °C",
+        "Boiling Point": "4639 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d⁵ 5s¹",
+        "Ground State": "⁷S₃",
+        "Electronegativity": 2.16,
+        "Atomic Radius": "190 pm",
+        "Ionization Energy": "7.092 eV",
+        "Specific Heat": "0.251 J/(g·K)",
+        "Group": 6,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Carl Wilhelm Scheele",
+        "Year of Discovery": 1778
+    },
+    "Tc": {
+        "Name": "Technetium",
+        "Atomic Number": 43,
+        "Atomic Mass": "(98) u",
+        "Density": "11.50 g/cm³",
+        "Melting Point": "2157 °C",
+        "Boiling Point": "4265 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d⁵ 5s²",
+        "Ground State": "⁶S₅/₂",
+        "Electronegativity": 1.9,
+        "Atomic Radius": "183 pm",
+        "Ionization Energy": "7.28 eV",
+        "Specific Heat": "—",
+        "Group": 7,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Carlo Perrier and Emilio Segrè",
+        "Year of Discovery": 1937
+    },
+    "Ru": {
+        "Name": "Ruthenium",
+        "Atomic Number": 44,
+        "Atomic Mass": "101.07 u",
+        "Density": "12.41 g/cm³",
+        "Melting Point": "2334 °C",
+        "Boiling Point": "4150 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d⁷ 5s¹",
+        "Ground State": "⁵F₅",
+        "Electronegativity": 2.2,
+        "Atomic Radius": "178 pm",
+        "Ionization Energy": "7.360 eV",
+        "Specific Heat": "0.238 J/(g·K)",
+        "Group": 8,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Karl Ernst Claus",
+        "Year of Discovery": 1844
+    },
+    "Rh": {
+        "Name": "Rhodium",
+        "Atomic Number": 45,
+        "Atomic Mass": "102.90550 u",
+        "Density": "12.41 g/cm³",
+        "Melting Point": "1964 °C",
+        "Boiling Point": "3695 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d⁸ 5s¹",
+        "Ground State": "⁴F₉/₂",
+        "Electronegativity": 2.28,
+        "Atomic Radius": "173 pm",
+        "Ionization Energy": "7.459 eV",
+        "Specific Heat": "0.243 J/(g·K)",
+        "Group": 9,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "William Hyde Wollaston",
+        "Year of Discovery": 1804
+    },
+    "Pd": {
+        "Name": "Palladium",
+        "Atomic Number": 46,
+        "Atomic Mass": "106.42 u",
+        "Density": "12.02 g/cm³",
+        "Melting Point": "1554.9 °C",
+        "Boiling Point": "2963 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰",
+        "Ground State": "¹S₀",
+        "Electronegativity": 2.20,
+        "Atomic Radius": "169 pm",
+        "Ionization Energy": "8.337 eV",
+        "Specific Heat": "0.246 J/(g·K)",
+        "Group": 10,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "William Hyde Wollaston",
+        "Year of Discovery": 1803
+    },
+    "Ag": {
+        "Name": "Silver",
+        "Atomic Number": 47,
+        "Atomic Mass": "107.8682 u",
+        "Density": "10.50 g/cm³",
+        "Melting Point": "961.78 °C",
+        "Boiling Point": "2162 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 1.93,
+        "Atomic Radius": "165 pm",
+        "Ionization Energy": "7.576 eV",
+        "Specific Heat": "0.235 J/(g·K)",
+        "Group": 11,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Cd": {
+        "Name": "Cadmium",
+        "Atomic Number": 48,
+        "Atomic Mass": "112.411 u",
+        "Density": "8.65 g/cm³",
+        "Melting Point": "321.07 °C",
+        "Boiling Point": "767 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.69,
+        "Atomic Radius": "161 pm",
+        "Ionization Energy": "8.994 eV",
+        "Specific Heat": "0.232 J/(g·K)",
+        "Group": 12,
+        "Period": 5,
+        "Category": "Transition Metal",
+        "Discovered By": "Friedrich Stromeyer",
+        "Year of Discovery": 1817
+    },
+    "In": {
+        "Name": "Indium",
+        "Atomic Number": 49,
+        "Atomic Mass": "114.818 u",
+        "Density": "7.31 g/cm³",
+        "Melting Point": "156.60 °C",
+        "Boiling Point": "2072 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p¹",
+        "Ground State": "²P₁/₂",
+        "Electronegativity": 1.78,
+        "Atomic Radius": "156 pm",
+        "Ionization Energy": "5.786 eV",
+        "Specific Heat": "0.233 J/(g·K)",
+        "Group": 13,
+        "Period": 5,
+        "Category": "Post-transition Metal",
+        "Discovered By": "Ferdinand Reich and Hieronymous Theodor Richter",
+        "Year of Discovery": 1863
+    },
+    "Sn": {
+        "Name": "Tin",
+        "Atomic Number": 50,
+        "Atomic Mass": "118.710 u",
+        "Density": "7.31 g/cm³",
+        "Melting Point": "231.93 °C",
+        "Boiling Point": "2602 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p²",
+        "Ground State": "³P₀",
+        "Electronegativity": 1.96,
+        "Atomic Radius": "145 pm",
+        "Ionization Energy": "7.344 eV",
+        "Specific Heat": "0.228 J/(g·K)",
+        "Group": 14,
+        "Period": 5,
+        "Category": "Post-transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Sb": {
+        "Name": "Antimony",
+        "Atomic Number": 51,
+        "Atomic Mass": "121.760 u",
+        "Density": "6.691 g/cm³",
+        "Melting Point": "630.73 °C",
+        "Boiling Point": "1587 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p³",
+        "Ground State": "⁴S₃/₂",
+        "Electronegativity": 2.05,
+        "Atomic Radius": "133 pm",
+        "Ionization Energy": "8.608 eV",
+        "Specific Heat": "0.207 J/(g·K)",
+        "Group": 15,
+        "Period": 5,
+        "Category": "Metalloid",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Te": {
+        "Name": "Tellurium",
+        "Atomic Number": 52,
+        "Atomic Mass": "127.60 u",
+        "Density": "6.24 g/cm³",
+        "Melting Point": "449.51 °C",
+        "Boiling Point": "988 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁴",
+        "Ground State": "³P₂",
+        "Electronegativity": 2.1,
+        "Atomic Radius": "123 pm",
+        "Ionization Energy": "9.010 eV",
+        "Specific Heat": "0.202 J/(g·K)",
+        "Group": 16,
+        "Period": 5,
+        "Category": "Metalloid",
+        "Discovered By": "Franz-Joseph Müller von Reichenstein",
+        "Year of Discovery": 1782
+    },
+    "I": {
+        "Name": "Iodine",
+        "Atomic Number": 53,
+        "Atomic Mass": "126.90447 u",
+        "Density": "4.93 g/cm³",
+        "Melting Point": "113.7 °C",
+        "Boiling Point": "184.4 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁵",
+        "Ground State": "²P₃/₂",
+        "Electronegativity": 2.66,
+        "Atomic Radius": "115 pm",
+        "Ionization Energy": "10.451 eV",
+        "Specific Heat": "0.145 J/(g·K)",
+        "Group": 17,
+        "Period": 5,
+        "Category": "Halogen",
+        "Discovered By": "Bernard Courtois",
+        "Year of Discovery": 1811
+    },
+    "Xe": {
+        "Name": "Xenon",
+        "Atomic Number": 54,
+        "Atomic Mass": "131.29 u",
+        "Density": "3.52 g/cm³",
+        "Melting Point": "-111.79 °C (at 81.6 kPa)",
+        "Boiling Point": "-108.12 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁶",
+        "Ground State": "¹S₀",
+        "Electronegativity": 2.60,
+        "Atomic Radius": "108 pm",
+        "Ionization Energy": "12.130 eV",
+        "Specific Heat": "0.158 J/(g·K)",
+        "Group": 18,
+        "Period": 5,
+        "Category": "Noble Gas",
+        "Discovered By": "William Ramsay and Morris Travers",
+        "Year of Discovery": 1898
+    },
+    "Cs": {
+        "Name": "Cesium",
+        "Atomic Number": 55,
+        "Atomic Mass": "132.90545 u",
+        "Density": "1.873 g/cm³",
+        "Melting Point": "28.5 °C",
+        "Boiling Point": "671 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 6s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.79,
+        "Atomic Radius": "298 pm",
+        "Ionization Energy": "3.894 eV",
+        "Specific Heat": "0.242 J/(g·K)",
+        "Group": 1,
+        "Period": 6,
+        "Category": "Alkali Metal",
+        "Discovered By": "Robert Bunsen and Gustav Kirchhoff",
+        "Year of Discovery": 1860
+    },
+    "Ba": {
+        "Name": "Barium",
+        "Atomic Number": 56,
+        "Atomic Mass": "137.327 u",
+        "Density": "3.5 g/cm³",
+        "Melting Point": "727 °C",
+        "Boiling Point": "1897 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 6s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 0.89,
+        "Atomic Radius": "253 pm",
+        "Ionization Energy": "5.212 eV",
+        "Specific Heat": "0.204 J/(g·K)",
+        "Group": 2,
+        "Period": 6,
+        "Category": "Alkaline Earth Metal",
+        "Discovered By": "Humphry Davy",
+        "Year of Discovery": 1808
+    },
+    "La": {
+        "Name": "Lanthanum",
+        "Atomic Number": 57,
+        "Atomic Mass": "138.9055 u",
+        "Density": "6.14525 g/cm³",
+        "Melting Point": "918 °C",
+        "Boiling Point": "3464 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 5d¹ 6s²",
+        "Ground State": "²D₃/₂",
+        "Electronegativity": 1.10,
+        "Atomic Radius": "240 pm",
+        "Ionization Energy": "5.577 eV",
+        "Specific Heat": "0.195 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Carl Gustaf Mosander",
+        "Year of Discovery": 1839
+    },
+    "Ce": {
+        "Name": "Cerium",
+        "Atomic Number": 58,
+        "Atomic Mass": "140.116 u",
+        "Density": "6.77025 g/cm³",
+        "Melting Point": "798 °C",
+        "Boiling Point": "3443 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹ 5d¹ 6s²",
+        "Ground State": "¹G₄",
+        "Electronegativity": 1.12,
+        "Atomic Radius": "235 pm",
+        "Ionization Energy": "5.539 eV",
+        "Specific Heat": "0.192 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Martin Heinrich Klaproth, Jöns Jakob Berzelius, Wilhelm Hisinger",
+        "Year of Discovery": 1803
+    },
+    "Pr": {
+        "Name": "Praseodymium",
+        "Atomic Number": 59,
+        "Atomic Mass": "140.90765 u",
+        "Density": "6.773 g/cm³",
+        "Melting Point": "931 °C",
+        "Boiling Point": "3520 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f³ 6s²",
+        "Ground State": "⁴I₉/₂",
+        "Electronegativity": 1.13,
+        "Atomic Radius": "239 pm",
+        "Ionization Energy": "5.473 eV",
+        "Specific Heat": "0.193 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Carl Auer von Welsbach",
+        "Year of Discovery": 1885
+    },
+    "Nd": {
+        "Name": "Neodymium",
+        "Atomic Number": 60,
+        "Atomic Mass": "144.24 u",
+        "Density": "7.00825 g/cm³",
+        "Melting Point": "1021 °C",
+        "Boiling Point": "3074 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁴ 6s²",
+        "Ground State": "⁵I₄",
+        "Electronegativity": 1.14,
+        "Atomic Radius": "229 pm",
+        "Ionization Energy": "5.525 eV",
+        "Specific Heat": "0.190 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Carl Auer von Welsbach",
+        "Year of Discovery": 1885
+    },
+    "Pm": {
+        "Name": "Promethium",
+        "Atomic Number": 61,
+        "Atomic Mass": "(145) u",
+        "Density": "7.26425 g/cm³",
+        "Melting Point": "1042 °C",
+        "Boiling Point": "3000 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁵ 6s²",
+        "Ground State": "⁶H₅/₂",
+        "Electronegativity": 1.13,
+        "Atomic Radius": "236 pm",
+        "Ionization Energy": "5.582 eV",
+        "Specific Heat": "—",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Jacob A. Marinsky, Lawrence E. Glendenin, Charles D. Coryell",
+        "Year of Discovery": 1945
+    },
+    "Sm": {
+        "Name": "Samarium",
+        "Atomic Number": 62,
+        "Atomic Mass": "150.36 u",
+        "Density": "7.52025 g/cm³",
+        "Melting Point": "1074 °C",
+        "Boiling Point": "1794 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁶ 6s²",
+        "Ground State": "⁷F₀",
+        "Electronegativity": 1.17,
+        "Atomic Radius": "229 pm",
+        "Ionization Energy": "5.644 eV",
+        "Specific Heat": "0.197 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Paul Émile Lecoq de Boisbaudran",
+        "Year of Discovery": 1879
+    },
+    "Eu": {
+        "Name": "Europium",
+        "Atomic Number": 63,
+        "Atomic Mass": "151.964 u",
+        "Density": "5.24425 g/cm³",
+        "Melting Point": "822 °C",
+        "Boiling Point": "1529 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁷ 6s²",
+        "Ground State": "⁸S₇/₂",
+        "Electronegativity": 1.2,
+        "Atomic Radius": "233 pm",
+        "Ionization Energy": "5.670 eV",
+        "Specific Heat": "0.182 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Eugène-Anatole Demarçay",
+        "Year of Discovery": 1901
+    },
+    "Gd": {
+        "Name": "Gadolinium",
+        "Atomic Number": 64,
+        "Atomic Mass": "157.25 u",
+        "Density": "7.90125 g/cm³",
+        "Melting Point": "1313 °C",
+        "Boiling Point": "3273 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁷ 5d¹ 6s²",
+        "Ground State": "⁹D₂",
+        "Electronegativity": 1.20,
+        "Atomic Radius": "237 pm",
+        "Ionization Energy": "6.150 eV",
+        "Specific Heat": "0.236 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Jean Charles Galissard de Marignac",
+        "Year of Discovery": 1880
+    },
+    "Tb": {
+        "Name": "Terbium",
+        "Atomic Number": 65,
+        "Atomic Mass": "158.92534 u",
+        "Density": "8.230 g/cm³",
+        "Melting Point": "1356 °C",
+        "Boiling Point": "3230 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f⁹ 6s²",
+        "Ground State": "⁶H₁₅/₂",
+        "Electronegativity": 1.10,
+        "Atomic Radius": "221 pm",
+        "Ionization Energy": "5.864 eV",
+        "Specific Heat": "0.182 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Carl Gustaf Mosander",
+        "Year of Discovery": 1843
+    },
+    "Dy": {
+        "Name": "Dysprosium",
+        "Atomic Number": 66,
+        "Atomic Mass": "162.50 u",
+        "Density": "8.55125 g/cm³",
+        "Melting Point": "1412 °C",
+        "Boiling Point": "2567 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁰ 6s²",
+        "Ground State": "⁵I₈",
+        "Electronegativity": 1.22,
+        "Atomic Radius": "229 pm",
+        "Ionization Energy": "5.939 eV",
+        "Specific Heat": "0.170 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Paul Émile Lecoq de Boisbaudran",
+        "Year of Discovery": 1886
+    },
+    "Ho": {
+        "Name": "Holmium",
+        "Atomic Number": 67,
+        "Atomic Mass": "164.93032 u",
+        "Density": "8.79525 g/cm³",
+        "Melting Point": "1474 °C",
+        "Boiling Point": "2700 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹¹ 6s²",
+        "Ground State": "⁴I₁₅/₂",
+        "Electronegativity": 1.23,
+        "Atomic Radius": "216 pm",
+        "Ionization Energy": "6.022 eV",
+        "Specific Heat": "0.165 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Marc Delafontaine, Jacques-Louis Soret",
+        "Year of Discovery": 1878
+    },
+    "Er": {
+        "Name": "Erbium",
+        "Atomic Number": 68,
+        "Atomic Mass": "167.26 u",
+        "Density": "9.06625 g/cm³",
+        "Melting Point": "1529 °C",
+        "Boiling Point": "2868 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹² 6s²",
+        "Ground State": "³H₆",
+        "Electronegativity": 1.24,
+        "Atomic Radius": "235 pm",
+        "Ionization Energy": "6.108 eV",
+        "Specific Heat": "0.168 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Carl Gustaf Mosander",
+        "Year of Discovery": 1843
+    },
+    "Tm": {
+        "Name": "Thulium",
+        "Atomic Number": 69,
+        "Atomic Mass": "168.93421 u",
+        "Density": "9.32125 g/cm³",
+        "Melting Point": "1545 °C",
+        "Boiling Point": "1950 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹³ 6s²",
+        "Ground State": "²F₇/₂",
+        "Electronegativity": 1.25,
+        "Atomic Radius": "227 pm",
+        "Ionization Energy": "6.184 eV",
+        "Specific Heat": "0.160 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Per Teodor Cleve",
+        "Year of Discovery": 1879
+    },
+    "Yb": {
+        "Name": "Ytterbium",
+        "Atomic Number": 70,
+        "Atomic Mass": "173.04 u",
+        "Density": "6.966 g/cm³",
+        "Melting Point": "819 °C",
+        "Boiling Point": "1196 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 6s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 1.1,
+        "Atomic Radius": "242 pm",
+        "Ionization Energy": "6.254 eV",
+        "Specific Heat": "0.155 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Jean Charles Galissard de Marignac",
+        "Year of Discovery": 1878
+    },
+    "Lu": {
+        "Name": "Lutetium",
+        "Atomic Number": 71,
+        "Atomic Mass": "174.967 u",
+        "Density": "9.84125 g/cm³",
+        "Melting Point": "1663 °C",
+        "Boiling Point": "3402 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹ 6s²",
+        "Ground State": "²D₃/₂",
+        "Electronegativity": 1.27,
+        "Atomic Radius": "221 pm",
+        "Ionization Energy": "5.426 eV",
+        "Specific Heat": "0.154 J/(g·K)",
+        "Group": 3,
+        "Period": 6,
+        "Category": "Lanthanide",
+        "Discovered By": "Georges Urbain",
+        "Year of Discovery": 1907
+    },
+    "Hf": {
+        "Name": "Hafnium",
+        "Atomic Number": 72,
+        "Atomic Mass": "178.49 u",
+        "Density": "13.31 g/cm³",
+        "Melting Point": "2233 °C",
+        "Boiling Point": "4603 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d² 6s²",
+        "Ground State": "³F₂",
+        "Electronegativity": 1.3,
+        "Atomic Radius": "212 pm",
+        "Ionization Energy": "6.825 eV",
+        "Specific Heat": "0.144 J/(g·K)",
+        "Group": 4,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Dirk Coster and George de Hevesy",
+        "Year of Discovery": 1923
+    },
+    "Ta": {
+        "Name": "Tantalum",
+        "Atomic Number": 73,
+        "Atomic Mass": "180.9479 u",
+        "Density": "16.654 g/cm³",
+        "Melting Point": "3017 °C",
+        "Boiling Point": "5458 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d³ 6s²",
+        "Ground State": "⁴F₃/₂",
+        "Electronegativity": 1.5,
+        "Atomic Radius": "206 pm",
+        "Ionization Energy": "7.550 eV",
+        "Specific Heat": "0.140 J/(g·K)",
+        "Group": 5,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Anders Gustaf Ekeberg",
+        "Year of Discovery": 1802
+    },
+    "W": {
+        "Name": "Tungsten",
+        "Atomic Number": 74,
+        "Atomic Mass": "183.84 u",
+        "Density": "19.3 g/cm³",
+        "Melting Point": "3422 °C",
+        "Boiling Point": "5555 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d⁴ 6s²",
+        "Ground State": "⁵D₀",
+        "Electronegativity": 2.36,
+        "Atomic Radius": "200 pm",
+        "Ionization Energy": "7.864 eV",
+        "Specific Heat": "0.132 J/(g·K)",
+        "Group": 6,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Fausto and Juan José de Elhuyar",
+        "Year of Discovery": 1783
+    },
+    "Re": {
+        "Name": "Rhenium",
+        "Atomic Number": 75,
+        "Atomic Mass": "186.207 u",
+        "Density": "21.02 g/cm³",
+        "Melting Point": "3186 °C",
+        "Boiling Point": "5596 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d⁵ 6s²",
+        "Ground State": "⁶S₅/₂",
+        "Electronegativity": 1.9,
+        "Atomic Radius": "197 pm",
+        "Ionization Energy": "7.834 eV",
+        "Specific Heat": "0.137 J/(g·K)",
+        "Group": 7,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Masataka Ogawa, Walter Noddack, Ida Tacke, Otto Berg",
+        "Year of Discovery": 1925
+    },
+    "Os": {
+        "Name": "Osmium",
+        "Atomic Number": 76,
+        "Atomic Mass": "190.23 u",
+        "Density": "22.57 g/cm³",
+        "Melting Point": "3033 °C",
+        "Boiling Point": "5012 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d⁶ 6s²",
+        "Ground State": "⁵D₄",
+        "Electronegativity": 2.2,
+        "Atomic Radius": "193 pm",
+        "Ionization Energy": "8.438 eV",
+        "Specific Heat": "0.130 J/(g·K)",
+        "Group": 8,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Smithson Tennant",
+        "Year of Discovery": 1803
+    },
+    "Ir": {
+        "Name": "Iridium",
+        "Atomic Number": 77,
+        "Atomic Mass": "192.217 u",
+        "Density": "22.4217 g/cm³",
+        "Melting Point": "2446 °C",
+        "Boiling Point": "4428 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d⁷ 6s²",
+        "Ground State": "⁴F₉/₂",
+        "Electronegativity": 2.20,
+        "Atomic Radius": "190 pm",
+        "Ionization Energy": "8.967 eV",
+        "Specific Heat": "0.131 J/(g·K)",
+        "Group": 9,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Smithson Tennant",
+        "Year of Discovery": 1803
+    },
+    "Pt": {
+        "Name": "Platinum",
+        "Atomic Number": 78,
+        "Atomic Mass": "195.078 u",
+        "Density": "21.45 g/cm³",
+        "Melting Point": "1768.4 °C",
+        "Boiling Point": "3825 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d⁹ 6s¹",
+        "Ground State": "³D₃",
+        "Electronegativity": 2.28,
+        "Atomic Radius": "187 pm",
+        "Ionization Energy": "8.959 eV",
+        "Specific Heat": "0.133 J/(g·K)",
+        "Group": 10,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Antonio de Ulloa",
+        "Year of Discovery": 1735
+    },
+    "Au": {
+        "Name": "Gold",
+        "Atomic Number": 79,
+        "Atomic Mass": "196.96655 u",
+        "Density": "19.3 g/cm³",
+        "Melting Point": "1064.18 °C",
+        "Boiling Point": "2856 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 2.54,
+        "Atomic Radius": "184 pm",
+        "Ionization Energy": "9.226 eV",
+        "Specific Heat": "0.129 J/(g·K)",
+        "Group": 11,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Hg": {
+        "Name": "Mercury",
+        "Atomic Number": 80,
+        "Atomic Mass": "200.59 u",
+        "Density": "13.546 g/cm³",
+        "Melting Point": "-38.83 °C",
+        "Boiling Point": "356.73 °C",
+        "State at 20°C": "Liquid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 2.00,
+        "Atomic Radius": "181 pm",
+        "Ionization Energy": "10.438 eV",
+        "Specific Heat": "0.140 J/(g·K)",
+        "Group": 12,
+        "Period": 6,
+        "Category": "Transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Tl": {
+        "Name": "Thallium",
+        "Atomic Number": 81,
+        "Atomic Mass": "204.3833 u",
+        "Density": "11.85 g/cm³",
+        "Melting Point": "304 °C",
+        "Boiling Point": "1473 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p¹",
+        "Ground State": "²P₁/₂",
+        "Electronegativity": 1.62,
+        "Atomic Radius": "156 pm",
+        "Ionization Energy": "6.108 eV",
+        "Specific Heat": "0.129 J/(g·K)",
+        "Group": 13,
+        "Period": 6,
+        "Category": "Post-transition Metal",
+        "Discovered By": "William Crookes",
+        "Year of Discovery": 1861
+    },
+    "Pb": {
+        "Name": "Lead",
+        "Atomic Number": 82,
+        "Atomic Mass": "207.2 u",
+        "Density": "11.35 g/cm³",
+        "Melting Point": "327.46 °C",
+        "Boiling Point": "1749 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p²",
+        "Ground State": "³P₀",
+        "Electronegativity": 1.87,
+        "Atomic Radius": "154 pm",
+        "Ionization Energy": "7.417 eV",
+        "Specific Heat": "0.129 J/(g·K)",
+        "Group": 14,
+        "Period": 6,
+        "Category": "Post-transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Bi": {
+        "Name": "Bismuth",
+        "Atomic Number": 83,
+        "Atomic Mass": "208.98038 u",
+        "Density": "9.747 g/cm³",
+        "Melting Point": "271.40 °C",
+        "Boiling Point": "1564 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p³",
+        "Ground State": "⁴S₃/₂",
+        "Electronegativity": 2.02,
+        "Atomic Radius": "143 pm",
+        "Ionization Energy": "7.286 eV",
+        "Specific Heat": "0.122 J/(g·K)",
+        "Group": 15,
+        "Period": 6,
+        "Category": "Post-transition Metal",
+        "Discovered By": "Known since ancient times",
+        "Year of Discovery": "prehistoric"
+    },
+    "Po": {
+        "Name": "Polonium",
+        "Atomic Number": 84,
+        "Atomic Mass": "(209) u",
+        "Density": "9.32 g/cm³",
+        "Melting Point": "254 °C",
+        "Boiling Point": "962 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁴",
+        "Ground State": "³P₂",
+        "Electronegativity": 2.0,
+        "Atomic Radius": "135 pm",
+        "Ionization Energy": "8.417 eV",
+        "Specific Heat": "—",
+        "Group": 16,
+        "Period": 6,
+        "Category": "Metalloid",
+        "Discovered By": "Marie and Pierre Curie",
+        "Year of Discovery": 1898
+    },
+    "At": {
+        "Name": "Astatine",
+        "Atomic Number": 85,
+        "Atomic Mass": "(210) u",
+        "Density": "—",
+        "Melting Point": "302 °C",
+        "Boiling Point": "—",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁵",
+        "Ground State": "²P₃/₂",
+        "Electronegativity": 2.2,
+        "Atomic Radius": "127 pm",
+        "Ionization Energy": "—",
+        "Specific Heat": "—",
+        "Group": 17,
+        "Period": 6,
+        "Category": "Halogen",
+        "Discovered By": "Dale R. Corson, Kenneth Ross MacKenzie, Emilio Segrè",
+        "Year of Discovery": 1940
+    },
+    "Rn": {
+        "Name": "Radon",
+        "Atomic Number": 86,
+        "Atomic Mass": "(222) u",
+        "Density": "—",
+        "Melting Point": "-71 °C",
+        "Boiling Point": "-61.7 °C",
+        "State at 20°C": "Gas",
+        "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁶",
+        "Ground State": "¹S₀",
+        "Electronegativity": 2.2,
+        "Atomic Radius": "120 pm",
+        "Ionization Energy": "10.748 eV",
+        "Specific Heat": "0.094 J/(g·K)",
+        "Group": 18,
+        "Period": 6,
+        "Category": "Noble Gas",
+        "Discovered By": "Friedrich Ernst Dorn",
+        "Year of Discovery": 1900
+    },
+    "Fr": {
+        "Name": "Francium",
+        "Atomic Number": 87,
+        "Atomic Mass": "(223) u",
+        "Density": "—",
+        "Melting Point": "27 °C",
+        "Boiling Point": "—",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Rn] 7s¹",
+        "Ground State": "²S₁/₂",
+        "Electronegativity": 0.79,
+        "Atomic Radius": "348 pm",
+        "Ionization Energy": "4.073 eV",
+        "Specific Heat": "—",
+        "Group": 1,
+        "Period": 7,
+        "Category": "Alkali Metal",
+        "Discovered By": "Marguerite Perey",
+        "Year of Discovery": 1939
+    },
+    "Ra": {
+        "Name": "Radium",
+        "Atomic Number": 88,
+        "Atomic Mass": "(226) u",
+        "Density": "—",
+        "Melting Point": "700 °C",
+        "Boiling Point": "—",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Rn] 7s²",
+        "Ground State": "¹S₀",
+        "Electronegativity": 0.9,
+        "Atomic Radius": "283 pm",
+        "Ionization Energy": "5.278 eV",
+        "Specific Heat": "—",
+        "Group": 2,
+        "Period": 7,
+        "Category": "Alkaline Earth Metal",
+        "Discovered By": "Marie and Pierre Curie",
+        "Year of Discovery": 1898
+    },
+    "Ac": {
+        "Name": "Actinium",
+        "Atomic Number": 89,
+        "Atomic Mass": "(227) u",
+        "Density": "—",
+        "Melting Point": "1051 °C",
+        "Boiling Point": "3198 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Rn] 6d¹ 7s²",
+        "Ground State": "²D₃/₂",
+        "Electronegativity": 1.1,
+        "Atomic Radius": "260 pm",
+        "Ionization Energy": "5.17 eV",
+        "Specific Heat": "0.120 J/(g·K)",
+        "Group": 3,
+        "Period": 7,
+        "Category": "Actinide",
+        "Discovered By": "André-Louis Debierne, Friedrich Oskar Giesel",
+        "Year of Discovery": 1899
+    },
+    "Th": {
+        "Name": "Thorium",
+        "Atomic Number": 90,
+        "Atomic Mass": "232.0381 u",
+        "Density": "11.72 g/cm³",
+        "Melting Point": "1750 °C",
+        "Boiling Point": "4788 °C",
+        "State at 20°C": "Solid",
+        "Electron Configuration": "[Rn] 6d² 7s²",
+        "Ground State": "³F₂",
+        "Electronegativity": 1.3,
+        "Atomic Radius": "237 pm",
+        "Ionization Energy": "6.307 eV",
+        "Specific Heat": "0.113 J/(g·K)",
+        "Group": 3,
+        "Period": 7,
+        "Category": "Actinide",
+        "Discovered By": "Jöns Jakob Berzelius",
+        "Year of Discovery": 1829
+    }
+
+}
+
+# Default properties for elements not explicitly defined
+_DEFAULT_PROPERTIES = {
+    "Name": "N/A",
+    "Atomic Number": "N/A",
+    "Atomic Mass": "N/A",
+    "Density": "N/A",
+    "Melting Point": "N/A",
+    "Boiling Point": "N/A",
+    "State at 20°C": "N/A",
+    "Electron Configuration": "N/A",
+    "Ground State": "N/A",
+    "Electronegativity": "N/A",
+    "Ionization Energy": "N/A",
+    "Specific Heat": "N/A",
+    "Group": "N/A",
+    "Period": "N/A",
+    "Category": "N/A",
+    "Common Core Levels": "N/A",
+    "Most Intense Line": "N/A",
+    "Typical FWHM": "N/A",
+    "Chemical Shift Range": "N/A"
+}
+
+
+def _build_element_positions() -> Dict[str, Tuple[int, int]]:
+    """Positions (row, col) of the elements in the periodic table grid"""
+    positions = {}
+
+    # Period 1
+    positions['H'] = (0, 0)
+    positions['He'] = (0, 17)
+
+    # Period 2
+    positions['Li'] = (1, 0)
+    positions['Be'] = (1, 1)
+    positions['B'] = (1, 12)
+    positions['C'] = (1, 13)
+    positions['N'] = (1, 14)
+    positions['O'] = (1, 15)
+    positions['F'] = (1, 16)
+    positions['Ne'] = (1, 17)
+
+    # Period 3
+    positions['Na'] = (2, 0)
+    positions['Mg'] = (2, 1)
+    positions['Al'] = (2, 12)
+    positions['Si'] = (2, 13)
+    positions['P'] = (2, 14)
+    positions['S'] = (2, 15)
+    positions['Cl'] = (2, 16)
+    positions['Ar'] = (2, 17)
+
+    # Period 4
+    positions['K'] = (3, 0)
+    positions['Ca'] = (3, 1)
+    for i, symbol in enumerate(['Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn']):
+        positions[symbol] = (3, i + 2)
+    positions['Ga'] = (3, 12)
+    positions['Ge'] = (3, 13)
+    positions['As'] = (3, 14)
+    positions['Se'] = (3, 15)
+    positions['Br'] = (3, 16)
+    positions['Kr'] = (3, 17)
+
+    # Period 5
+    positions['Rb'] = (4, 0)
+    positions['Sr'] = (4, 1)
+    for i, symbol in enumerate(['Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd']):
+        positions[symbol] = (4, i + 2)
+    positions['In'] = (4, 12)
+    positions['Sn'] = (4, 13)
+    positions['Sb'] = (4, 14)
+    positions['Te'] = (4, 15)
+    positions['I'] = (4, 16)
+    positions['Xe'] = (4, 17)
+
+    # Period 6
+    positions['Cs'] = (5, 0)
+    positions['Ba'] = (5, 1)
+    positions['La'] = (5, 2)
+    for i, symbol in enumerate(['Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg']):
+        positions[symbol] = (5, i + 3)
+    positions['Tl'] = (5, 12)
+    positions['Pb'] = (5, 13)
+    positions['Bi'] = (5, 14)
+    positions['Po'] = (5, 15)
+    positions['At'] = (5, 16)
+    positions['Rn'] = (5, 17)
+
+    # Period 7
+    positions['Fr'] = (6, 0)
+    positions['Ra'] = (6, 1)
+    positions['Ac'] = (6, 2)
+    for i, symbol in enumerate(['Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn']):
+        positions[symbol] = (6, i + 3)
+    positions['Nh'] = (6, 12)
+    positions['Fl'] = (6, 13)
+    positions['Mc'] = (6, 14)
+    positions['Lv'] = (6, 15)
+    positions['Ts'] = (6, 16)
+    positions['Og'] = (6, 17)
+
+    # Lanthanides
+    lanthanides = ['La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
+    for i, symbol in enumerate(lanthanides):
+        positions[symbol] = (8, i + 2)
+
+    # Actinides
+    actinides = ['Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr']
+    for i, symbol in enumerate(actinides):
+        positions[symbol] = (9, i + 2)
+
+    return positions
+
+
+class ElementRecord:
+    """Immutable static data for one element (see ELEMENT_REGISTRY)"""
+
+    __slots__ = ('symbol', 'atomic_number', 'position', 'category', 'main_core_level',
+                 'main_core_binding_energy', 'xps_fitting_url', 'thermo_url', 'harwell_url', 'properties')
+
+    def __init__(self, symbol, position=None):
+        values = {
+            'symbol': symbol,
+            'atomic_number': _ATOMIC_NUMBERS.get(symbol, 0),
+            'position': position,
+            'category': _ELEMENT_CATEGORIES.get(symbol, 'unknown'),
+            'main_core_level': _MAIN_CORE_LEVELS.get(symbol, 'N.D.'),
+            'main_core_binding_energy': _MAIN_CORE_BINDING_ENERGIES.get(symbol, 'N.D.'),
+            'xps_fitting_url': "https://www.xpsfitting.com/search/label/"
+                               f"{_XPS_FITTING_NAMES.get(symbol, symbol)}",
+            'thermo_url': "https://www.thermofisher.com/uk/en/home/materials-science/learning-center/"
+                          f"periodic-table/{_THERMO_PATHS.get(symbol, f'unknown/{symbol.lower()}')}.html",
+            'harwell_url': f"https://www.harwellxps.guru/xpskb/{_HARWELL_NAMES.get(symbol, symbol.lower())}/",
+        }
+        properties = dict(_ELEMENT_PROPERTIES.get(symbol) or dict(_DEFAULT_PROPERTIES, Name=symbol))
+        properties["XPS Fitting URL"] = values['xps_fitting_url']
+        properties["Thermo Fisher URL"] = values['thermo_url']
+        values['properties'] = MappingProxyType(properties)
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ElementRecord is read-only")
+
+    def __repr__(self):
+        return f"ElementRecord({self.symbol!r}, Z={self.atomic_number})"
+
+
+ELEMENT_POSITIONS = MappingProxyType(_build_element_positions())
+ELEMENT_REGISTRY = MappingProxyType({symbol: ElementRecord(symbol, ELEMENT_POSITIONS.get(symbol))
+                                     for symbol in {**_ATOMIC_NUMBERS, **ELEMENT_POSITIONS}})
+
+
+def get_element_record(symbol):
+    """Registry record for symbol; unknown symbols get a default (uncached) record"""
+    record = ELEMENT_REGISTRY.get(symbol)
+    return record if record is not None else ElementRecord(symbol)
+
+
 class PeriodicTableXPS(wx.Frame):
+    # Facet label -> DataFrame column (Journal uses the parsed abbreviation)
+    FACET_FIELDS = OrderedDict([
+        ('Line', 'Line'), ('Quality', 'Quality'), ('Use Mono', 'Use Mono'), ('X-ray Energy', 'X-ray Energy'),
+        ('Charge Reference', 'Charge Reference'), ('Energy Scale Evaluation', 'Energy Scale Evalution'),
+        ('Journal', 'Journal'),
+    ])
+
     def __init__(self, parent=None):  # MUST have parent=None parameter
         super().__init__(None, title="KherveDB Library: How I wish NIST would look like",
                          size=(690, 720))
@@ -48,6 +2842,32 @@ class PeriodicTableXPS(wx.Frame):
         # Load persistent configuration
         self.config = self.load_config()
 
+        # On-disk cache of XPS Fitting / Thermo / Harwell pages (shared by all property dialogs)
+        self.page_cache = PageCache(get_cache_dir('pages'),
+                                    ttl_seconds=self.config.get('page_cache_ttl_hours', 168) * 3600,
+                                    max_bytes=self.config.get('page_cache_max_mb', 50) * 1024 * 1024)
+
+        # Idle-time prefetch of the neighbouring elements' pages while the property dialog is open
+        self.prefetcher = NeighborPrefetcher(self.page_cache, self.get_element_positions(),
+                                             max_elements=self.config.get('prefetch_max_elements', 4),
+                                             max_kbytes_per_s=self.config.get('prefetch_kbytes_per_s', 256),
+                                             budget_mb=self.config.get('prefetch_budget_mb', 20))
+        self._prefetch_timer = None
+
+        # Background downloads (Scholar PDFs) and the non-modal window showing their progress
+        self.download_manager = DownloadManager(max_workers=self.config.get('download_workers', 3))
+        self.task_frame = None
+        self._active_downloads = {}  # url -> task id, so the same paper is not fetched twice at once
+
+        # Downloaded papers are kept once, by content hash, in a local library
+        library_dir = self.config.get('paper_library_dir') or os.path.join(os.path.expanduser('~'), '.khervedb',
+                                                                            'papers')
+        try:
+            self.paper_library = PaperLibrary(library_dir)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Paper library unavailable: {e}")
+            self.paper_library = None
+
         if platform.system() == 'Darwin':  # Mac OS
             window_size = (680, 720)
             # Set minimum and maximum sizes
@@ -93,6 +2913,9 @@ class PeriodicTableXPS(wx.Frame):
         # Initialize variables
         self.selected_element = None
         self.selected_line = None
+        self.be_range = None  # (lo, hi) BE window brushed on a plot
+        self.range_filters = {}  # metadata field -> (lo, hi), see NumericMetadata
+        self.facet_selection = {}  # facet label -> set of values, see FacetIndex
 
         # Track property dialog
         self.property_dialog = None
@@ -103,6 +2926,10 @@ class PeriodicTableXPS(wx.Frame):
         self.property_dialog_position = None
         self.property_dialog_tab_index = 0  # Remember which tab was selected
 
+        # Plot windows following the search filters
+        self.plot_listeners = []
+        self._plot_update_pending = False
+
         # Bind close event
         self.Bind(wx.EVT_CLOSE, self.on_close)
 
@@ -112,6 +2939,8 @@ class PeriodicTableXPS(wx.Frame):
         # Apply simplified mode from config on startup
         if self.config.get('simplified_periodic_table', False):
             wx.CallAfter(self.refresh_periodic_table)
+        if self.heatmap_metric != 'off':
+            wx.CallAfter(self.apply_heatmap)
 
     def on_close(self, event):
         """Handle window close event"""
@@ -122,6 +2951,11 @@ class PeriodicTableXPS(wx.Frame):
                 self.property_dialog_tab_index = self.property_dialog.notebook.GetSelection()
             except:
                 pass
+        self.prefetcher.stop()
+        self.download_manager.shutdown()
+        self.page_cache.flush()
+        if getattr(self, '_atlas_cancel', None):
+            self._atlas_cancel.set()
         self.Destroy()
 
     def position_on_left(self):
@@ -182,6 +3016,27 @@ class PeriodicTableXPS(wx.Frame):
         export_item = file_menu.Append(wx.ID_ANY, '&Export Filtered Data...\tCtrl+E',
                                        'Export currently filtered NIST data to a text file')
         self.Bind(wx.EVT_MENU, self.export_filtered_data, export_item)
+        export_stats_item = file_menu.Append(wx.ID_ANY, 'Export &Line Statistics...',
+                                             'Export BE statistics for every element and line')
+        self.Bind(wx.EVT_MENU, self.export_line_statistics, export_stats_item)
+        atlas_item = file_menu.Append(wx.ID_ANY, 'Export BE &Atlas...',
+                                      'Save distribution plots for every element and line')
+        self.Bind(wx.EVT_MENU, self.export_atlas, atlas_item)
+        file_menu.AppendSeparator()
+        bundle_item = file_menu.Append(wx.ID_ANY, 'Export Subset &Bundle...',
+                                       'Save the filtered rows as a bundle another KherveDB can open')
+        self.Bind(wx.EVT_MENU, self.export_subset_bundle, bundle_item)
+        open_bundle_item = file_menu.Append(wx.ID_ANY, '&Open Subset Bundle...',
+                                            'Use a subset bundle as the database')
+        self.Bind(wx.EVT_MENU, self.open_subset_bundle, open_bundle_item)
+        full_db_item = file_menu.Append(wx.ID_ANY, 'Use &Full NIST Database',
+                                        'Stop using the subset bundle chosen with Open Subset Bundle')
+        full_db_item.Enable(bool(self.config.get('database_path')))
+        self.Bind(wx.EVT_MENU, self.use_full_database, full_db_item)
+        file_menu.AppendSeparator()
+        library_item = file_menu.Append(wx.ID_ANY, 'Open &Paper Library Folder',
+                                        'Show the folder holding downloaded papers')
+        self.Bind(wx.EVT_MENU, self.open_paper_library, library_item)
         file_menu.AppendSeparator()
         exit_item = file_menu.Append(wx.ID_EXIT, 'E&xit\tCtrl+Q', 'Exit application')
         self.Bind(wx.EVT_MENU, lambda e: self.Close(), exit_item)
@@ -192,11 +3047,26 @@ class PeriodicTableXPS(wx.Frame):
         databases_item = view_menu.Append(wx.ID_ANY, '&Other Databases && Properties',
                                           'Open Other Databases & Properties panel')
         self.Bind(wx.EVT_MENU, self.show_element_properties, databases_item)
+        compare_item = view_menu.Append(wx.ID_ANY, '&Compare Distributions...',
+                                        'Overlay the BE distributions of several filters')
+        self.Bind(wx.EVT_MENU, lambda e: self.get_compare_frame().Raise(), compare_item)
+        facets_item = view_menu.Append(wx.ID_ANY, '&Facets...\tCtrl+F',
+                                       'Filter by line, quality, source, charge reference or journal with live counts')
+        self.Bind(wx.EVT_MENU, self.show_facets, facets_item)
         view_menu.AppendSeparator()
         self.simple_pt_item = view_menu.AppendCheckItem(wx.ID_ANY, '&Simplified Periodic Table',
                                                         'Show element tiles without colours or extra info')
         self.simple_pt_item.Check(self.config.get('simplified_periodic_table', False))
         self.Bind(wx.EVT_MENU, self.on_toggle_simple_pt, self.simple_pt_item)
+
+        # Heat map: colour the tiles by a per-element metric
+        self.heatmap_metric = self.config.get('heatmap_metric', 'off')
+        heatmap_menu = wx.Menu()
+        for metric, label in ElementSummary.METRICS:
+            item = heatmap_menu.AppendRadioItem(wx.ID_ANY, label)
+            item.Check(metric == self.heatmap_metric)
+            self.Bind(wx.EVT_MENU, lambda e, m=metric: self.on_set_heatmap(m), item)
+        view_menu.AppendSubMenu(heatmap_menu, '&Heat Map', 'Colour element tiles by a data metric')
         view_menu.AppendSeparator()
         scholar_delay_item = view_menu.Append(wx.ID_ANY, '&Scholar Tab Load Delay...',
                                               'Set how many seconds before Scholar tabs auto-load')
@@ -212,22 +3082,78 @@ class PeriodicTableXPS(wx.Frame):
         self.SetMenuBar(menubar)
 
     def export_filtered_data(self, event):
-        """Export currently filtered NIST data to a tab-delimited text file"""
-        filtered_df = self.get_filtered_data()
-        if filtered_df.empty:
+        """Export the currently filtered NIST data on a worker thread"""
+        rows = np.flatnonzero(self.get_search_mask().to_numpy())
+        if not len(rows):
             wx.MessageBox("No data to export (current filter returns 0 rows).",
                           "Export", wx.OK | wx.ICON_INFORMATION)
             return
 
+        dlg = ExportDialog(self, list(self.df.columns), self.config.get('export_columns'),
+                           self.config.get('export_format', 'tsv'))
+        if dlg.ShowModal() != wx.ID_OK:
+            dlg.Destroy()
+            return
+        fmt, columns = dlg.get_options()
+        dlg.Destroy()
+        if not columns:
+            wx.MessageBox("Select at least one column to export.", "Export", wx.OK | wx.ICON_INFORMATION)
+            return
+
         # Suggest a filename based on current element / line selection
         element_part = self.selected_element if self.selected_element else "all"
         line_sel = self.line_combo.GetStringSelection()
         line_part = line_sel.replace("/", "-") if line_sel != "All Lines" else "all_lines"
-        default_name = f"NIST_XPS_{element_part}_{line_part}.txt"
+        default_name = f"NIST_XPS_{element_part}_{line_part}{TableExporter.EXTENSIONS[fmt]}"
 
         with wx.FileDialog(
             self, "Export filtered data",
             defaultFile=default_name,
+            wildcard=TableExporter.FORMATS[fmt][1] + "|All files (*.*)|*.*",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
+        ) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+
+        self.config['export_format'] = fmt
+        self.config['export_columns'] = columns
+        self.save_config()
+
+        exporter = TableExporter(self.df, rows, columns, path, fmt)
+        cancel_event = threading.Event()
+        filename = os.path.basename(path)
+        task_id = self.get_task_frame().add_task(f"Exporting {len(rows)} rows to {filename}",
+                                                 on_cancel=cancel_event.set)
+        threading.Thread(target=self._run_export, args=(exporter, task_id, cancel_event), daemon=True).start()
+
+    def _run_export(self, exporter, task_id, cancel_event):
+        """Worker thread for export_filtered_data"""
+        total = len(exporter.rows)
+        filename = os.path.basename(exporter.path)
+
+        def on_progress(done):
+            wx.CallAfter(self._update_task, task_id, done / total, f"{done} of {total} rows")
+
+        try:
+            completed = exporter.run(on_progress, cancel_event)
+        except Exception as e:
+            wx.CallAfter(self._finish_task, task_id, f"Export failed: {e}", False, None)
+            return
+        if not completed:
+            wx.CallAfter(self._finish_task, task_id, "Cancelled", False, None)
+            return
+        wx.CallAfter(self._finish_task, task_id, f"Saved to {exporter.path}", True,
+                     ("Open", lambda: wx.LaunchDefaultApplication(exporter.path)))
+        wx.CallAfter(self.status_text.SetLabel, f"Exported {total} rows to {filename}")
+
+    def export_line_statistics(self, event):
+        """Export the per-(Element, Line) BE statistics to a tab-delimited text file"""
+        if self.index_unavailable('line_stats', "Export Line Statistics"):
+            return
+        with wx.FileDialog(
+            self, "Export line statistics",
+            defaultFile="NIST_XPS_line_statistics.txt",
             wildcard="Text files (*.txt)|*.txt|CSV files (*.csv)|*.csv|All files (*.*)|*.*",
             style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
         ) as dlg:
@@ -237,11 +3163,217 @@ class PeriodicTableXPS(wx.Frame):
 
         try:
             sep = "," if path.lower().endswith(".csv") else "\t"
-            filtered_df.to_csv(path, index=False, sep=sep, encoding='utf-8')
-            self.status_text.SetLabel(f"Exported {len(filtered_df)} rows to {os.path.basename(path)}")
+            self.line_stats.table.reset_index().to_csv(path, index=False, sep=sep, encoding='utf-8',
+                                                        float_format='%.3f')
+            self.status_text.SetLabel(f"Exported statistics for {len(self.line_stats.table)} lines "
+                                      f"to {os.path.basename(path)}")
+        except Exception as e:
+            wx.MessageBox(f"Export failed:\n{e}", "Export Error", wx.OK | wx.ICON_ERROR)
+
+    def export_subset_bundle(self, event):
+        """Save the filtered rows with their indexes as a .kdbundle file"""
+        subset = self.get_filtered_data()
+        if subset.empty:
+            wx.MessageBox("No data to export (current filter returns 0 rows).",
+                          "Export", wx.OK | wx.ICON_INFORMATION)
+            return
+
+        description = self.describe_filters()
+        default_name = re.sub(r'[^A-Za-z0-9._-]+', '_', description).strip('_') + SubsetBundle.EXTENSION
+        with wx.FileDialog(
+            self, "Export subset bundle",
+            defaultFile=default_name,
+            wildcard=f"KherveDB bundles (*{SubsetBundle.EXTENSION})|*{SubsetBundle.EXTENSION}",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
+        ) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+        if not path.endswith(SubsetBundle.EXTENSION):
+            path += SubsetBundle.EXTENSION
+
+        try:
+            with wx.BusyCursor():
+                manifest = SubsetBundle.write(path, subset, description, self.dataset_cache.dataset_hash)
+            self.status_text.SetLabel(f"Saved {manifest['rows']} rows ({format_size(os.path.getsize(path))}) "
+                                      f"to {os.path.basename(path)}")
         except Exception as e:
             wx.MessageBox(f"Export failed:\n{e}", "Export Error", wx.OK | wx.ICON_ERROR)
 
+    def open_subset_bundle(self, event):
+        """Choose a .kdbundle file as the database for the next start"""
+        with wx.FileDialog(
+            self, "Open subset bundle",
+            wildcard=f"KherveDB bundles (*{SubsetBundle.EXTENSION})|*{SubsetBundle.EXTENSION}",
+            style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+        ) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+
+        try:
+            with zipfile.ZipFile(path) as bundle:
+                manifest = json.loads(bundle.read(SubsetBundle.MANIFEST_NAME))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            wx.MessageBox(f"Not a KherveDB bundle:\n{e}", "Open Bundle", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.config['database_path'] = path
+        self.save_config()
+        wx.MessageBox(f"{manifest.get('description') or os.path.basename(path)}\n"
+                      f"{manifest.get('rows', '?')} rows, {len(manifest.get('elements', []))} elements\n\n"
+                      "KherveDB will use this bundle as its database the next time it starts.",
+                      "Open Bundle", wx.OK | wx.ICON_INFORMATION)
+
+    def use_full_database(self, event):
+        """Forget the bundle chosen with Open Subset Bundle"""
+        self.config.pop('database_path', None)
+        self.save_config()
+        wx.MessageBox("KherveDB will use the full NIST database the next time it starts.",
+                      "Database", wx.OK | wx.ICON_INFORMATION)
+
+    def export_atlas(self, event):
+        """Render BE distribution figures for many element/line groups in worker processes"""
+        if self.index_unavailable('histogram_cache', "Export BE Atlas"):
+            return
+        default_dir = os.path.join(str(Path.home() / "Documents"), "KherveDB Atlas")
+        dlg = AtlasExportDialog(self, self.config.get('atlas_dir', default_dir))
+        if dlg.ShowModal() != wx.ID_OK:
+            dlg.Destroy()
+            return
+        options = dlg.get_options()
+        dlg.Destroy()
+
+        if not options['formats']:
+            wx.MessageBox("Select at least one output format.", "Export BE Atlas", wx.OK | wx.ICON_INFORMATION)
+            return
+        try:
+            os.makedirs(options['out_dir'], exist_ok=True)
+        except OSError as e:
+            wx.MessageBox(f"Cannot create the output folder:\n{e}", "Export BE Atlas", wx.OK | wx.ICON_ERROR)
+            return
+        self.config['atlas_dir'] = options['out_dir']
+        self.save_config()
+
+        # Groups in periodic table order
+        if options['scope'] == 0:
+            keys = list(self.histogram_cache.groups)
+        elif options['scope'] == 1:
+            keys = self.histogram_cache.group_keys(self.selected_element)
+        else:
+            line = self.line_combo.GetStringSelection()
+            keys = self.histogram_cache.group_keys(self.selected_element, None if line == 'All Lines' else line)
+        keys = [key for key in keys if self.histogram_cache.groups[key][4] >= options['min_count']]
+        keys.sort(key=lambda key: (self.get_atomic_number(key[0]) or 999, key[0], key[1]))
+        if not keys:
+            wx.MessageBox("No element/line group has enough references.", "Export BE Atlas",
+                          wx.OK | wx.ICON_INFORMATION)
+            return
+
+        cancel_event = threading.Event()
+        self._atlas_cancel = cancel_event
+        task_id = self.get_task_frame().add_task(f"Exporting BE atlas ({len(keys)} plots)",
+                                                 on_cancel=cancel_event.set)
+        threading.Thread(target=self._run_atlas_export, args=(keys, options, task_id, cancel_event),
+                         daemon=True).start()
+
+    def _atlas_task(self, key, options):
+        """Binned data and statistics for one group, ready to send to a worker process"""
+        histogram = self.histogram_cache.for_groups([key])
+        resolution = options['resolution']
+        counts, edges = histogram.histogram(resolution)
+        kde = histogram.kde()
+        stats = self.line_stats.get(*key) if self.line_stats is not None else None
+        stats = {'count': histogram.n} if stats is None else {
+            name: (None if pd.isna(stats[name]) else float(stats[name]))
+            for name in ('median', 'q25', 'q75', 'mad', 'std')}
+        stats['count'] = histogram.n
+        return {'element': key[0], 'line': key[1], 'edges': edges, 'counts': counts,
+                'kde_x': kde[0] if kde else None,
+                'kde_y': kde[1] * histogram.n * resolution if kde else None,
+                'stats': stats, 'resolution': resolution,
+                'out_dir': options['out_dir'], 'formats': options['formats']}
+
+    def _run_atlas_export(self, keys, options, task_id, cancel_event):
+        """Background thread: feed the process pool and collect results"""
+        entries = {}
+        errors = 0
+        workers = self.config.get('atlas_workers') or os.cpu_count() or 2
+        try:
+            # Payloads are built lazily on this thread while the pool renders earlier groups
+            tasks = (self._atlas_task(key, options) for key in keys)
+            for done, (task, result, error) in enumerate(atlas.render_groups(tasks, workers, cancel_event),
+                                                         start=1):
+                key, stats = (task['element'], task['line']), task['stats']
+                if error is None:
+                    entries[key] = {'element': key[0], 'line': key[1], 'count': stats['count'],
+                                    'median': stats.get('median'), 'files': result[1]}
+                else:
+                    errors += 1
+                    print(f"Atlas export failed for {key}: {error}")
+                wx.CallAfter(self._update_task, task_id, done / len(keys),
+                             f"{done} of {len(keys)} plots ({key[0]} {key[1]})")
+
+            index_path = atlas.write_index(options['out_dir'], [entries[key] for key in keys if key in entries])
+        except Exception as e:
+            wx.CallAfter(self._finish_task, task_id, f"Atlas export failed: {e}", False, None)
+            return
+
+        if cancel_event.is_set():
+            text, success = f"Cancelled after {len(entries)} plots", False
+        else:
+            text, success = f"{len(entries)} plots written" + (f", {errors} failed" if errors else ""), not errors
+        wx.CallAfter(self._finish_task, task_id, text, success,
+                     ("Open Index", lambda: wx.LaunchDefaultApplication(index_path)))
+
+    def _finish_task(self, task_id, text, success, action):
+        if self.task_frame:
+            self.task_frame.finish_task(task_id, text, success=success, action=action)
+
+    def on_set_heatmap(self, metric):
+        """Switch the periodic table heat map metric and save it to config"""
+        self.heatmap_metric = metric
+        self.config['heatmap_metric'] = metric
+        self.save_config()
+        self.apply_heatmap()
+        if metric != 'off':
+            label = dict(ElementSummary.METRICS)[metric]
+            self.status_text.SetLabel(f"Heat map: {label} (light = low, dark red = high)")
+
+    def heatmap_colors(self):
+        """Tile colour per element for the current heat map metric"""
+        metric = self.heatmap_metric
+        if metric == 'off' or getattr(self, 'element_summary', None) is None:
+            return self.tile_colors
+
+        mask = self.get_search_mask(include_element=False) if metric == 'matches' else None
+        values = self.element_summary.metric(metric, mask).reindex(list(self.tile_colors)).astype(float)
+        if metric in ElementSummary.LOG_SCALED:
+            values = np.log1p(values)
+        vmax = values.max()
+
+        colormap = matplotlib.colormaps['YlOrRd']
+        colors = {}
+        for element, value in values.items():
+            if pd.isna(value) or value <= 0 or not vmax > 0:
+                colors[element] = "#EEEEEE"
+            else:
+                colors[element] = matplotlib.colors.to_hex(colormap(0.1 + 0.9 * value / vmax))
+        return colors
+
+    def apply_heatmap(self):
+        """Push heat map (or category) colours to all tiles in one batched repaint"""
+        if not getattr(self, 'element_buttons', None):
+            return
+        colors = self.heatmap_colors()
+        heatmap = self.heatmap_metric != 'off'
+        self.pt_panel.Freeze()
+        try:
+            for element, btn in self.element_buttons.items():
+                btn.set_color(colors.get(element, self.tile_colors[element]), heatmap=heatmap)
+        finally:
+            self.pt_panel.Thaw()
+
     def on_toggle_simple_pt(self, event):
         """Toggle simplified periodic table view and save to config"""
         simplified = self.simple_pt_item.IsChecked()
@@ -276,8 +3408,7 @@ class PeriodicTableXPS(wx.Frame):
         """Redraw all element tiles to reflect the current simplified/full mode"""
         simplified = self.config.get('simplified_periodic_table', False)
         for element, btn in self.element_buttons.items():
-            btn.simplified = simplified
-            btn.Refresh()
+            btn.set_simplified(simplified)
 
     def show_about(self, event):
         """Display information about the application"""
@@ -338,7 +3469,11 @@ Version: 4.0"""
         else:
             base_path = os.path.dirname(os.path.abspath(__file__))
 
-        possible_paths = [
+        # Only a bundle the user chose in File > Open Subset Bundle replaces the full database;
+        # "Use Full NIST Database" clears it
+        bundle_paths = [self.config['database_path']] if self.config.get('database_path') else []
+
+        possible_paths = bundle_paths + [
             os.path.join(base_path, "NIST_BE.parquet"),
             os.path.join(base_path, "libraries", "NIST_BE.parquet"),
             os.path.join(base_path, "..", "Resources", "NIST_BE.parquet"),  # Mac app bundle
@@ -348,10 +3483,17 @@ Version: 4.0"""
         ]
 
         data_found = False
+        failed_bundle = None
         for data_path in possible_paths:
             if os.path.exists(data_path):
                 try:
-                    if data_path.endswith('.parquet'):
+                    self.dataset_cache = DatasetCache(file_hash(data_path))
+                    self.bundle_manifest = None
+                    if data_path.endswith(SubsetBundle.EXTENSION):
+                        self.df, self.bundle_manifest = SubsetBundle.read(data_path, self.dataset_cache)
+                        print(f'Loaded the subset bundle {os.path.basename(data_path)}')
+                        self.SetTitle(f"{self.GetTitle()} - {self.bundle_manifest.get('description') or os.path.basename(data_path)}")
+                    elif data_path.endswith('.parquet'):
                         self.df = pd.read_parquet(data_path)
                         print(f'Loaded the .parquet NIST library')
                     else:
@@ -360,15 +3502,77 @@ Version: 4.0"""
 
                     self.elements = sorted(self.df['Element'].unique())
                     self.lines = sorted(self.df['Line'].unique())
+                    self.data_path = data_path
                     data_found = True
                     break
                 except Exception as e:
+                    print(f"Could not load {data_path}: {e}")
+                    if data_path in bundle_paths:
+                        failed_bundle = f"{os.path.basename(data_path)}: {e}"
                     continue
 
         if not data_found:
-            wx.MessageBox("Failed to load data: NIST_BE file not found",
+            wx.MessageBox("Failed to load data: no readable NIST_BE file found",
                           "Error", wx.OK | wx.ICON_ERROR)
             self.Close()
+            return
+
+        self.build_indexes()
+        if failed_bundle:
+            wx.MessageBox(f"Could not open the subset bundle\n{failed_bundle}\n\n"
+                          "The full NIST database is used instead.", "Open Bundle", wx.OK | wx.ICON_WARNING)
+
+    def build_indexes(self):
+        """Derived indexes of the loaded data, each built on its own.
+
+        An index that fails to build is left as None and only disables its feature
+        (its controls are greyed out with the error as tooltip); the data stays usable.
+        """
+        self.index_errors = {}  # attribute name -> error message
+
+        def build(name, factory):
+            try:
+                return factory()
+            except Exception as e:
+                print(f"Could not build the {name} index: {e}")
+                self.index_errors[name] = str(e)
+                return None
+
+        self.main_lines = build('main_lines', self.load_main_lines) or {}
+        self.line_stats = build('line_stats', lambda: LineStatistics.load(self.df, self.dataset_cache))
+        self.element_summary = build('element_summary',
+                                     lambda: ElementSummary(self.df, self.line_stats, self.main_lines))
+        self.citations = build('citations', lambda: CitationIndex.load(self.df, self.dataset_cache))
+        self.author_index = build('author_index', lambda: AuthorIndex(self.df['Author']))
+        self.metadata = build('metadata', lambda: NumericMetadata.load(self.df, self.dataset_cache))
+        # The Journal facet uses the parsed abbreviations, so it needs the citation index
+        self.facets = build('facets', lambda: FacetIndex(OrderedDict(
+            (label, self.citations.table['Journal Abbrev'] if column == 'Journal' else self.df[column])
+            for label, column in self.FACET_FIELDS.items()
+            if column in self.df.columns and (column != 'Journal' or self.citations is not None))))
+        self.fulltext_index = build('fulltext_index', lambda: FullTextIndex(self.dataset_cache))
+        if self.fulltext_index is None:
+            self._fulltext_state = 'failed'
+        else:
+            self._fulltext_state = 'ready' if self.fulltext_index.is_ready() else None
+        self.histogram_cache = build('histogram_cache', lambda: BEHistogramCache(self.df))
+        self.be_index = build('be_index', lambda: SortedIndex(self.df['BE (eV)'].to_numpy()))
+
+    def index_unavailable(self, name, feature):
+        """True (after telling the user why) if the index a feature needs failed to build"""
+        if getattr(self, name, None) is not None:
+            return False
+        wx.MessageBox(f"{feature} is not available:\n{self.index_errors.get(name, 'the data has not been loaded')}",
+                      feature, wx.OK | wx.ICON_WARNING)
+        return True
+
+    def load_main_lines(self):
+        """Data-derived main line and median BE per element, cached per dataset"""
+        main_lines = self.dataset_cache.load_json(MAIN_LINES_CACHE_NAME)
+        if main_lines is None:
+            main_lines = compute_main_lines(self.df)
+            self.dataset_cache.save_json(MAIN_LINES_CACHE_NAME, main_lines)
+        return main_lines
 
     def create_periodic_table(self):
         """Create the periodic table with colored buttons"""
@@ -413,10 +3617,13 @@ Version: 4.0"""
         element_categories = self.get_element_categories()
 
         # Create buttons for each element
+        self.pt_panel = pt_panel
         self.element_buttons = {}
+        self.tile_colors = {}
         for element, (row, col) in self.element_positions.items():
             category = element_categories.get(element, 'unknown')
             color = colors.get(category, colors['unknown'])
+            self.tile_colors[element] = color
 
             # Create button
             btn = self.create_element_button(pt_panel, element, color)
@@ -445,73 +3652,21 @@ Version: 4.0"""
 
     def get_atomic_number(self, element_symbol):
         """Get atomic number for an element"""
-        atomic_numbers = {
-            'H': 1, 'He': 2, 'Li': 3, 'Be': 4, 'B': 5, 'C': 6, 'N': 7, 'O': 8, 'F': 9, 'Ne': 10,
-            'Na': 11, 'Mg': 12, 'Al': 13, 'Si': 14, 'P': 15, 'S': 16, 'Cl': 17, 'Ar': 18,
-            'K': 19, 'Ca': 20, 'Sc': 21, 'Ti': 22, 'V': 23, 'Cr': 24, 'Mn': 25, 'Fe': 26,
-            'Co': 27, 'Ni': 28, 'Cu': 29, 'Zn': 30, 'Ga': 31, 'Ge': 32, 'As': 33, 'Se': 34,
-            'Br': 35, 'Kr': 36, 'Rb': 37, 'Sr': 38, 'Y': 39, 'Zr': 40, 'Nb': 41, 'Mo': 42,
-            'Tc': 43, 'Ru': 44, 'Rh': 45, 'Pd': 46, 'Ag': 47, 'Cd': 48, 'In': 49, 'Sn': 50,
-            'Sb': 51, 'Te': 52, 'I': 53, 'Xe': 54, 'Cs': 55, 'Ba': 56, 'La': 57, 'Ce': 58,
-            'Pr': 59, 'Nd': 60, 'Pm': 61, 'Sm': 62, 'Eu': 63, 'Gd': 64, 'Tb': 65, 'Dy': 66,
-            'Ho': 67, 'Er': 68, 'Tm': 69, 'Yb': 70, 'Lu': 71, 'Hf': 72, 'Ta': 73, 'W': 74,
-            'Re': 75, 'Os': 76, 'Ir': 77, 'Pt': 78, 'Au': 79, 'Hg': 80, 'Tl': 81, 'Pb': 82,
-            'Bi': 83, 'Po': 84, 'At': 85, 'Rn': 86, 'Fr': 87, 'Ra': 88, 'Ac': 89, 'Th': 90,
-            'Pa': 91, 'U': 92, 'Np': 93, 'Pu': 94, 'Am': 95, 'Cm': 96, 'Bk': 97, 'Cf': 98,
-            'Es': 99, 'Fm': 100, 'Md': 101, 'No': 102, 'Lr': 103, 'Rf': 104, 'Db': 105,
-            'Sg': 106, 'Bh': 107, 'Hs': 108, 'Mt': 109, 'Ds': 110, 'Rg': 111, 'Cn': 112,
-            'Nh': 113, 'Fl': 114, 'Mc': 115, 'Lv': 116, 'Ts': 117, 'Og': 118
-        }
-        return atomic_numbers.get(element_symbol, 0)
+        return get_element_record(element_symbol).atomic_number
 
     def get_main_core_level(self, element_symbol):
-        """Get the main XPS core level for an element"""
-        core_levels = {
-            'H': 'N.D.', 'He': 'N.D.', 'Li': '1s', 'Be': '1s', 'B': '1s', 'C': '1s', 'N': '1s', 'O': '1s', 'F': '1s',
-            'Ne': '1s',
-            'Na': '1s', 'Mg': '2p', 'Al': '2p', 'Si': '2p', 'P': '2p3/2', 'S': '2p3/2', 'Cl': '2p3/2', 'Ar': '2p3/2',
-            'K': '2p3/2', 'Ca': '2p3/2', 'Sc': '2p3/2', 'Ti': '2p3/2', 'V': '2p3/2', 'Cr': '2p3/2', 'Mn': '2p3/2',
-            'Fe': '2p3/2',
-            'Co': '2p3/2', 'Ni': '2p3/2', 'Cu': '2p3/2', 'Zn': '2p3/2', 'Ga': '2p3/2', 'Ge': '3d', 'As': '3d5/2',
-            'Se': '3d5/2',
-            'Br': '3d5/2', 'Kr': '3d5/2', 'Rb': '3d5/2', 'Sr': '3d5/2', 'Y': '3d5/2', 'Zr': '3d5/2', 'Nb': '3d5/2',
-            'Mo': '3d5/2',
-            'Tc': '3d5/2', 'Ru': '3d5/2', 'Rh': '3d5/2', 'Pd': '3d5/2', 'Ag': '3d5/2', 'Cd': '3d5/2', 'In': '3d5/2',
-            'Sn': '3d5/2',
-            'Sb': '3d5/2', 'Te': '3d5/2', 'I': '3d5/2', 'Xe': '3d5/2', 'Cs': '3d5/2', 'Ba': '3d5/2', 'La': '3d5/2',
-            'Ce': '3d5/2',
-            'Pr': '3d5/2', 'Nd': '3d5/2', 'Pm': '3d5/2', 'Sm': '3d5/2', 'Eu': '3d5/2', 'Gd': '4d', 'Tb': '4d',
-            'Dy': '4d',
-            'Ho': '4d', 'Er': '4d', 'Tm': '4d', 'Yb': '4d', 'Lu': '4f7/2', 'Hf': '4f7/2', 'Ta': '4f7/2', 'W': '4f7/2',
-            'Re': '4f7/2', 'Os': '4f7/2', 'Ir': '4f7/2', 'Pt': '4f7/2', 'Au': '4f7/2', 'Hg': '4f7/2', 'Tl': '4f7/2',
-            'Pb': '4f7/2',
-            'Bi': '4f7/2', 'Po': '4f7/2', 'At': '4f7/2', 'Rn': '4f7/2', 'Fr': '4f7/2', 'Ra': '4f7/2', 'Ac': '4f7/2',
-            'Th': '4f7/2',
-            'Pa': '4f7/2', 'U': '4f7/2', 'Np': '4f7/2', 'Pu': '4f7/2', 'Am': '4f7/2', 'Cm': '4f7/2', 'Bk': '4f7/2',
-            'Cf': '4f7/2',
-            'Es': '4f7/2', 'Fm': '4f7/2', 'Md': '4f7/2', 'No': '4f7/2', 'Lr': '4f7/2'
-        }
-        return core_levels.get(element_symbol, 'N.D.')
+        """Get the main XPS core level for an element (most-referenced line in the data)"""
+        main_line = getattr(self, 'main_lines', {}).get(element_symbol)
+        if main_line:
+            return main_line[0]
+        return get_element_record(element_symbol).main_core_level
 
     def get_main_core_binding_energy(self, element_symbol):
-        """Get the binding energy (eV) for the main XPS core level of an element"""
-        binding_energies = {
-            'H': 'N.D.', 'He': 'N.D.', 'Li': '56', 'Be': '112', 'B': '189', 'C': '285', 'N': '398', 'O': '531',
-            'F': '685', 'Ne': '863',
-            'Na': '1072', 'Mg': '50', 'Al': '73', 'Si': '99', 'P': '130', 'S': '164', 'Cl': '199', 'Ar': '242',
-            'K': '294', 'Ca': '347', 'Sc': '399', 'Ti': '454', 'V': '512', 'Cr': '574', 'Mn': '639', 'Fe': '707',
-            'Co': '778', 'Ni': '853', 'Cu': '933', 'Zn': '1022', 'Ga': '1117', 'Ge': '29', 'As': '42', 'Se': '57',
-            'Br': '69', 'Kr': '87', 'Rb': '111', 'Sr': '134', 'Y': '158', 'Zr': '179', 'Nb': '202', 'Mo': '228',
-            'Tc': 'N.D.', 'Ru': '280', 'Rh': '307', 'Pd': '335', 'Ag': '368', 'Cd': '405', 'In': '444', 'Sn': '485',
-            'Sb': '528', 'Te': '573', 'I': '619', 'Xe': '670', 'Cs': '726', 'Ba': '781', 'La': '836', 'Ce': '884',
-            'Pr': '932', 'Nd': '981', 'Pm': '1033', 'Sm': '1081', 'Eu': '1126', 'Gd': '140', 'Tb': '146', 'Dy': '152',
-            'Ho': '160', 'Er': '167', 'Tm': '175', 'Yb': '182', 'Lu': '7', 'Hf': '14', 'Ta': '22', 'W': '31',
-            'Re': '40', 'Os': '51', 'Ir': '61', 'Pt': '71', 'Au': '84', 'Hg': '101', 'Tl': '118', 'Pb': '137',
-            'Bi': '157', 'Po': 'N.D.', 'At': 'N.D.', 'Rn': 'N.D.', 'Fr': 'N.D.', 'Ra': 'N.D.', 'Ac': '307', 'Th': '333',
-            'Pa': '358', 'U': '377', 'Np': '403', 'Pu': '425', 'Am': '448', 'Cm': '472', 'Bk': '499', 'Cf': '523',
-            'Es': '550', 'Fm': 'N.D.', 'Md': 'N.D.', 'No': 'N.D.', 'Lr': 'N.D.'
-        }
-        return binding_energies.get(element_symbol, 'N.D.')
+        """Get the binding energy (eV) for the main XPS core level of an element (median in the data)"""
+        main_line = getattr(self, 'main_lines', {}).get(element_symbol)
+        if main_line:
+            return f"{main_line[1]:.0f}" if main_line[1] is not None else 'N.D.'
+        return get_element_record(element_symbol).main_core_binding_energy
 
     def create_element_button(self, parent, element, color):
         """Create a colored tile for an element"""
@@ -529,145 +3684,18 @@ Version: 4.0"""
         # Set callbacks
         tile.set_click_callback(self.select_element)
         tile.set_double_click_callback(self.on_element_double_click)
+        if getattr(self, 'element_summary', None) is not None:
+            tile.set_tooltip_callback(self.element_summary.tooltip)
 
         return tile
 
     def get_element_positions(self) -> Dict[str, Tuple[int, int]]:
         """Define positions for elements in the periodic table grid"""
-        positions = {}
-
-        # Period 1
-        positions['H'] = (0, 0)
-        positions['He'] = (0, 17)
-
-        # Period 2
-        positions['Li'] = (1, 0)
-        positions['Be'] = (1, 1)
-        positions['B'] = (1, 12)
-        positions['C'] = (1, 13)
-        positions['N'] = (1, 14)
-        positions['O'] = (1, 15)
-        positions['F'] = (1, 16)
-        positions['Ne'] = (1, 17)
-
-        # Period 3
-        positions['Na'] = (2, 0)
-        positions['Mg'] = (2, 1)
-        positions['Al'] = (2, 12)
-        positions['Si'] = (2, 13)
-        positions['P'] = (2, 14)
-        positions['S'] = (2, 15)
-        positions['Cl'] = (2, 16)
-        positions['Ar'] = (2, 17)
-
-        # Period 4
-        positions['K'] = (3, 0)
-        positions['Ca'] = (3, 1)
-        for i, symbol in enumerate(['Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn']):
-            positions[symbol] = (3, i + 2)
-        positions['Ga'] = (3, 12)
-        positions['Ge'] = (3, 13)
-        positions['As'] = (3, 14)
-        positions['Se'] = (3, 15)
-        positions['Br'] = (3, 16)
-        positions['Kr'] = (3, 17)
-
-        # Period 5
-        positions['Rb'] = (4, 0)
-        positions['Sr'] = (4, 1)
-        for i, symbol in enumerate(['Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd']):
-            positions[symbol] = (4, i + 2)
-        positions['In'] = (4, 12)
-        positions['Sn'] = (4, 13)
-        positions['Sb'] = (4, 14)
-        positions['Te'] = (4, 15)
-        positions['I'] = (4, 16)
-        positions['Xe'] = (4, 17)
-
-        # Period 6
-        positions['Cs'] = (5, 0)
-        positions['Ba'] = (5, 1)
-        positions['La'] = (5, 2)
-        for i, symbol in enumerate(['Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg']):
-            positions[symbol] = (5, i + 3)
-        positions['Tl'] = (5, 12)
-        positions['Pb'] = (5, 13)
-        positions['Bi'] = (5, 14)
-        positions['Po'] = (5, 15)
-        positions['At'] = (5, 16)
-        positions['Rn'] = (5, 17)
-
-        # Period 7
-        positions['Fr'] = (6, 0)
-        positions['Ra'] = (6, 1)
-        positions['Ac'] = (6, 2)
-        for i, symbol in enumerate(['Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn']):
-            positions[symbol] = (6, i + 3)
-        positions['Nh'] = (6, 12)
-        positions['Fl'] = (6, 13)
-        positions['Mc'] = (6, 14)
-        positions['Lv'] = (6, 15)
-        positions['Ts'] = (6, 16)
-        positions['Og'] = (6, 17)
-
-        # Lanthanides
-        lanthanides = ['La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
-        for i, symbol in enumerate(lanthanides):
-            positions[symbol] = (8, i + 2)
-
-        # Actinides
-        actinides = ['Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr']
-        for i, symbol in enumerate(actinides):
-            positions[symbol] = (9, i + 2)
-
-        return positions
+        return ELEMENT_POSITIONS
 
     def get_element_categories(self):
         """Return element categories for coloring"""
-        element_categories = {
-            'H': 'nonmetal', 'He': 'noble_gas',
-            'Li': 'alkali_metal', 'Be': 'alkaline_earth',
-            'B': 'metalloid', 'C': 'nonmetal', 'N': 'nonmetal', 'O': 'nonmetal',
-            'F': 'halogen', 'Ne': 'noble_gas',
-            'Na': 'alkali_metal', 'Mg': 'alkaline_earth',
-            'Al': 'post_transition', 'Si': 'metalloid', 'P': 'nonmetal',
-            'S': 'nonmetal', 'Cl': 'halogen', 'Ar': 'noble_gas',
-            'K': 'alkali_metal', 'Ca': 'alkaline_earth',
-            'Sc': 'transition_metal', 'Ti': 'transition_metal', 'V': 'transition_metal',
-            'Cr': 'transition_metal', 'Mn': 'transition_metal', 'Fe': 'transition_metal',
-            'Co': 'transition_metal', 'Ni': 'transition_metal', 'Cu': 'transition_metal',
-            'Zn': 'transition_metal', 'Ga': 'post_transition', 'Ge': 'metalloid',
-            'As': 'metalloid', 'Se': 'nonmetal', 'Br': 'halogen', 'Kr': 'noble_gas',
-            'Rb': 'alkali_metal', 'Sr': 'alkaline_earth',
-            'Y': 'transition_metal', 'Zr': 'transition_metal', 'Nb': 'transition_metal',
-            'Mo': 'transition_metal', 'Tc': 'transition_metal', 'Ru': 'transition_metal',
-            'Rh': 'transition_metal', 'Pd': 'transition_metal', 'Ag': 'transition_metal',
-            'Cd': 'transition_metal', 'In': 'post_transition', 'Sn': 'post_transition',
-            'Sb': 'metalloid', 'Te': 'metalloid', 'I': 'halogen', 'Xe': 'noble_gas',
-            'Cs': 'alkali_metal', 'Ba': 'alkaline_earth',
-            'Hf': 'transition_metal', 'Ta': 'transition_metal', 'W': 'transition_metal',
-            'Re': 'transition_metal', 'Os': 'transition_metal', 'Ir': 'transition_metal',
-            'Pt': 'transition_metal', 'Au': 'transition_metal', 'Hg': 'transition_metal',
-            'Tl': 'post_transition', 'Pb': 'post_transition', 'Bi': 'post_transition',
-            'Po': 'metalloid', 'At': 'halogen', 'Rn': 'noble_gas',
-            'Fr': 'alkali_metal', 'Ra': 'alkaline_earth',
-            'Rf': 'transition_metal', 'Db': 'transition_metal', 'Sg': 'transition_metal',
-            'Bh': 'transition_metal', 'Hs': 'transition_metal', 'Mt': 'transition_metal',
-            'Ds': 'transition_metal', 'Rg': 'transition_metal', 'Cn': 'transition_metal',
-            'Nh': 'post_transition', 'Fl': 'post_transition', 'Mc': 'post_transition',
-            'Lv': 'post_transition', 'Ts': 'post_transition', 'Og': 'noble_gas'
-        }
-
-        # Add lanthanides and actinides
-        lanthanides = ['La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
-        actinides = ['Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr']
-
-        for element in lanthanides:
-            element_categories[element] = 'lanthanide'
-        for element in actinides:
-            element_categories[element] = 'actinide'
-
-        return element_categories
+        return {symbol: record.category for symbol, record in ELEMENT_REGISTRY.items()}
 
     def create_search_area(self):
         """Create the search interface"""
@@ -707,6 +3735,16 @@ Version: 4.0"""
         self.line_combo.Bind(wx.EVT_COMBOBOX, self.on_line_selected)
         left_sizer.Add(self.line_combo, pos=(1, 1), flag=wx.EXPAND)
 
+        # Journal selection (abbreviations parsed from the citations)
+        left_sizer.Add(wx.StaticText(search_panel, label="Journal:"),
+                       pos=(2, 0), flag=wx.ALIGN_CENTER_VERTICAL)
+        journals = list(self.citations.journals) if self.citations is not None else []
+        self.journal_combo = wx.ComboBox(search_panel, choices=['All Journals'] + journals,
+                                         style=wx.CB_READONLY, size=(120, -1))
+        self.journal_combo.SetSelection(0)
+        self.journal_combo.Bind(wx.EVT_COMBOBOX, self.on_search_change)
+        left_sizer.Add(self.journal_combo, pos=(2, 1), flag=wx.EXPAND)
+
         # Right side controls
         right_sizer = wx.GridBagSizer(5, 5)
 
@@ -724,6 +3762,40 @@ Version: 4.0"""
         self.name_search.Bind(wx.EVT_TEXT, self.on_search_change)
         right_sizer.Add(self.name_search, pos=(1, 1), flag=wx.EXPAND)
 
+        # Author search (surname tokens, inverted index)
+        right_sizer.Add(wx.StaticText(search_panel, label="Search Author:"),
+                        pos=(2, 0), flag=wx.ALIGN_CENTER_VERTICAL)
+        self.author_search = wx.TextCtrl(search_panel)
+        self.author_search.SetToolTip("Author surnames, e.g. 'Briggs' or 'Biesinger Payne'")
+        self.author_search.Bind(wx.EVT_TEXT, self.on_search_change)
+        right_sizer.Add(self.author_search, pos=(2, 1), flag=wx.EXPAND)
+
+        # Ranked full-text search over notes, specimen and method descriptions
+        right_sizer.Add(wx.StaticText(search_panel, label="Search Text:"),
+                        pos=(3, 0), flag=wx.ALIGN_CENTER_VERTICAL)
+        self.text_search = wx.TextCtrl(search_panel)
+        self.text_search.SetToolTip("Words in " + ", ".join(FullTextIndex.COLUMNS) +
+                                    ", e.g. 'sputtered argon' or 'Shirley'. Best matches are listed first.")
+        self.text_search.Bind(wx.EVT_TEXT, self.on_search_change)
+        right_sizer.Add(self.text_search, pos=(3, 1), flag=wx.EXPAND)
+
+        # Publication year range (the full range means no filter)
+        right_sizer.Add(wx.StaticText(search_panel, label="Year:"),
+                        pos=(4, 0), flag=wx.ALIGN_CENTER_VERTICAL)
+        years = self.citations.year_index.sorted_values if self.citations is not None else []
+        self.year_bounds = (int(years[0]), int(years[-1])) if len(years) else (1900, 2100)
+        year_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.year_from = wx.SpinCtrl(search_panel, min=self.year_bounds[0], max=self.year_bounds[1],
+                                     initial=self.year_bounds[0], size=(70, -1))
+        self.year_to = wx.SpinCtrl(search_panel, min=self.year_bounds[0], max=self.year_bounds[1],
+                                   initial=self.year_bounds[1], size=(70, -1))
+        for spin in (self.year_from, self.year_to):
+            spin.Bind(wx.EVT_SPINCTRL, self.on_search_change)
+        year_sizer.Add(self.year_from, 0, wx.RIGHT, 4)
+        year_sizer.Add(wx.StaticText(search_panel, label="to"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
+        year_sizer.Add(self.year_to)
+        right_sizer.Add(year_sizer, pos=(4, 1), flag=wx.EXPAND)
+
         # Buttons
         self.properties_btn = wx.Button(search_panel, label="Other Databases && Properties")
         self.properties_btn.Bind(wx.EVT_BUTTON, self.show_element_properties)
@@ -733,6 +3805,30 @@ Version: 4.0"""
         self.plot_btn.Bind(wx.EVT_BUTTON, self.plot_results)
         right_sizer.Add(self.plot_btn, pos=(1, 2))
 
+        self.years_btn = wx.Button(search_panel, label="Publications per Year")
+        self.years_btn.Bind(wx.EVT_BUTTON, self.show_year_histogram)
+        right_sizer.Add(self.years_btn, pos=(2, 2))
+
+        self.range_btn = wx.Button(search_panel, label="Metadata Filters...")
+        self.range_btn.SetToolTip("Filter by FWHM, energy uncertainty, X-ray source, temperature...")
+        self.range_btn.Bind(wx.EVT_BUTTON, self.show_range_filters)
+        right_sizer.Add(self.range_btn, pos=(3, 2))
+
+        self.facets_btn = wx.Button(search_panel, label="Facets...")
+        self.facets_btn.SetToolTip("Narrow the results by line, quality, X-ray source, charge reference, journal...")
+        self.facets_btn.Bind(wx.EVT_BUTTON, self.show_facets)
+        right_sizer.Add(self.facets_btn, pos=(4, 2))
+
+        # Grey out the controls whose index failed to build (see build_indexes)
+        for control, name in ((self.journal_combo, 'citations'), (self.year_from, 'citations'),
+                              (self.year_to, 'citations'), (self.years_btn, 'citations'),
+                              (self.author_search, 'author_index'), (self.text_search, 'fulltext_index'),
+                              (self.range_btn, 'metadata'), (self.facets_btn, 'facets'),
+                              (self.plot_btn, 'histogram_cache')):
+            if name in self.index_errors:
+                control.Enable(False)
+                control.SetToolTip(f"Not available: {self.index_errors[name]}")
+
         # Add to main sizer
         search_sizer.Add(left_sizer, 0, wx.ALL, 10)
         search_sizer.Add(right_sizer, 1, wx.ALL | wx.EXPAND, 10)
@@ -749,7 +3845,7 @@ Version: 4.0"""
 
         # Create grid
         self.results_grid = wx.grid.Grid(results_panel)
-        self.results_grid.CreateGrid(0, 6)
+        self.results_grid.CreateGrid(0, 7)
 
         # Set font for the grid (decrease default size by 1)
         default_font = self.results_grid.GetDefaultCellFont()
@@ -766,26 +3862,29 @@ Version: 4.0"""
         self.results_grid.HideRowLabels()
 
         # Set column labels and platform-specific widths
-        col_labels = ["", "Line", "BE (eV)", "Formula", "Name", "Journal"]
+        col_labels = ["", "Line", "BE (eV)", "Formula", "Name", "Journal", "Year"]
 
         # Platform-specific column widths
         import platform
         if platform.system() == 'Darwin':  # macOS
-            col_widths = [25, 50, 60, 100, 200, 228]
+            col_widths = [25, 50, 60, 100, 200, 188, 40]
         else:  # Windows and other systems
-            col_widths = [25, 50, 60, 110, 190, 228]  # Slightly wider for Windows
+            col_widths = [25, 50, 60, 110, 190, 188, 40]  # Slightly wider for Windows
 
         for i, (label, width) in enumerate(zip(col_labels, col_widths)):
             self.results_grid.SetColLabelValue(i, label)
             self.results_grid.SetColSize(i, width)
 
-        # Make grid read-only
+        # Make grid read-only; whole rows are selected (shift/ctrl-click for several)
         self.results_grid.EnableEditing(False)
+        self.results_grid.SetSelectionMode(wx.grid.Grid.GridSelectRows)
+        self._grid_index = np.empty(0, dtype=np.int64)  # grid row -> self.df row label
 
         # Bind events
         self.results_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_grid_double_click)
         self.results_grid.Bind(wx.grid.EVT_GRID_CELL_RIGHT_CLICK, self.on_grid_right_click)
         self.results_grid.Bind(wx.grid.EVT_GRID_LABEL_LEFT_CLICK, self.on_column_click)
+        self.results_grid.Bind(wx.EVT_KEY_DOWN, self.on_grid_key)
 
         # Status bar
         self.status_text = wx.StaticText(results_panel, label="Ready")
@@ -844,10 +3943,31 @@ Version: 4.0"""
 
         self.update_results()
 
+        # A real navigation stops any prefetch in progress
+        self.prefetcher.note_navigation(element)
+
         # Update existing property dialog if it's open
         if self.property_dialog and self.property_dialog.IsShown():
             self.property_dialog.update_element(element)
             self.property_dialog.Raise()
+            self.schedule_prefetch(element)
+
+    def schedule_prefetch(self, element):
+        """Start prefetching likely next elements once the UI has been idle for a moment"""
+        if not self.config.get('prefetch_enabled', True):
+            return
+        if self._prefetch_timer:
+            self._prefetch_timer.Stop()
+        self._prefetch_timer = wx.CallLater(self.config.get('prefetch_idle_ms', 1500),
+                                            self._start_prefetch, element)
+
+    def _start_prefetch(self, element):
+        self._prefetch_timer = None
+        if element != self.selected_element:
+            return
+        if not self.property_dialog or not self.property_dialog.IsShown():
+            return
+        self.prefetcher.start(element, self.property_dialog.get_reference_urls, allowed=set(self.elements))
 
     def on_element_double_click(self, element):
         """Handle double-click on element"""
@@ -867,11 +3987,23 @@ Version: 4.0"""
 
     def get_filtered_data(self):
         """Get filtered dataframe based on current selections"""
+        return self.df[self.get_search_mask()]
+
+    def get_search_mask(self, include_element=True, include_be_range=True, include_facets=True):
+        """Boolean row mask for the current selections (optionally ignoring the element, BE window or facets)"""
         # Build a boolean mask without copying the full DataFrame
         mask = pd.Series([True] * len(self.df), index=self.df.index)
 
+        # Filter by the BE window brushed on a plot (binary search on the sorted BE index)
+        be_range = getattr(self, 'be_range', None)
+        if include_be_range and be_range:
+            if self.be_index is not None:
+                mask &= self.be_index.mask(*be_range)
+            else:
+                mask &= self.df['BE (eV)'].between(*be_range)
+
         # Filter by element
-        if self.selected_element:
+        if include_element and self.selected_element:
             mask &= self.df['Element'] == self.selected_element
 
         # Filter by line
@@ -891,7 +4023,114 @@ Version: 4.0"""
             name_search = re.escape(name_search)
             mask &= self.df['Name'].str.lower().str.contains(name_search, na=False)
 
-        return self.df[mask]
+        # Filter by author (inverted surname index)
+        author_search = self.author_search.GetValue().strip() if hasattr(self, 'author_search') else ""
+        if author_search and self.author_index is not None:
+            mask &= self.author_index.mask(author_search)
+
+        # Full-text filter (FTS5 index, built in the background on first use)
+        text_search = self.text_search.GetValue().strip() if hasattr(self, 'text_search') else ""
+        if text_search:
+            matches = np.zeros(len(self.df), dtype=bool)
+            if self.ensure_fulltext_index():
+                matches[self.fulltext_index.search(text_search)[0]] = True
+            mask &= matches
+
+        # Filter by metadata ranges (sorted indexes)
+        if getattr(self, 'range_filters', None) and self.metadata is not None:
+            mask &= self.metadata.mask(self.range_filters)
+
+        # Filter by facet values (packed bitmaps)
+        if include_facets and getattr(self, 'facet_selection', None) and self.facets is not None:
+            mask &= self.facets.mask(self.facet_selection)
+
+        # Filter by publication year / journal (parsed citation index)
+        year_range, journal = self.citation_filters()
+        if year_range or journal:
+            mask &= self.citations.mask(year_range, journal)
+
+        return mask
+
+    def show_facets(self, event):
+        """Show the facet window, creating it on first use"""
+        if self.index_unavailable('facets', "Facets"):
+            return
+        if not getattr(self, 'facet_frame', None):
+            self.facet_frame = FacetFrame(self)
+        self.facet_frame.Show()
+        self.facet_frame.Raise()
+
+    def set_facet(self, label, value, selected):
+        """Add or remove one facet value from the selection"""
+        chosen = set(self.facet_selection.get(label, ()))
+        if selected:
+            chosen.add(value)
+        else:
+            chosen.discard(value)
+        if chosen:
+            self.facet_selection[label] = chosen
+        else:
+            self.facet_selection.pop(label, None)
+        self._update_facets_label()
+        self.update_results()
+
+    def clear_facets(self):
+        self.facet_selection = {}
+        self._update_facets_label()
+        self.update_results()
+
+    def _update_facets_label(self):
+        """Show the number of selected facet values, which stay active when the facet window is closed"""
+        selected = sum(len(values) for values in self.facet_selection.values())
+        self.facets_btn.SetLabel(f"Facets ({selected})..." if selected else "Facets...")
+
+    def show_range_filters(self, event):
+        """Edit the metadata range filters"""
+        dlg = RangeFilterDialog(self, self.metadata, self.range_filters)
+        result = dlg.ShowModal()
+        if result == wx.ID_OK:
+            self.set_range_filters(dlg.get_filters())
+        elif result == wx.ID_CLEAR:
+            self.set_range_filters({})
+        dlg.Destroy()
+
+    def set_range_filters(self, filters):
+        self.range_filters = filters
+        self.range_btn.SetLabel(f"Metadata Filters ({len(filters)})..." if filters else "Metadata Filters...")
+        self.update_results()
+
+    def ensure_fulltext_index(self):
+        """True if the full-text index can be queried; otherwise start building it"""
+        if self._fulltext_state == 'ready':
+            return True
+        if self._fulltext_state is None:
+            self._fulltext_state = 'building'
+            threading.Thread(target=self._build_fulltext_index, daemon=True).start()
+        return False
+
+    def _build_fulltext_index(self):
+        try:
+            self.fulltext_index.build(self.df)
+            state = 'ready'
+        except Exception as e:
+            print(f"Could not build the full-text index: {e}")
+            state = 'failed'
+        wx.CallAfter(self._on_fulltext_index_built, state)
+
+    def _on_fulltext_index_built(self, state):
+        self._fulltext_state = state
+        if self.text_search.GetValue().strip():
+            self.update_results()
+
+    def citation_filters(self):
+        """((first, last) year range or None, journal abbreviation or None) from the search area"""
+        if not hasattr(self, 'year_from') or self.citations is None:
+            return None, None
+        year_range = (self.year_from.GetValue(), self.year_to.GetValue())
+        if year_range == self.year_bounds:
+            year_range = None
+        journal = self.journal_combo.GetStringSelection()
+        return year_range, (journal if journal and journal != 'All Journals' else None)
 
     def update_results(self):
         """Update the results grid"""
@@ -918,13 +4157,29 @@ Version: 4.0"""
             elif col_name == "Journal":
                 col_name = "Journal"
 
-            filtered_df = filtered_df.sort_values(
-                by=col_name,
-                ascending=self.sort_ascending
-            )
+            if col_name == "Year" and self.citations is None:
+                pass  # no parsed years to sort by
+            elif col_name == "Year":
+                # Parsed publication year lives in the citation index
+                order = self.citations.table['Year'].reindex(filtered_df.index).sort_values(
+                    ascending=self.sort_ascending, kind='stable').index
+                filtered_df = filtered_df.loc[order]
+            else:
+                filtered_df = filtered_df.sort_values(
+                    by=col_name,
+                    ascending=self.sort_ascending
+                )
+        elif self.text_search.GetValue().strip() and self._fulltext_state == 'ready':
+            # Best full-text matches first (BM25)
+            positions = self.fulltext_index.search(self.text_search.GetValue().strip())[0]
+            rank = np.full(len(self.df), len(positions))
+            rank[positions] = np.arange(len(positions))
+            filtered_df = filtered_df.iloc[np.argsort(rank[filtered_df.index.to_numpy()], kind='stable')]
         else:
             filtered_df = filtered_df.sort_values(by='BE (eV)')
 
+        self._grid_index = filtered_df.index.to_numpy()
+
         # Suspend redraws while updating grid (major speed improvement)
         self.results_grid.BeginBatch()
 
@@ -936,6 +4191,8 @@ Version: 4.0"""
         num_rows = len(filtered_df)
         if num_rows > 0:
             self.results_grid.AppendRows(num_rows)
+            years = (self.citations.years[filtered_df.index.to_numpy()] if self.citations is not None
+                     else np.full(num_rows, np.nan))
             for i, (_, row) in enumerate(filtered_df.iterrows()):
                 self.results_grid.SetCellValue(i, 0, str(row['Element']))
                 self.results_grid.SetCellValue(i, 1, str(row['Line']))
@@ -947,12 +4204,27 @@ Version: 4.0"""
                                                str(row['Name']) if pd.notnull(row['Name']) else "")
                 self.results_grid.SetCellValue(i, 5,
                                                str(row['Journal']) if pd.notnull(row['Journal']) else "")
+                self.results_grid.SetCellValue(i, 6, f"{years[i]:.0f}" if not np.isnan(years[i]) else "")
 
         # Resume redraws
         self.results_grid.EndBatch()
 
         # Update status
-        self.status_text.SetLabel(f"{num_rows} results found")
+        if self.text_search.GetValue().strip() and self._fulltext_state == 'building':
+            self.status_text.SetLabel("Building the full-text index (first use)...")
+        elif self.text_search.GetValue().strip() and self._fulltext_state == 'failed':
+            self.status_text.SetLabel("Full-text search is unavailable (index could not be built)")
+        elif self.be_range:
+            self.status_text.SetLabel(f"{num_rows} results found "
+                                      f"(BE {self.be_range[0]:.2f}-{self.be_range[1]:.2f} eV)")
+        else:
+            self.status_text.SetLabel(f"{num_rows} results found")
+
+        # Search hits per element follow the current filters
+        if self.heatmap_metric == 'matches':
+            self.apply_heatmap()
+
+        self.notify_plot_listeners()
 
     def on_column_click(self, event):
         """Handle column header click for sorting"""
@@ -987,111 +4259,134 @@ Version: 4.0"""
         if row < 0:
             return
 
-        # Select the row
-        self.results_grid.SelectRow(row)
+        # Select the row, keeping a multi-row selection it belongs to
+        if row not in self.results_grid.GetSelectedRows():
+            self.results_grid.SelectRow(row)
+        self.results_grid.SetGridCursor(row, 0)
+        count = len(self.selected_grid_rows())
+        plural = f" ({count} rows)" if count > 1 else ""
 
         # Create context menu
         menu = wx.Menu()
 
-        copy_ref = menu.Append(wx.ID_ANY, "Copy Full Reference")
-        copy_journal = menu.Append(wx.ID_ANY, "Copy Journal Only")
+        copy_ref = menu.Append(wx.ID_ANY, "Copy Full Reference" + ("s" + plural if plural else ""))
+        copy_journal = menu.Append(wx.ID_ANY, "Copy Journal Only" + plural)
+        copy_table = menu.Append(wx.ID_ANY, "Copy as Table (TSV)" + plural)
+        copy_bibtex = menu.Append(wx.ID_ANY, "Copy as BibTeX" + plural)
         search_scholar = menu.Append(wx.ID_ANY, "Search in Google Scholar")
         menu.AppendSeparator()
+        select_all = menu.Append(wx.ID_ANY, "Select All\tCtrl+A")
         show_info = menu.Append(wx.ID_ANY, "Show Full Information")
 
+        if self.paper_library:
+            menu.AppendSeparator()
+            citation = self.results_grid.GetCellValue(row, 5).strip()
+            linked = self.paper_library.papers_for_citation(citation) if citation else []
+            open_paper = menu.Append(wx.ID_ANY, "Open Linked Paper" + (f" ({len(linked)})" if linked else ""))
+            open_paper.Enable(bool(linked))
+            link_paper = menu.Append(wx.ID_ANY, "Link Paper from Library...")
+            link_paper.Enable(bool(citation))
+            self.Bind(wx.EVT_MENU, self.open_linked_paper, open_paper)
+            self.Bind(wx.EVT_MENU, self.link_library_paper, link_paper)
+
         # Bind menu events
         self.Bind(wx.EVT_MENU, self.copy_reference, copy_ref)
         self.Bind(wx.EVT_MENU, self.copy_journal_only, copy_journal)
+        self.Bind(wx.EVT_MENU, lambda e: self.copy_records('tsv'), copy_table)
+        self.Bind(wx.EVT_MENU, lambda e: self.copy_records('bibtex'), copy_bibtex)
         self.Bind(wx.EVT_MENU, self.search_google_scholar, search_scholar)
+        self.Bind(wx.EVT_MENU, lambda e: self.results_grid.SelectAll(), select_all)
         self.Bind(wx.EVT_MENU, lambda e: self.show_full_info(), show_info)
 
         # Show menu
         self.PopupMenu(menu)
         menu.Destroy()
 
-    def copy_reference(self, event):
-        """Copy full reference to clipboard"""
-        row = self.results_grid.GetSelectedRows()[0] if self.results_grid.GetSelectedRows() else -1
-        if row < 0:
-            return
-
-        # Build reference string
-        element = self.results_grid.GetCellValue(row, 0)
-        line = self.results_grid.GetCellValue(row, 1)
-        be = self.results_grid.GetCellValue(row, 2)
-        formula = self.results_grid.GetCellValue(row, 3)
-        name = self.results_grid.GetCellValue(row, 4)
-        journal = self.results_grid.GetCellValue(row, 5)
-
-        reference = f"{element} {line} - {be} eV - {formula} - {name} - {journal}"
+    def on_grid_key(self, event):
+        """Ctrl+C copies the selected rows as a table, Ctrl+A selects every row"""
+        if event.ControlDown() or event.CmdDown():
+            if event.GetKeyCode() == ord('C'):
+                self.copy_records('tsv')
+                return
+            if event.GetKeyCode() == ord('A'):
+                self.results_grid.SelectAll()
+                return
+        event.Skip()
 
+    def selected_grid_rows(self):
+        """Selected grid rows in display order (the cursor row if none is selected)"""
+        rows = sorted(self.results_grid.GetSelectedRows())
+        if not rows and self.results_grid.GetNumberRows():
+            rows = [self.results_grid.GetGridCursorRow()]
+        return [row for row in rows if 0 <= row < len(self._grid_index)]
+
+    def selected_records(self):
+        """DataFrame rows behind the selected grid rows"""
+        return self.df.loc[self._grid_index[self.selected_grid_rows()]]
+
+    def copy_records(self, style, label=None):
+        """Copy the selected rows to the clipboard (see format_records)"""
+        records = self.selected_records()
+        if records.empty:
+            return
+        label = label or {'tsv': "Table", 'references': "References", 'bibtex': "BibTeX entries"}[style]
         try:
-            pyperclip.copy(reference)
-            self.status_text.SetLabel("Reference copied to clipboard")
-        except:
-            self.status_text.SetLabel("Failed to copy reference")
+            pyperclip.copy(format_records(records, style))
+            self.status_text.SetLabel(f"{label} for {len(records)} rows copied to clipboard")
+        except Exception:
+            self.status_text.SetLabel("Failed to copy to clipboard")
+
+    def copy_reference(self, event):
+        """Copy full references of the selected rows to clipboard"""
+        self.copy_records('references', "References")
 
     def copy_journal_only(self, event):
-        """Copy journal to clipboard"""
-        row = self.results_grid.GetSelectedRows()[0] if self.results_grid.GetSelectedRows() else -1
-        if row < 0:
+        """Copy the journals of the selected rows (each once) to clipboard"""
+        journals = self.selected_records()['Journal'].dropna().astype(str).str.strip()
+        journals = journals[journals != ''].drop_duplicates()
+        if journals.empty:
             return
 
-        journal = self.results_grid.GetCellValue(row, 5)
-
         try:
-            pyperclip.copy(journal)
-            self.status_text.SetLabel("Journal copied to clipboard")
+            pyperclip.copy('\n'.join(journals))
+            self.status_text.SetLabel("Journal copied to clipboard" if len(journals) == 1 else
+                                      f"{len(journals)} journals copied to clipboard")
         except:
             self.status_text.SetLabel("Failed to copy journal")
 
     def search_google_scholar(self, event):
-        """Search journal in Google Scholar"""
-        row = self.results_grid.GetSelectedRows()[0] if self.results_grid.GetSelectedRows() else -1
-        if row < 0:
-            return
+        """Search the selected rows' journals in Google Scholar (a few tabs at most)"""
+        journals = self.selected_records()['Journal'].dropna().astype(str).str.strip()
+        journals = journals[journals != ''].drop_duplicates()
 
-        journal = self.results_grid.GetCellValue(row, 5)
+        if journals.empty:
+            self.status_text.SetLabel("No journal information to search")
+            return
 
-        if journal.strip():
-            import urllib.parse
+        import urllib.parse
+        max_tabs = 5  # don't flood the browser for large selections
+        for journal in journals[:max_tabs]:
             query = urllib.parse.quote(journal)
             scholar_url = f"https://scholar.google.com/scholar?q={query}"
             webbrowser.open(scholar_url)
-            self.status_text.SetLabel("Opened in Google Scholar")
+        if len(journals) > max_tabs:
+            self.status_text.SetLabel(f"Opened the first {max_tabs} of {len(journals)} "
+                                      f"journals in Google Scholar")
         else:
-            self.status_text.SetLabel("No journal information to search")
+            self.status_text.SetLabel("Opened in Google Scholar")
 
     def show_full_info(self):
         """Show full information dialog"""
-        row = self.results_grid.GetSelectedRows()[0] if self.results_grid.GetSelectedRows() else -1
-        if row < 0:
+        rows = self.selected_grid_rows()
+        if not rows:
             return
 
         # Get row data
+        row = rows[0]
         element = self.results_grid.GetCellValue(row, 0)
         line = self.results_grid.GetCellValue(row, 1)
         be_str = self.results_grid.GetCellValue(row, 2)
-        formula = self.results_grid.GetCellValue(row, 3)
-
-        # Find matching row in dataframe
-        be = float(be_str) if be_str else None
-
-        if be is not None:
-            matches = self.df[(self.df['Element'] == element) &
-                              (self.df['Line'] == line) &
-                              (abs(self.df['BE (eV)'] - be) < 0.01) &
-                              (self.df['Formula'] == formula)]
-        else:
-            matches = self.df[(self.df['Element'] == element) &
-                              (self.df['Line'] == line) &
-                              (self.df['Formula'] == formula)]
-
-        if matches.empty:
-            self.status_text.SetLabel("No detailed information found")
-            return
-
-        row_data = matches.iloc[0]
+        row_data = self.df.loc[self._grid_index[row]]
 
         # Create dialog
         dlg = wx.Dialog(self, title=f"Full Information: {element} {line} - {be_str} eV",
@@ -1131,25 +4426,141 @@ Version: 4.0"""
 
     def plot_results(self, event):
         """Create matplotlib plot of binding energies"""
-        filtered_df = self.get_filtered_data()
+        histogram, element, line, line_stats = self.current_histogram()
 
-        if filtered_df.empty:
-            wx.MessageBox("There is no data to plot.", "No Data",
-                          wx.OK | wx.ICON_INFORMATION)
-            return
-
-        binding_energies = filtered_df['BE (eV)'].dropna().values
-
-        if len(binding_energies) == 0:
+        if histogram is None:
             wx.MessageBox("No binding energy values to plot.", "No Data",
                           wx.OK | wx.ICON_INFORMATION)
             return
 
         # Create plot window
-        plot_frame = PlotFrame(self, binding_energies, self.selected_element,
-                               self.line_combo.GetStringSelection())
+        plot_frame = PlotFrame(self, histogram, element, line, line_stats=line_stats,
+                               follow=self.config.get('plot_follow_filters', False))
         plot_frame.Show()
 
+    def show_year_histogram(self, event):
+        """Open a window with references and publications per year for the current filters"""
+        if self.index_unavailable('citations', "Publications per Year"):
+            return
+        frame = YearHistogramFrame(self)
+        frame.Show()
+
+    def current_histogram(self):
+        """(BEHistogram or None, element, line, line statistics) for the current filters"""
+        if self.histogram_cache is None:
+            return None, self.selected_element, self.line_combo.GetStringSelection(), None
+        element = self.selected_element
+        line = self.line_combo.GetStringSelection()
+        formula = self.formula_search.GetValue().strip().lower()
+        name = self.name_search.GetValue().strip().lower()
+        author = self.author_search.GetValue().strip().lower()
+        text = self.text_search.GetValue().strip().lower()
+        line_key = None if line == 'All Lines' else line
+        citation_filters = self.citation_filters()
+
+        range_filters = tuple(sorted(self.range_filters.items()))
+        facets = tuple((label, tuple(sorted(values))) for label, values in sorted(self.facet_selection.items()))
+
+        text_filters = formula or name or author or text
+        if element and not (text_filters or range_filters or facets) and citation_filters == (None, None):
+            # Whole (Element, Line) groups: sum their cached sparse counts
+            build = lambda: self.histogram_cache.for_groups(self.histogram_cache.group_keys(element, line_key))
+        else:
+            build = lambda: self.histogram_cache.for_mask(self.get_search_mask(include_be_range=False).to_numpy())
+        histogram = self.histogram_cache.memoized(
+            (element, line, formula, name, author, text, self._fulltext_state, citation_filters, range_filters,
+             facets), build)
+
+        line_stats = self.line_stats.get(element, line) if element and self.line_stats is not None else None
+        return histogram, element, line, line_stats
+
+    def set_be_range(self, lo, hi):
+        """Restrict the results to a BE window; a second window refines the current one"""
+        if self.be_range:
+            refined = (max(lo, self.be_range[0]), min(hi, self.be_range[1]))
+            if refined[0] <= refined[1]:
+                lo, hi = refined
+        self.be_range = (lo, hi)
+        self.update_results()
+        return self.be_range
+
+    def clear_be_range(self):
+        if self.be_range:
+            self.be_range = None
+            self.update_results()
+
+    def describe_filters(self):
+        """Short label for the current filters (used for comparison series)"""
+        parts = [self.selected_element or "All elements"]
+        line = self.line_combo.GetStringSelection()
+        if line != 'All Lines':
+            parts.append(line)
+        formula = self.formula_search.GetValue().strip()
+        if formula:
+            parts.append(f"[{formula}]")
+        name = self.name_search.GetValue().strip()
+        if name:
+            parts.append(f'"{name}"')
+        author = self.author_search.GetValue().strip()
+        if author:
+            parts.append(f"by {author}")
+        text = self.text_search.GetValue().strip()
+        if text:
+            parts.append(f"<{text}>")
+        if self.range_filters:
+            parts.append(f"[{NumericMetadata.describe(self.range_filters)}]")
+        for label, values in self.facet_selection.items():
+            parts.append(f"{label}: {' | '.join(sorted(values))}")
+        year_range, journal = self.citation_filters()
+        if journal:
+            parts.append(journal)
+        if year_range:
+            parts.append(f"{year_range[0]}-{year_range[1]}")
+        return " ".join(parts)
+
+    def get_compare_frame(self):
+        """Return the comparison window, creating it on first use"""
+        if not getattr(self, 'compare_frame', None):
+            self.compare_frame = CompareFrame(self)
+            self.compare_frame.Bind(wx.EVT_CLOSE, self.on_compare_frame_close)
+        self.compare_frame.Show()
+        return self.compare_frame
+
+    def on_compare_frame_close(self, event):
+        self.compare_frame = None
+        event.Skip()
+
+    def add_current_to_comparison(self):
+        """Add the current filters as a series of the comparison window"""
+        histogram = self.current_histogram()[0]
+        frame = self.get_compare_frame()
+        if frame.add_series(self.describe_filters(), histogram):
+            frame.Raise()
+        else:
+            self.status_text.SetLabel("No binding energy values to compare for the current filters")
+
+    def add_plot_listener(self, plot_frame):
+        if plot_frame not in self.plot_listeners:
+            self.plot_listeners.append(plot_frame)
+
+    def remove_plot_listener(self, plot_frame):
+        if plot_frame in self.plot_listeners:
+            self.plot_listeners.remove(plot_frame)
+
+    def notify_plot_listeners(self):
+        """Refresh live plots once the current burst of filter events has been handled"""
+        if getattr(self, 'plot_listeners', None) and not self._plot_update_pending:
+            self._plot_update_pending = True
+            wx.CallAfter(self._update_plot_listeners)
+
+    def _update_plot_listeners(self):
+        self._plot_update_pending = False
+        for plot_frame in list(self.plot_listeners):
+            try:
+                plot_frame.on_filters_changed()
+            except RuntimeError:  # window already destroyed
+                self.remove_plot_listener(plot_frame)
+
     def show_element_properties_OLD(self, event):
         """Show element properties dialog"""
         if not self.selected_element:
@@ -1221,10 +4632,13 @@ Version: 4.0"""
             self.property_dialog.Raise()
             return
 
-        # Create new properties dialog (pass configurable Scholar tab load delay)
+        # Create new properties dialog (pass Scholar tab load delay and the remembered tab,
+        # so only that tab's web view is created up front)
         scholar_delay = self.config.get('scholar_load_delay_seconds', 0)
         self.property_dialog = ElementPropertiesDialog(self, self.selected_element, self.df,
-                                                        scholar_load_delay=scholar_delay)
+                                                        scholar_load_delay=scholar_delay,
+                                                        initial_tab=self.property_dialog_tab_index,
+                                                        page_cache=self.page_cache)
 
         # Position on right side of screen
         if not self.property_dialog_position:
@@ -1232,17 +4646,133 @@ Version: 4.0"""
         else:
             self.property_dialog.SetPosition(self.property_dialog_position)
 
-        # Set the remembered tab selection
-        try:
-            wx.CallAfter(self.property_dialog.notebook.SetSelection, self.property_dialog_tab_index)
-        except:
-            pass
-
         # Bind close event to save position/size
         self.property_dialog.Bind(wx.EVT_CLOSE, self.on_property_dialog_close)
 
         # Show as non-modal dialog
         self.property_dialog.Show()
+        self.schedule_prefetch(self.selected_element)
+
+    def get_task_frame(self):
+        """Return the background tasks window, creating it on first use"""
+        if not self.task_frame:
+            self.task_frame = TaskProgressFrame(self)
+        return self.task_frame
+
+    def start_download(self, url, element=None):
+        """Fetch a paper into the library (or ~/Downloads without one) on a worker thread"""
+        filename = url.split('/')[-1].split('?')[0] or "download"
+
+        if self.paper_library:
+            record = self.paper_library.find_url(url)
+            if record:
+                # Already have it: no network I/O
+                self.status_text.SetLabel(f"{filename} is already in the paper library")
+                wx.LaunchDefaultApplication(record['full_path'])
+                return
+            path = self.paper_library.incoming_path(url)
+        else:
+            path = os.path.join(str(Path.home() / "Downloads"), filename)
+
+        if url in self._active_downloads or self.download_manager.is_active(url):
+            self.get_task_frame().Raise()
+            return
+        self._submit_download(DownloadJob(url, path, title=filename, element=element), filename)
+
+    def _submit_download(self, job, filename):
+        task_id = self.get_task_frame().add_task(f"Downloading {filename}", on_cancel=job.cancel)
+        self._active_downloads[job.url] = task_id
+        library = self.paper_library
+
+        def on_progress(job):
+            fraction = job.bytes_done / job.total if job.total else None
+            text = format_size(job.bytes_done) + (f" of {format_size(job.total)}" if job.total else "")
+            wx.CallAfter(self._update_task, task_id, fraction, text)
+
+        def on_done(job, status, error):
+            # Hash and store on the worker thread so large files do not stall the UI
+            if status == 'done' and library:
+                try:
+                    record = library.add_file(job.path, job.url, title=job.title, element=job.element)
+                    job.path = record['full_path']
+                except (OSError, sqlite3.Error) as e:
+                    status, error = 'failed', f"could not add to library: {e}"
+            wx.CallAfter(self._on_download_done, task_id, job, filename, status, error)
+
+        if self.download_manager.submit(job, on_progress, on_done) is None:
+            # Another job is still writing this URL's .part file
+            self._active_downloads.pop(job.url, None)
+            self.task_frame.remove_task(task_id)
+
+    def _update_task(self, task_id, fraction, text):
+        if self.task_frame:
+            self.task_frame.update_task(task_id, fraction, text)
+
+    def _on_download_done(self, task_id, job, filename, status, error):
+        self._active_downloads.pop(job.url, None)
+        if not self.task_frame:
+            return
+
+        def resume():
+            self.task_frame.remove_task(task_id)
+            if job.url not in self._active_downloads and not self.download_manager.is_active(job.url):
+                self._submit_download(DownloadJob(job.url, job.path, job.title, job.element), filename)
+
+        if status == 'done':
+            self.task_frame.finish_task(task_id, f"Saved to {job.path}",
+                                        action=("Open", lambda: wx.LaunchDefaultApplication(job.path)))
+            self.status_text.SetLabel(f"Downloaded {filename}")
+        elif status == 'cancelled':
+            self.task_frame.finish_task(task_id, "Cancelled", success=False, action=("Resume", resume))
+        else:
+            self.task_frame.finish_task(task_id, f"Download failed: {error}", success=False,
+                                        action=("Resume", resume))
+
+    def _selected_citation(self):
+        rows = self.selected_grid_rows()
+        return self.results_grid.GetCellValue(rows[0], 5).strip() if rows else ""
+
+    def _describe_paper(self, record):
+        added = time.strftime('%Y-%m-%d', time.localtime(record['added_at'] or 0))
+        element = f" [{record['element']}]" if record['element'] else ""
+        return f"{record['title'] or record['hash'][:12]}{element} - {format_size(record['size'] or 0)}, {added}"
+
+    def link_library_paper(self, event):
+        """Link a paper from the library to the selected row's journal reference"""
+        citation = self._selected_citation()
+        if not citation or not self.paper_library:
+            return
+        papers = self.paper_library.papers()
+        if not papers:
+            wx.MessageBox("The paper library is empty. PDFs opened from the Scholar tabs are stored there.",
+                          "Paper Library", wx.OK | wx.ICON_INFORMATION)
+            return
+        dlg = wx.SingleChoiceDialog(self, f"Link a stored paper to:\n{citation}", "Link Paper",
+                                    [self._describe_paper(p) for p in papers])
+        if dlg.ShowModal() == wx.ID_OK:
+            self.paper_library.link(papers[dlg.GetSelection()]['hash'], citation)
+            self.status_text.SetLabel("Paper linked to reference")
+        dlg.Destroy()
+
+    def open_linked_paper(self, event):
+        """Open the library paper(s) linked to the selected row's journal reference"""
+        citation = self._selected_citation()
+        if not citation or not self.paper_library:
+            return
+        papers = self.paper_library.papers_for_citation(citation)
+        if len(papers) == 1:
+            wx.LaunchDefaultApplication(papers[0]['full_path'])
+        elif papers:
+            dlg = wx.SingleChoiceDialog(self, citation, "Open Linked Paper",
+                                        [self._describe_paper(p) for p in papers])
+            if dlg.ShowModal() == wx.ID_OK:
+                wx.LaunchDefaultApplication(papers[dlg.GetSelection()]['full_path'])
+            dlg.Destroy()
+
+    def open_paper_library(self, event):
+        """Open the paper library folder in the system file browser"""
+        if self.paper_library:
+            wx.LaunchDefaultApplication(self.paper_library.objects_dir)
 
     def position_dialog_on_right(self):
         """Position property dialog on the right side of the screen"""
@@ -1278,16 +4808,359 @@ Version: 4.0"""
         event.Skip()
 
 
+class SortedIndex:
+    """Sorted view of a numeric column for range queries without rescanning it.
+
+    Built once with argsort; a [lo, hi] query is two binary searches and
+    returns the matching row positions (NaN values never match).
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        self.size = len(values)
+        valid = np.flatnonzero(~np.isnan(values))
+        self.order = valid[np.argsort(values[valid], kind='stable')]
+        self.sorted_values = values[self.order]
+
+    def positions(self, lo=None, hi=None):
+        """Row positions with lo <= value <= hi (either bound may be None)"""
+        start = 0 if lo is None else np.searchsorted(self.sorted_values, lo, side='left')
+        stop = self.size if hi is None else np.searchsorted(self.sorted_values, hi, side='right')
+        return self.order[start:stop]
+
+    def mask(self, lo=None, hi=None):
+        """Boolean row mask for lo <= value <= hi"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.positions(lo, hi)] = True
+        return mask
+
+
+class AuthorIndex:
+    """Inverted index from normalized author surname tokens to row positions.
+
+    Each distinct Author string is tokenized once at load (accents folded, initials
+    and 'et al.' dropped). A query token is a prefix lookup by binary search in the
+    sorted token list; several query tokens must all match (e.g. 'briggs seah').
+    """
+
+    STOP_WORDS = {'et', 'al', 'and'}
+
+    def __init__(self, authors):
+        self.size = len(authors)
+        codes, uniques = pd.factorize(authors)
+
+        # Rows of each distinct author string, as slices of one argsort
+        order = np.argsort(codes, kind='stable')
+        order = order[np.searchsorted(codes[order], 0):]  # drop missing authors (code -1)
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(codes[codes >= 0], minlength=len(uniques)))))
+
+        token_codes = {}
+        for code, text in enumerate(uniques):
+            for token in self.tokenize(text):
+                token_codes.setdefault(token, []).append(code)
+
+        self.tokens = np.array(sorted(token_codes), dtype=str)
+        self.rows = [np.sort(np.concatenate([order[bounds[code]:bounds[code + 1]] for code in token_codes[token]]))
+                     for token in self.tokens]
+
+    @classmethod
+    def tokenize(cls, text):
+        """Lower-case, accent-free surname tokens of an author string"""
+        text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode('ascii').lower()
+        return {token.replace("'", "") for token in re.findall(r"[a-z][a-z'-]+", text)
+                if token not in cls.STOP_WORDS}
+
+    def positions(self, query):
+        """Sorted row positions whose authors match every token of query (None for an empty query)"""
+        result = None
+        for token in self.tokenize(query):
+            start = np.searchsorted(self.tokens, token, side='left')
+            stop = np.searchsorted(self.tokens, token + '~', side='left')  # '~' sorts after a-z
+            if stop - start == 1:
+                rows = self.rows[start]
+            elif stop > start:
+                rows = np.unique(np.concatenate(self.rows[start:stop]))
+            else:
+                rows = np.empty(0, dtype=np.int64)
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+        return result
+
+    def mask(self, query):
+        """Boolean row mask for an author query (all rows when it has no searchable token)"""
+        positions = self.positions(query)
+        if positions is None:
+            return np.ones(self.size, dtype=bool)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[positions] = True
+        return mask
+
+
+class FullTextIndex:
+    """Ranked full-text search over the descriptive text columns (SQLite FTS5, BM25).
+
+    The index is a sidecar SQLite file in the dataset cache, built on first use
+    (call build() from a worker thread) and reused on later runs. Row ids are
+    row positions in the DataFrame. Safe to use from worker threads.
+    """
+
+    COLUMNS = ['Notes', 'Specimen', 'Calibration', 'Charge Reference',
+               'Background Subtraction Method', 'Peak Location Method']
+    DB_NAME = 'fulltext_v1.sqlite3'
+
+    def __init__(self, dataset_cache):
+        self.db_path = dataset_cache.path(self.DB_NAME)
+        self._lock = threading.Lock()
+        self._last = None  # (query, positions, scores) of the latest search
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def is_ready(self):
+        if not os.path.exists(self.db_path):
+            return False
+        try:
+            conn = self._connect()
+            try:
+                return conn.execute("SELECT value FROM meta WHERE key = 'complete'").fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+
+    def build(self, df):
+        """Create the FTS5 table for df (written to a temporary file, then moved into place)"""
+        columns = [column for column in self.COLUMNS if column in df.columns]
+        tmp_path = self.db_path + '.tmp'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            fields = ", ".join(f"c{i}" for i in range(len(columns)))
+            conn.execute(f"CREATE VIRTUAL TABLE records USING fts5({fields}, "
+                         f"tokenize = 'porter unicode61 remove_diacritics 2')")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            text = df[columns].fillna('').astype(str)
+            with conn:
+                conn.executemany(f"INSERT INTO records (rowid, {fields}) VALUES (?{', ?' * len(columns)})",
+                                 zip(range(len(text)), *(text[column].tolist() for column in columns)))
+                conn.execute("INSERT INTO records (records) VALUES ('optimize')")
+                conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                                 [('columns', json.dumps(columns)), ('complete', '1')])
+        finally:
+            conn.close()
+        with self._lock:
+            os.replace(tmp_path, self.db_path)
+            self._last = None
+
+    @staticmethod
+    def match_expression(query):
+        """FTS5 MATCH string: every word must appear, as a prefix ('sputter*'); None if no words"""
+        words = re.findall(r'\w+', query, flags=re.UNICODE)
+        return " ".join(f'"{word}"*' for word in words) or None
+
+    def search(self, query):
+        """(row positions, BM25 scores) best first; lower scores rank higher"""
+        expression = self.match_expression(query)
+        with self._lock:
+            if self._last and self._last[0] == expression:
+                return self._last[1], self._last[2]
+            if expression is None:
+                return np.empty(0, dtype=np.int64), np.empty(0)
+            conn = self._connect()
+            try:
+                rows = conn.execute("SELECT rowid, bm25(records) FROM records WHERE records MATCH ? "
+                                    "ORDER BY bm25(records)", (expression,)).fetchall()
+            finally:
+                conn.close()
+            positions = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            scores = np.fromiter((row[1] for row in rows), dtype=float, count=len(rows))
+            self._last = (expression, positions, scores)
+            return positions, scores
+
+
+class BEHistogram:
+    """Binding energies binned once on a fine 0.1 eV grid.
+
+    Histograms for every resolution (multiples of 0.1 eV) are differences of one
+    cumulative count array, and the Gaussian KDE (Silverman bandwidth, as
+    scipy's gaussian_kde) is computed once by linear binning onto the grid and
+    an FFT convolution, i.e. O(n + m log m) instead of O(n * m).
+    Instances for the dataset's filters come from BEHistogramCache.
+    """
+
+    FINE_BIN = 0.1
+
+    def __init__(self, lo, counts, weights, n, mean, std):
+        self.lo = lo
+        self.counts = counts  # hard counts of the fine bins [lo + i*0.1, lo + (i+1)*0.1)
+        self.weights = weights  # linear-binning weights on the grid points lo + j*0.1
+        self.n = n
+        self.mean = mean
+        self.std = std
+        self.hi = round(lo + len(counts) * self.FINE_BIN, 1)
+        self.cumulative = np.concatenate(([0], np.cumsum(counts)))
+        self._kde = None
+
+    @classmethod
+    def from_values(cls, values):
+        values = np.asarray(values, dtype=float)
+        lo = np.floor(values.min() * 10) / 10
+        hi = np.ceil(values.max() * 10) / 10
+        n_bins = max(1, int(round((hi - lo) / cls.FINE_BIN)))
+
+        position = (values - lo) / cls.FINE_BIN
+        index = np.clip(np.floor(position + 1e-9).astype(np.int64), 0, n_bins)
+        fraction = np.clip(position - index, 0.0, 1.0)
+
+        counts = np.bincount(np.minimum(index, n_bins - 1), minlength=n_bins)
+        weights = (np.bincount(index, weights=1.0 - fraction, minlength=n_bins + 2)
+                   + np.bincount(index + 1, weights=fraction, minlength=n_bins + 2))[:n_bins + 1]
+        std = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+        return cls(lo, counts, weights, len(values), float(values.mean()), std)
+
+    def histogram(self, bin_width):
+        """(counts, edges) for bins of bin_width eV starting at lo"""
+        edges = np.round(np.arange(self.lo, self.hi + bin_width, bin_width), 1)
+        index = np.clip(np.rint((edges - self.lo) / self.FINE_BIN).astype(np.int64), 0, len(self.counts))
+        return np.diff(self.cumulative[index]), edges
+
+    @property
+    def bandwidth(self):
+        """Silverman's rule: std * (3n/4) ** (-1/5)"""
+        return self.std * (0.75 * self.n) ** -0.2
+
+    def kde(self):
+        """(x, density) of the Gaussian KDE on the fine grid, or None if it is undefined"""
+        if self._kde is None and self.n > 1 and self.std > 0:
+            h = self.bandwidth
+            m = len(self.weights)
+            half = int(min(m - 1, np.ceil(4 * h / self.FINE_BIN)))
+            offsets = np.arange(-half, half + 1) * self.FINE_BIN / h
+            kernel = np.exp(-0.5 * offsets ** 2) / (np.sqrt(2 * np.pi) * h * self.n)
+
+            size = 1 << int(np.ceil(np.log2(m + 2 * half + 1)))
+            density = np.fft.irfft(np.fft.rfft(self.weights, size) * np.fft.rfft(kernel, size), size)
+            density = np.maximum(density[half:half + m], 0.0)
+            self._kde = (self.lo + np.arange(m) * self.FINE_BIN, density)
+        return self._kde
+
+
+class BEHistogramCache:
+    """Fine-bin position of every row and per-(Element, Line) sparse counts.
+
+    Built once per dataset. A histogram for whole groups is the sum of their
+    sparse counts (O(bins)); any other filter is a bincount of the cached row
+    bin indices under the row mask. Recent results are memoized so their KDE
+    is only computed once.
+    """
+
+    MEMO_SIZE = 32
+
+    def __init__(self, df):
+        fine = BEHistogram.FINE_BIN
+        be = df['BE (eV)'].to_numpy(dtype=float)
+        self.valid = ~np.isnan(be)
+        self.be = be
+        self.lo = np.floor(np.nanmin(be) * 10) / 10
+        self.n_bins = max(1, int(round((np.ceil(np.nanmax(be) * 10) / 10 - self.lo) / fine)))
+
+        position = np.where(self.valid, (be - self.lo) / fine, 0.0)
+        self.row_index = np.clip(np.floor(position + 1e-9), 0, self.n_bins).astype(np.int64)
+        self.row_fraction = np.clip(position - self.row_index, 0.0, 1.0)
+
+        # Sparse per-group histograms
+        codes, keys = pd.factorize(pd.MultiIndex.from_arrays([df['Element'], df['Line']]))
+        self.groups = {}
+        rows = np.flatnonzero(self.valid & (codes >= 0))
+        rows = rows[np.argsort(codes[rows], kind='stable')]
+        bounds = np.flatnonzero(np.diff(codes[rows])) + 1
+        for group_rows in np.split(rows, bounds):
+            if len(group_rows):
+                self.groups[keys[codes[group_rows[0]]]] = self._sparse(group_rows)
+        self._memo = OrderedDict()
+
+    def _sparse(self, rows):
+        index = self.row_index[rows]
+        fraction = self.row_fraction[rows]
+        bins, counts = np.unique(np.minimum(index, self.n_bins - 1), return_counts=True)
+        points = np.concatenate((index, index + 1))
+        weight_points, inverse = np.unique(points, return_inverse=True)
+        weights = np.bincount(inverse, weights=np.concatenate((1.0 - fraction, fraction)))
+        values = self.be[rows]
+        return bins, counts, weight_points, weights, len(rows), values.sum(), (values ** 2).sum()
+
+    def group_keys(self, element, line=None):
+        """(Element, Line) keys with data for an element (and optionally one line)"""
+        if line is not None:
+            return [(element, line)] if (element, line) in self.groups else []
+        return [key for key in self.groups if key[0] == element]
+
+    def for_groups(self, keys):
+        """BEHistogram of the union of whole (Element, Line) groups, or None if empty"""
+        parts = [self.groups[key] for key in keys if key in self.groups]
+        if not parts:
+            return None
+        first = min(part[0][0] for part in parts)
+        last = max(part[0][-1] for part in parts)
+        counts = np.zeros(last - first + 1, dtype=np.int64)
+        weights = np.zeros(last - first + 2)
+        n = total = total_sq = 0
+        for bins, group_counts, weight_points, group_weights, group_n, group_sum, group_sq in parts:
+            counts[bins - first] += group_counts
+            inside = weight_points <= last + 1
+            weights[weight_points[inside] - first] += group_weights[inside]
+            n += group_n
+            total += group_sum
+            total_sq += group_sq
+        variance = (total_sq - total * total / n) / (n - 1) if n > 1 else 0.0
+        return BEHistogram(round(self.lo + first * BEHistogram.FINE_BIN, 1), counts, weights, n, total / n,
+                           float(np.sqrt(max(variance, 0.0))))
+
+    def for_mask(self, mask):
+        """BEHistogram of the rows selected by a boolean mask, or None if empty"""
+        rows = np.flatnonzero(np.asarray(mask) & self.valid)
+        if not len(rows):
+            return None
+        index = self.row_index[rows]
+        fraction = self.row_fraction[rows]
+        hard = np.minimum(index, self.n_bins - 1)
+        first, last = hard.min(), hard.max()
+        counts = np.bincount(hard - first, minlength=last - first + 1)
+        weights = (np.bincount(index - first, weights=1.0 - fraction, minlength=last - first + 3)
+                   + np.bincount(index + 1 - first, weights=fraction, minlength=last - first + 3))[:last - first + 2]
+        values = self.be[rows]
+        std = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+        return BEHistogram(round(self.lo + first * BEHistogram.FINE_BIN, 1), counts, weights, len(values),
+                           float(values.mean()), std)
+
+    def memoized(self, key, build):
+        """Return the memoized histogram for key, building it with build() on a miss"""
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        histogram = build()
+        self._memo[key] = histogram
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return histogram
+
+
 class PlotFrame(wx.Frame):
     """Frame for displaying binding energy plots"""
 
-    def __init__(self, parent, binding_energies, element, line):
+    def __init__(self, parent, histogram, element, line, line_stats=None, follow=False):
         super().__init__(parent, title="Binding Energy Distribution", size=(800, 700))
         set_app_icon(self)
 
-        self.binding_energies = binding_energies
+        self.histogram = histogram
         self.element = element
         self.line = line
+        self.line_stats = line_stats  # database-wide statistics of this element/line, drawn as an overlay
+        self.label = parent.describe_filters()  # series name when this plot is added to the comparison
+        self.ax = None
+        self._background = None
+        self._overlay = []
+        self._owns_be_range = False  # the main window's BE window was brushed here
 
         # Create panel
         panel = wx.Panel(self)
@@ -1311,12 +5184,32 @@ class PlotFrame(wx.Frame):
         control_sizer.Add(wx.StaticText(control_panel, label="eV"),
                           0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 
+        # Drag over the histogram to filter the results grid to a BE window
+        clear_btn = wx.Button(control_panel, label="Clear BE Window")
+        clear_btn.SetToolTip("Drag across the histogram to show only that BE range in the results;\n"
+                             "a second drag refines the current window")
+        clear_btn.Bind(wx.EVT_BUTTON, self.on_clear_range)
+        control_sizer.Add(clear_btn, 0, wx.ALL, 5)
+
+        compare_btn = wx.Button(control_panel, label="Add to Comparison")
+        compare_btn.SetToolTip("Add the distribution shown in this window as a comparison series")
+        compare_btn.Bind(wx.EVT_BUTTON, self.on_add_to_comparison)
+        control_sizer.Add(compare_btn, 0, wx.ALL, 5)
+
+        # Live mode: redraw whenever the search filters of the main window change
+        self.follow_check = wx.CheckBox(control_panel, label="Follow search filters")
+        self.follow_check.SetValue(follow)
+        self.follow_check.Bind(wx.EVT_CHECKBOX, self.on_toggle_follow)
+        control_sizer.AddStretchSpacer()
+        control_sizer.Add(self.follow_check, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+
         control_panel.SetSizer(control_sizer)
 
         # Create matplotlib figure
         self.figure = Figure()
         self.canvas = FigureCanvas(panel, -1, self.figure)
         self.toolbar = NavigationToolbar(self.canvas)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         # Layout
         sizer.Add(control_panel, 0, wx.ALL | wx.EXPAND, 5)
@@ -1328,67 +5221,1115 @@ class PlotFrame(wx.Frame):
         # Initial plot
         self.update_plot()
 
+        if follow:
+            parent.add_plot_listener(self)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
         # Center on parent
         self.CenterOnParent()
 
+    def on_close(self, event):
+        parent = self.GetParent()
+        parent.remove_plot_listener(self)
+        if self._owns_be_range:
+            parent.clear_be_range()  # the window is only visible (and clearable) here
+        event.Skip()
+
+    def on_toggle_follow(self, event):
+        """Start or stop following the main window's search filters"""
+        parent = self.GetParent()
+        if self.follow_check.GetValue():
+            parent.add_plot_listener(self)
+            self.on_filters_changed()
+        else:
+            parent.remove_plot_listener(self)
+
+    def on_filters_changed(self):
+        """Called by the main window when its filters change (live mode)"""
+        histogram, element, line, line_stats = self.GetParent().current_histogram()
+        if histogram is None:
+            return  # keep showing the last non-empty result
+        if (element, line) != (self.element, self.line):
+            self.element, self.line, self.line_stats = element, line, line_stats
+            self._update_labels()
+        self.histogram = histogram
+        self.label = self.GetParent().describe_filters()
+        self.update_plot()
+
+    def on_add_to_comparison(self, event):
+        """Add this plot's own histogram, not the main window's current filters, to the comparison"""
+        parent = self.GetParent()
+        frame = parent.get_compare_frame()
+        if frame.add_series(self.label, self.histogram):
+            frame.Raise()
+        else:
+            parent.status_text.SetLabel("No binding energy values to compare in this plot")
+
     def on_resolution_change(self, event):
         """Handle resolution change"""
         self.update_plot()
 
     def update_plot(self):
         """Update the plot with current resolution"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        bin_width = float(self.resolution_combo.GetValue())
+        counts, edges = self.histogram.histogram(bin_width)
+        kde = self.histogram.kde()
+        # Scale the density to counts per bin
+        kde_counts = kde[1] * self.histogram.n * bin_width if kde else None
+
+        if self.ax is None:
+            self._create_axes()
+
+        self.hist_artist.set_data(counts, edges)
+        if kde is not None:
+            self.kde_line.set_data(kde[0], kde_counts)
+        self.kde_line.set_visible(kde is not None)
+        self.total_text.set_text(f'Total References: {self.histogram.n}')
+        self.resolution_text.set_text(f'Resolution: {bin_width} eV')
+
+        # Blit only the data artists while the axes stay the same; otherwise redraw everything
+        peak = max(counts.max(), kde_counts.max() if kde_counts is not None else 0)
+        xlim = (self.histogram.hi, self.histogram.lo)
+        ylim = self.ax.get_ylim()
+        if self._background is not None and self.ax.get_xlim() == xlim and ylim[1] * 0.5 < peak <= ylim[1]:
+            self.canvas.restore_region(self._background)
+            self._draw_dynamic()
+            self.canvas.blit(self.ax.bbox)
+        else:
+            # REVERSE X-AXIS FOR XPS CONVENTION (low BE left, high BE right)
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(0, peak * 1.15 if peak > 0 else 1)
+            self.canvas.draw_idle()
+
+    def on_draw(self, event):
+        """After a full redraw, keep the static background and draw the data artists on top"""
+        if self.ax is None:
+            return
+        # Saving to a file draws through another canvas; only the screen canvas keeps a background
+        if event.canvas is self.canvas:
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_dynamic(event.renderer)
+
+    def _draw_dynamic(self, renderer=None):
+        for artist in (self.hist_artist, self.kde_line, self.total_text, self.resolution_text):
+            if artist.get_visible():
+                if renderer is None:
+                    self.ax.draw_artist(artist)
+                else:
+                    artist.draw(renderer)
+
+    def _create_axes(self):
+        """Create the axes and artists once; later updates only change their data"""
+        ax = self.ax = self.figure.add_subplot(111)
+
+        # Data artists are animated: drawn by _draw_dynamic and blitted over the background
+        self.hist_artist = ax.stairs([0], [0, 1], fill=True, alpha=0.7,
+                                     facecolor='skyblue', edgecolor='black', animated=True)
+        self.kde_line, = ax.plot([], [], 'r-', linewidth=2, animated=True)
+
+        ax.set_xlabel('Binding Energy (eV)')
+        ax.set_ylabel('Number of References')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+        # Text annotations
+        self.total_text = ax.text(0.98, 0.95, '', transform=ax.transAxes, ha='right', va='top',
+                                  bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), animated=True)
+        self.resolution_text = ax.text(0.98, 0.90, '', transform=ax.transAxes, ha='right', va='top',
+                                       bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), animated=True)
+        self._update_labels()
+
+        self.span_selector = SpanSelector(ax, self.on_span_select, 'horizontal', useblit=True,
+                                          interactive=True, minspan=0.05,
+                                          props=dict(facecolor='tab:green', alpha=0.2))
+
+    def on_span_select(self, xmin, xmax):
+        """Filter the main results grid to the brushed BE window"""
+        if xmax - xmin < 0.05:
+            return
+        lo, hi = self.GetParent().set_be_range(xmin, xmax)
+        self._owns_be_range = True
+        if (lo, hi) != (xmin, xmax):
+            self.span_selector.extents = (lo, hi)  # show the refined window
+
+    def on_clear_range(self, event):
+        self.span_selector.clear()
+        self._owns_be_range = False
+        self.GetParent().clear_be_range()
+
+    def _update_labels(self):
+        """Title and database median/IQR overlay for the current element/line"""
+        element_str = f" for {self.element}" if self.element else ""
+        line_str = f" ({self.line})" if self.line != "All Lines" else ""
+        self.ax.set_title(f'Binding Energy Distribution{element_str}{line_str}')
+
+        for artist in self._overlay:
+            artist.remove()
+        self._overlay = []
+        legend = self.ax.get_legend()
+        if legend:
+            legend.remove()
+
+        if self.line_stats is not None:
+            stats = self.line_stats
+            self._overlay = [
+                self.ax.axvspan(stats['q25'], stats['q75'], color='orange', alpha=0.15,
+                                label=f"IQR {stats['q25']:.2f}-{stats['q75']:.2f} eV"),
+                self.ax.axvline(stats['median'], color='darkorange', linestyle='--', linewidth=1.5,
+                                label=f"Median {stats['median']:.2f} eV (MAD {stats['mad']:.2f})")]
+            self.ax.legend(handles=self._overlay, loc='upper left', fontsize='small')
+        self._background = None  # force a full redraw
+
+
+class ExportDialog(wx.Dialog):
+    """Format and column choice for exporting the filtered data"""
+
+    def __init__(self, parent, columns, selected=None, fmt='tsv'):
+        super().__init__(parent, title="Export Filtered Data", style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.formats = list(TableExporter.FORMATS)
+        format_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        format_sizer.Add(wx.StaticText(self, label="Format:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.format_choice = wx.Choice(self, choices=[label for label, _ in TableExporter.FORMATS.values()])
+        self.format_choice.SetSelection(self.formats.index(fmt) if fmt in self.formats else 0)
+        format_sizer.Add(self.format_choice, 1)
+        sizer.Add(format_sizer, 0, wx.ALL | wx.EXPAND, 8)
+
+        sizer.Add(wx.StaticText(self, label="Columns:"), 0, wx.LEFT | wx.RIGHT, 8)
+        self.column_list = wx.CheckListBox(self, choices=columns, size=(360, 300))
+        # Remembered selection, falling back to every column
+        selected = set(selected) & set(columns) if selected else set(columns)
+        self.column_list.SetCheckedStrings([column for column in columns if column in selected])
+        sizer.Add(self.column_list, 1, wx.ALL | wx.EXPAND, 8)
+
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        all_button = wx.Button(self, label="Select All")
+        all_button.Bind(wx.EVT_BUTTON, lambda event: self.column_list.SetCheckedItems(range(len(columns))))
+        none_button = wx.Button(self, label="Select None")
+        none_button.Bind(wx.EVT_BUTTON, lambda event: self.column_list.SetCheckedItems([]))
+        button_sizer.Add(all_button, 0, wx.RIGHT, 5)
+        button_sizer.Add(none_button)
+        sizer.Add(button_sizer, 0, wx.LEFT | wx.RIGHT, 8)
+
+        sizer.Add(self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL), 0, wx.ALL | wx.EXPAND, 8)
+        self.SetSizerAndFit(sizer)
+        self.CenterOnParent()
+
+    def get_options(self):
+        return self.formats[self.format_choice.GetSelection()], list(self.column_list.GetCheckedStrings())
+
+
+class FacetFrame(wx.Frame):
+    """Check lists of facet values with the number of rows each would match.
+
+    Counts follow the other search filters live (the frame is a plot listener of
+    the main window) and are recomputed from the FacetIndex bitmaps.
+    """
+
+    LIST_HEIGHT = 110
+
+    def __init__(self, parent):
+        super().__init__(parent, title="Facets", size=(330, 700))
+        set_app_icon(self)
+        self.parent = parent
+        self.lists = {}
+
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        clear_btn = wx.Button(panel, label="Clear Facets")
+        clear_btn.Bind(wx.EVT_BUTTON, lambda e: parent.clear_facets())
+        sizer.Add(clear_btn, 0, wx.ALL, 5)
+
+        scroll = wx.ScrolledWindow(panel, style=wx.VSCROLL)
+        scroll.SetScrollRate(0, 10)
+        scroll_sizer = wx.BoxSizer(wx.VERTICAL)
+        for label, values in parent.facets.values.items():
+            box = wx.StaticBoxSizer(wx.VERTICAL, scroll, label)
+            check_list = wx.CheckListBox(box.GetStaticBox(), choices=values,
+                                         size=(-1, min(self.LIST_HEIGHT, 22 * len(values) + 6)))
+            check_list.Bind(wx.EVT_CHECKLISTBOX, lambda e, name=label: self.on_check(e, name))
+            box.Add(check_list, 1, wx.EXPAND)
+            scroll_sizer.Add(box, 0, wx.ALL | wx.EXPAND, 4)
+            self.lists[label] = check_list
+        scroll.SetSizer(scroll_sizer)
+        sizer.Add(scroll, 1, wx.EXPAND)
+        panel.SetSizer(sizer)
+
+        parent.add_plot_listener(self)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.update_counts()
+
+    def on_check(self, event, label):
+        index = event.GetInt()
+        value = self.parent.facets.values[label][index]
+        self.parent.set_facet(label, value, self.lists[label].IsChecked(index))
+
+    def on_filters_changed(self):
+        self.update_counts()
+
+    def update_counts(self):
+        """Relabel every value with its count and sync the check marks with the selection"""
+        parent = self.parent
+        query = parent.get_search_mask(include_facets=False).to_numpy()
+        counts = parent.facets.counts(query, parent.facet_selection)
+        for label, check_list in self.lists.items():
+            chosen = parent.facet_selection.get(label, set())
+            for i, (value, count) in enumerate(zip(parent.facets.values[label], counts[label])):
+                text = f"{value} ({count})"
+                if check_list.GetString(i) != text:
+                    check_list.SetString(i, text)
+                if check_list.IsChecked(i) != (value in chosen):
+                    check_list.Check(i, value in chosen)
 
+    def on_close(self, event):
+        self.parent.remove_plot_listener(self)
+        self.parent.facet_frame = None
+        event.Skip()
+
+
+class RangeFilterDialog(wx.Dialog):
+    """Min / max bounds for the numeric metadata columns (blank = unbounded)"""
+
+    def __init__(self, parent, metadata, filters):
+        super().__init__(parent, title="Metadata Filters")
+        self.metadata = metadata
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # X-ray source shortcut (sets the photon energy range)
+        source_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        source_sizer.Add(wx.StaticText(self, label="X-ray source:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.source_choice = wx.Choice(self, choices=["Any"] + list(NumericMetadata.SOURCES))
+        self.source_choice.SetSelection(0)
+        self.source_choice.Bind(wx.EVT_CHOICE, self.on_source)
+        source_sizer.Add(self.source_choice, 0, wx.RIGHT, 10)
+        self.mono_check = wx.CheckBox(self, label="Monochromated only")
+        self.mono_check.SetValue(filters.get('Monochromated') == (1.0, 1.0))
+        source_sizer.Add(self.mono_check, 0, wx.ALIGN_CENTER_VERTICAL)
+        sizer.Add(source_sizer, 0, wx.ALL, 8)
+
+        grid = wx.FlexGridSizer(cols=5, hgap=6, vgap=4)
+        for label in ("Field", "Min", "Max", "", "Rows with data"):
+            grid.Add(wx.StaticText(self, label=label))
+        self.bounds = {}
+        for field, (unit, fmt) in NumericMetadata.FIELDS.items():
+            if field == 'Monochromated' or field not in metadata.table.columns:
+                continue
+            lo, hi = filters.get(field, (None, None))
+            lo_ctrl = wx.TextCtrl(self, value="" if lo is None else f"{lo:g}", size=(70, -1))
+            hi_ctrl = wx.TextCtrl(self, value="" if hi is None else f"{hi:g}", size=(70, -1))
+            values = metadata.index(field).sorted_values
+            grid.Add(wx.StaticText(self, label=field), 0, wx.ALIGN_CENTER_VERTICAL)
+            grid.Add(lo_ctrl)
+            grid.Add(hi_ctrl)
+            grid.Add(wx.StaticText(self, label=unit), 0, wx.ALIGN_CENTER_VERTICAL)
+            span = f" ({fmt % values[0]} to {fmt % values[-1]})" if len(values) else ""
+            grid.Add(wx.StaticText(self, label=f"{len(values)}{span}"), 0, wx.ALIGN_CENTER_VERTICAL)
+            self.bounds[field] = (lo_ctrl, hi_ctrl)
+        sizer.Add(grid, 0, wx.LEFT | wx.RIGHT, 8)
+
+        photon = filters.get('Photon Energy (eV)')
+        for i, energy in enumerate(NumericMetadata.SOURCES.values(), start=1):
+            if photon == (energy, energy):
+                self.source_choice.SetSelection(i)
+
+        buttons = wx.StdDialogButtonSizer()
+        buttons.AddButton(wx.Button(self, wx.ID_OK))
+        buttons.AddButton(wx.Button(self, wx.ID_CANCEL))
+        clear_button = wx.Button(self, wx.ID_CLEAR, "Clear All")
+        clear_button.Bind(wx.EVT_BUTTON, lambda e: self.EndModal(wx.ID_CLEAR))
+        buttons.SetNegativeButton(clear_button)
+        buttons.Realize()
+        sizer.Add(buttons, 0, wx.ALL | wx.EXPAND, 8)
+        self.SetSizerAndFit(sizer)
+        self.CenterOnParent()
+
+    def on_source(self, event):
+        if 'Photon Energy (eV)' not in self.bounds:
+            return
+        lo_ctrl, hi_ctrl = self.bounds['Photon Energy (eV)']
+        selection = self.source_choice.GetStringSelection()
+        energy = NumericMetadata.SOURCES.get(selection)
+        lo_ctrl.SetValue("" if energy is None else f"{energy:g}")
+        hi_ctrl.SetValue("" if energy is None else f"{energy:g}")
+
+    def get_filters(self):
+        """{field: (lo, hi)} for every field with at least one valid bound"""
+        filters = {}
+        for field, controls in self.bounds.items():
+            bounds = []
+            for ctrl in controls:
+                try:
+                    bounds.append(float(ctrl.GetValue().strip()))
+                except ValueError:
+                    bounds.append(None)
+            if bounds != [None, None]:
+                filters[field] = tuple(bounds)
+        if self.mono_check.GetValue():
+            filters['Monochromated'] = (1.0, 1.0)
+        return filters
+
+
+class AtlasExportDialog(wx.Dialog):
+    """Options for the batch BE atlas export"""
+
+    SCOPES = ["All elements and lines", "Selected element (all lines)", "Selected element and line"]
+    FORMATS = ['png', 'svg', 'pdf']
+
+    def __init__(self, parent, default_dir):
+        super().__init__(parent, title="Export BE Atlas")
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.scope_box = wx.RadioBox(self, label="Groups", choices=self.SCOPES, majorDimension=1)
+        if not parent.selected_element:
+            self.scope_box.EnableItem(1, False)
+            self.scope_box.EnableItem(2, False)
+        sizer.Add(self.scope_box, 0, wx.ALL | wx.EXPAND, 8)
+
+        format_box = wx.StaticBoxSizer(wx.HORIZONTAL, self, "Formats")
+        self.format_checks = {}
+        for fmt in self.FORMATS:
+            check = wx.CheckBox(format_box.GetStaticBox(), label=fmt.upper())
+            check.SetValue(fmt == 'png')
+            format_box.Add(check, 0, wx.ALL, 5)
+            self.format_checks[fmt] = check
+        sizer.Add(format_box, 0, wx.LEFT | wx.RIGHT | wx.EXPAND, 8)
+
+        grid = wx.FlexGridSizer(cols=2, hgap=8, vgap=6)
+        grid.Add(wx.StaticText(self, label="Histogram resolution (eV):"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.resolution_combo = wx.ComboBox(self, choices=["0.1", "0.2", "0.3", "0.5", "1.0"], value="0.2",
+                                            style=wx.CB_READONLY)
+        grid.Add(self.resolution_combo)
+        grid.Add(wx.StaticText(self, label="Minimum references per group:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.min_count = wx.SpinCtrl(self, min=1, max=1000, initial=5)
+        grid.Add(self.min_count)
+        grid.Add(wx.StaticText(self, label="Output folder:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.dir_picker = wx.DirPickerCtrl(self, path=default_dir, size=(320, -1))
+        grid.Add(self.dir_picker, 1, wx.EXPAND)
+        sizer.Add(grid, 0, wx.ALL | wx.EXPAND, 8)
+
+        sizer.Add(self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL), 0, wx.ALL | wx.EXPAND, 8)
+        self.SetSizerAndFit(sizer)
+        self.CenterOnParent()
+
+    def get_options(self):
+        return {'scope': self.scope_box.GetSelection(),
+                'formats': [fmt for fmt, check in self.format_checks.items() if check.GetValue()],
+                'resolution': float(self.resolution_combo.GetValue()),
+                'min_count': self.min_count.GetValue(),
+                'out_dir': self.dir_picker.GetPath()}
+
+
+class CompareFrame(wx.Frame):
+    """Overlay of several BE distributions (one per saved filter) with a KDE each.
+
+    Series are BEHistogram objects from the main window's histogram cache, so
+    adding one only sums cached bin counts and a redraw is O(bins) per series.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, title="Compare BE Distributions", size=(950, 700))
+        set_app_icon(self)
+
+        self.series = []  # (label, BEHistogram)
+
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Control panel
+        control_panel = wx.Panel(panel)
+        control_panel.SetBackgroundColour(wx.Colour(224, 224, 224))
+        control_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        add_btn = wx.Button(control_panel, label="Add Current Filter")
+        add_btn.SetToolTip("Add the element / line / formula / name search of the main window as a series")
+        add_btn.Bind(wx.EVT_BUTTON, lambda e: parent.add_current_to_comparison())
+        control_sizer.Add(add_btn, 0, wx.ALL, 5)
+
+        control_sizer.Add(wx.StaticText(control_panel, label="Histogram Resolution:"),
+                          0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        self.resolution_combo = wx.ComboBox(control_panel,
+                                            choices=["0.1", "0.2", "0.3", "0.4", "0.5",
+                                                     "0.6", "0.7", "0.8", "0.9", "1.0"],
+                                            value="0.5", style=wx.CB_READONLY)
+        self.resolution_combo.Bind(wx.EVT_COMBOBOX, lambda e: self.update_plot())
+        control_sizer.Add(self.resolution_combo, 0, wx.ALL, 5)
+        control_sizer.Add(wx.StaticText(control_panel, label="eV"),
+                          0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+
+        self.normalize_check = wx.CheckBox(control_panel, label="Normalize (area = 1)")
+        self.normalize_check.SetValue(True)
+        self.normalize_check.Bind(wx.EVT_CHECKBOX, lambda e: self.update_plot())
+        control_sizer.Add(self.normalize_check, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+
+        self.hist_check = wx.CheckBox(control_panel, label="Histograms")
+        self.hist_check.SetValue(True)
+        self.hist_check.Bind(wx.EVT_CHECKBOX, lambda e: self.update_plot())
+        control_sizer.Add(self.hist_check, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        control_panel.SetSizer(control_sizer)
+
+        # Series list + plot
+        body_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        list_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.series_list = wx.ListBox(panel, size=(220, -1), style=wx.LB_EXTENDED)
+        remove_btn = wx.Button(panel, label="Remove Selected")
+        remove_btn.Bind(wx.EVT_BUTTON, self.on_remove)
+        clear_btn = wx.Button(panel, label="Clear All")
+        clear_btn.Bind(wx.EVT_BUTTON, self.on_clear)
+        list_sizer.Add(wx.StaticText(panel, label="Series:"), 0, wx.ALL, 3)
+        list_sizer.Add(self.series_list, 1, wx.ALL | wx.EXPAND, 3)
+        list_sizer.Add(remove_btn, 0, wx.ALL | wx.EXPAND, 3)
+        list_sizer.Add(clear_btn, 0, wx.ALL | wx.EXPAND, 3)
+
+        self.figure = Figure()
+        self.canvas = FigureCanvas(panel, -1, self.figure)
+        self.toolbar = NavigationToolbar(self.canvas)
+        self.ax = self.figure.add_subplot(111)
+
+        plot_sizer = wx.BoxSizer(wx.VERTICAL)
+        plot_sizer.Add(self.canvas, 1, wx.EXPAND)
+        plot_sizer.Add(self.toolbar, 0, wx.EXPAND)
+        body_sizer.Add(list_sizer, 0, wx.ALL | wx.EXPAND, 5)
+        body_sizer.Add(plot_sizer, 1, wx.ALL | wx.EXPAND, 5)
+
+        sizer.Add(control_panel, 0, wx.ALL | wx.EXPAND, 5)
+        sizer.Add(body_sizer, 1, wx.EXPAND)
+        panel.SetSizer(sizer)
+
+        self.update_plot()
+        self.CenterOnParent()
+
+    def add_series(self, label, histogram):
+        """Add (or replace) a series; returns False if it has no data"""
+        if histogram is None:
+            return False
+        self.series = [(name, hist) for name, hist in self.series if name != label]
+        self.series.append((label, histogram))
+        self._refresh_list()
+        self.update_plot()
+        return True
+
+    def _refresh_list(self):
+        self.series_list.Set([f"{label} (n={histogram.n})" for label, histogram in self.series])
+
+    def on_remove(self, event):
+        selected = set(self.series_list.GetSelections())
+        self.series = [item for i, item in enumerate(self.series) if i not in selected]
+        self._refresh_list()
+        self.update_plot()
+
+    def on_clear(self, event):
+        self.series = []
+        self._refresh_list()
+        self.update_plot()
+
+    def update_plot(self):
+        """Redraw all series from their cached histograms"""
+        ax = self.ax
+        ax.clear()
         bin_width = float(self.resolution_combo.GetValue())
+        normalize = self.normalize_check.GetValue()
+        colors = matplotlib.colormaps['tab10'].colors
+
+        for i, (label, histogram) in enumerate(self.series):
+            color = colors[i % len(colors)]
+            # Counts per bin, or probability density when normalized
+            scale = 1.0 / (histogram.n * bin_width) if normalize else 1.0
+            if self.hist_check.GetValue():
+                counts, edges = histogram.histogram(bin_width)
+                ax.stairs(counts * scale, edges, color=color, alpha=0.6, linewidth=1)
+            kde = histogram.kde()
+            if kde is not None:
+                density = kde[1] if normalize else kde[1] * histogram.n * bin_width
+                ax.plot(kde[0], density, color=color, linewidth=2, label=f"{label} (n={histogram.n})")
+            else:
+                ax.plot([], [], color=color, linewidth=2, label=f"{label} (n={histogram.n})")
+
+        ax.set_xlabel('Binding Energy (eV)')
+        ax.set_ylabel('Density (1/eV)' if normalize else 'Number of References')
+        ax.set_title('Binding Energy Distributions')
+        ax.grid(True, linestyle='--', alpha=0.7)
+        if self.series:
+            # REVERSE X-AXIS FOR XPS CONVENTION, spanning all series
+            ax.set_xlim(max(h.hi for _, h in self.series), min(h.lo for _, h in self.series))
+            ax.legend(loc='upper left', fontsize='small')
+        else:
+            ax.text(0.5, 0.5, 'Use "Add Current Filter" to add series', transform=ax.transAxes,
+                    ha='center', va='center', color='gray')
+        self.canvas.draw_idle()
+
+
+class YearHistogramFrame(wx.Frame):
+    """References and distinct publications per year for the main window's filters.
+
+    Counts come from the parsed citation index (two bincounts), and the window
+    follows the search filters like a live plot window.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, title="Publications per Year", size=(800, 500))
+        set_app_icon(self)
+        self.parent = parent
+
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        self.figure = Figure()
+        self.canvas = FigureCanvas(panel, -1, self.figure)
+        self.toolbar = NavigationToolbar(self.canvas)
+        self.ax = self.figure.add_subplot(111)
+        sizer.Add(self.canvas, 1, wx.EXPAND)
+        sizer.Add(self.toolbar, 0, wx.EXPAND)
+        panel.SetSizer(sizer)
+
+        parent.add_plot_listener(self)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.update_plot()
+        self.CenterOnParent()
+
+    def on_filters_changed(self):
+        self.update_plot()
+
+    def update_plot(self):
+        parent = self.parent
+        mask = parent.get_search_mask().to_numpy()
+        years, references, publications = parent.citations.year_counts(mask)
+
+        ax = self.ax
+        ax.clear()
+        if len(years):
+            ax.bar(years, references, width=0.9, color='skyblue', edgecolor='black', linewidth=0.5,
+                   label=f"BE references ({references.sum()})")
+            ax.bar(years, publications, width=0.5, color='darkorange',
+                   label=f"Publications ({publications.sum()})")
+            ax.legend(loc='upper left', fontsize='small')
+        else:
+            ax.text(0.5, 0.5, 'No dated references for the current filters', transform=ax.transAxes,
+                    ha='center', va='center', color='gray')
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Count')
+        ax.set_title(f'Publications per Year: {parent.describe_filters()}')
+        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+        self.canvas.draw_idle()
+
+    def on_close(self, event):
+        self.parent.remove_plot_listener(self)
+        event.Skip()
+
+
+class PaperLibrary:
+    """Content-addressed store for downloaded papers.
+
+    Files are stored once under objects/<aa>/<sha256><ext>; a small SQLite index maps
+    source URLs to content hashes and hashes to title/element, and links papers to
+    NIST references by their journal citation. Safe to use from worker threads.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.incoming_dir = os.path.join(directory, 'incoming')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.incoming_dir, exist_ok=True)
+        self.db_path = os.path.join(directory, 'library.sqlite3')
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS papers (
+                    hash TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER,
+                    title TEXT, element TEXT, added_at REAL);
+                CREATE TABLE IF NOT EXISTS urls (
+                    url TEXT PRIMARY KEY, hash TEXT NOT NULL REFERENCES papers(hash));
+                CREATE TABLE IF NOT EXISTS links (
+                    hash TEXT NOT NULL REFERENCES papers(hash), citation TEXT NOT NULL,
+                    PRIMARY KEY (hash, citation));
+                CREATE INDEX IF NOT EXISTS links_citation ON links(citation);
+            ''')
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    return [dict(row) for row in conn.execute(sql, params)]
+            finally:
+                conn.close()
+
+    def _full_path(self, record):
+        record['full_path'] = os.path.join(self.directory, record['path'])
+        return record
+
+    def incoming_path(self, url):
+        """Per-URL temporary download path (stable, so partial downloads can resume)"""
+        name = url.split('/')[-1].split('?')[0]
+        ext = os.path.splitext(name)[1].lower()[:10]
+        return os.path.join(self.incoming_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + ext)
+
+    def find_url(self, url):
+        """Return the stored paper for url, or None; no network access"""
+        rows = self._query('SELECT p.* FROM urls u JOIN papers p ON p.hash = u.hash WHERE u.url = ?', (url,))
+        if not rows:
+            return None
+        record = self._full_path(rows[0])
+        if not os.path.exists(record['full_path']):
+            # File was removed from disk; forget it so it can be fetched again
+            self._query('DELETE FROM urls WHERE hash = ?', (record['hash'],))
+            self._query('DELETE FROM papers WHERE hash = ?', (record['hash'],))
+            return None
+        return record
+
+    def add_file(self, source_path, url, title=None, element=None):
+        """Move a downloaded file into the store; duplicates of stored content are discarded"""
+        digest = hashlib.sha256()
+        size = 0
+        with open(source_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+                size += len(chunk)
+        content_hash = digest.hexdigest()
+        ext = os.path.splitext(source_path)[1]
+        rel_path = os.path.join('objects', content_hash[:2], content_hash + ext)
+        full_path = os.path.join(self.directory, rel_path)
+
+        existing = self._query('SELECT * FROM papers WHERE hash = ?', (content_hash,))
+        if existing and os.path.exists(os.path.join(self.directory, existing[0]['path'])):
+            os.remove(source_path)
+        else:
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            shutil.move(source_path, full_path)
+            self._query('INSERT OR REPLACE INTO papers (hash, path, size, title, element, added_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (content_hash, rel_path, size, title, element, time.time()))
+        self._query('INSERT OR REPLACE INTO urls (url, hash) VALUES (?, ?)', (url, content_hash))
+        return self._full_path(self._query('SELECT * FROM papers WHERE hash = ?', (content_hash,))[0])
+
+    def papers(self):
+        """All stored papers, newest first"""
+        return [self._full_path(r) for r in self._query('SELECT * FROM papers ORDER BY added_at DESC')]
+
+    def link(self, content_hash, citation):
+        """Associate a stored paper with a NIST journal citation"""
+        self._query('INSERT OR IGNORE INTO links (hash, citation) VALUES (?, ?)', (content_hash, citation))
+
+    def unlink(self, content_hash, citation):
+        self._query('DELETE FROM links WHERE hash = ? AND citation = ?', (content_hash, citation))
+
+    def papers_for_citation(self, citation):
+        rows = self._query('SELECT p.* FROM links l JOIN papers p ON p.hash = l.hash '
+                           'WHERE l.citation = ? ORDER BY p.added_at DESC', (citation,))
+        return [self._full_path(r) for r in rows]
+
+
+def format_size(num_bytes):
+    """Human readable byte count (e.g. '1.4 MB')"""
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class TableExporter:
+    """Chunked writer for a row subset of a DataFrame.
+
+    Rows are given as positional indices and only the requested columns are sliced, so
+    the filtered frame is never materialized as a whole. Output goes to a '.part' file that
+    is renamed when complete. Meant to run on a worker thread: on_progress(rows_done) is
+    called after every chunk and cancel_event stops the export between chunks.
+    """
+
+    CHUNK_ROWS = 5000
+    FORMATS = OrderedDict([
+        ('csv', ("CSV", "CSV files (*.csv)|*.csv")),
+        ('tsv', ("Tab-delimited text", "Text files (*.txt;*.tsv)|*.txt;*.tsv")),
+        ('parquet', ("Parquet (zstd)", "Parquet files (*.parquet)|*.parquet")),
+        ('arrow', ("Arrow IPC", "Arrow files (*.arrow)|*.arrow")),
+        ('jsonl', ("JSON Lines", "JSON Lines files (*.jsonl)|*.jsonl")),
+        ('xlsx', ("Excel workbook", "Excel files (*.xlsx)|*.xlsx")),
+    ])
+    EXTENSIONS = {'csv': '.csv', 'tsv': '.txt', 'parquet': '.parquet', 'arrow': '.arrow',
+                  'jsonl': '.jsonl', 'xlsx': '.xlsx'}
+
+    def __init__(self, df, rows, columns, path, fmt):
+        self.df = df
+        self.rows = np.asarray(rows)
+        self.columns = [df.columns.get_loc(column) for column in columns]
+        self.path = path
+        self.fmt = fmt
+
+    def chunks(self):
+        for start in range(0, len(self.rows), self.CHUNK_ROWS):
+            yield self.df.iloc[self.rows[start:start + self.CHUNK_ROWS], self.columns]
+
+    def run(self, on_progress=None, cancel_event=None):
+        """Write the file; returns False if cancelled (the partial file is removed)"""
+        part_path = self.path + '.part'
+        written = getattr(self, f'_write_{self.fmt}')(part_path)
+        done = 0
+        try:
+            for chunk in written:
+                done += len(chunk)
+                if on_progress:
+                    on_progress(done)
+                if cancel_event is not None and cancel_event.is_set():
+                    written.close()  # closes the file before it is removed
+                    self._remove(part_path)
+                    return False
+        except BaseException:
+            written.close()
+            self._remove(part_path)
+            raise
+        os.replace(part_path, self.path)
+        return True
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # Each writer is a generator yielding the chunks it has written, so run() can report
+    # progress and stop between chunks while the writer's context managers clean up.
+
+    def _write_delimited(self, path, sep):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for index, chunk in enumerate(self.chunks()):
+                chunk.to_csv(f, index=False, sep=sep, header=index == 0)
+                yield chunk
+
+    def _write_csv(self, path):
+        return self._write_delimited(path, ',')
+
+    def _write_tsv(self, path):
+        return self._write_delimited(path, '\t')
+
+    def _arrow_schema(self):
+        """Schema pyarrow infers from the first chunk, reused so every chunk is written alike.
+
+        A column that is all null in that chunk takes the type of its first non-null values;
+        a column pyarrow cannot type (numbers mixed with text) is written as strings.
+        """
+        import pyarrow as pa
+        first = next(self.chunks())
+        fields = []
+        for position, name in zip(self.columns, first.columns):
+            column = first[name]
+            if column.isna().all():
+                column = self.df.iloc[self.rows, position].dropna().head(self.CHUNK_ROWS)
+            try:
+                arrow_type = pa.array(column, from_pandas=True).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrow_type = pa.string()
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+            fields.append(pa.field(str(name), arrow_type))
+        return pa.schema(fields)
+
+    def _arrow_chunks(self, schema):
+        import pyarrow as pa
+        for chunk in self.chunks():
+            try:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type values in a string column: convert them as text
+                chunk = chunk.copy()
+                for field, name in zip(schema, chunk.columns):
+                    if pa.types.is_string(field.type) and chunk[name].dtype == object:
+                        chunk[name] = chunk[name].map(str, na_action='ignore')
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            yield chunk, table
+
+    def _write_parquet(self, path):
+        import pyarrow.parquet as pq
+        schema = self._arrow_schema()
+        with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+            for chunk, table in self._arrow_chunks(schema):
+                writer.write_table(table)
+                yield chunk
+
+    def _write_arrow(self, path):
+        import pyarrow as pa
+        schema = self._arrow_schema()
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            for chunk, table in self._arrow_chunks(schema):
+                writer.write_table(table)
+                yield chunk
+
+    def _write_jsonl(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for chunk in self.chunks():
+                chunk.to_json(f, orient='records', lines=True, force_ascii=False)
+                yield chunk
+
+    def _write_xlsx(self, path):
+        from openpyxl import Workbook
+        # Write-only mode streams rows to disk instead of building the sheet in memory
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("NIST XPS")
+        sheet.append([str(self.df.columns[position]) for position in self.columns])
+        for chunk in self.chunks():
+            for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None):
+                sheet.append(row)
+            yield chunk
+        workbook.save(path)
+
+
+class NeighborPrefetcher:
+    """Warm the PageCache with the pages of the elements the user is likely to open next.
+
+    Candidates are scored from periodic-table adjacency (continuing the direction of the
+    last move scores highest, e.g. Fe -> Co -> Ni) and from transitions seen in the recent
+    history. Pages are fetched one at a time on a background thread, throttled to
+    max_kbytes_per_s, capped by a per-session byte budget, and never pushed past
+    cache_share of the cache size so prefetching does not evict pages the user opened.
+    Any real navigation stops the running prefetch immediately.
+    """
+
+    def __init__(self, page_cache, positions, max_elements=4, max_kbytes_per_s=256,
+                 budget_mb=20, cache_share=0.8, history_size=30):
+        self.page_cache = page_cache
+        self.positions = positions
+        self.max_elements = max_elements
+        self.max_bytes_per_s = max_kbytes_per_s * 1024
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.cache_share = cache_share
+        self.history = []
+        self.history_size = history_size
+        self.bytes_used = 0
+        self._stop_event = threading.Event()
+        self._by_position = {pos: symbol for symbol, pos in positions.items()}
+
+    def note_navigation(self, element):
+        """Record a real navigation and stop any prefetch in progress"""
+        self.stop()
+        if not self.history or self.history[-1] != element:
+            self.history.append(element)
+            del self.history[:-self.history_size]
+
+    def stop(self):
+        self._stop_event.set()
+
+    def candidates(self, element, allowed=None):
+        """Return the most likely next elements after element, best first"""
+        if element not in self.positions:
+            return []
+        row, col = self.positions[element]
+        scores = {}
+
+        # Periodic-table neighbours (same row first)
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                neighbour = self._by_position.get((row + d_row, col + d_col))
+                if neighbour and neighbour != element:
+                    scores[neighbour] = 1.0 if d_row == 0 else 0.6
+
+        # Keep going in the direction of the last move
+        if len(self.history) >= 2 and self.history[-1] == element:
+            prev_row, prev_col = self.positions.get(self.history[-2], (row, col))
+            ahead = self._by_position.get((row + (row - prev_row), col + (col - prev_col)))
+            if ahead and ahead != element and max(abs(row - prev_row), abs(col - prev_col)) == 1:
+                scores[ahead] = scores.get(ahead, 0) + 1.0
+
+        # Transitions the user made from this element before
+        for previous, following in zip(self.history, self.history[1:]):
+            if previous == element and following != element:
+                scores[following] = scores.get(following, 0) + 0.5
+
+        ranked = sorted(scores, key=lambda symbol: -scores[symbol])
+        if allowed is not None:
+            ranked = [symbol for symbol in ranked if symbol in allowed]
+        return ranked[:self.max_elements]
+
+    def start(self, element, urls_for, allowed=None):
+        """Prefetch pages (urls_for(symbol) -> list of URLs) for the candidates of element"""
+        self.stop()
+        urls = []
+        for symbol in self.candidates(element, allowed):
+            urls.extend(url for url in urls_for(symbol) if not self.page_cache.has_fresh(url))
+        if not urls:
+            return
+        self._stop_event = stop_event = threading.Event()
+        threading.Thread(target=self._run, args=(urls, stop_event), daemon=True).start()
 
-        # Calculate bins
-        min_energy = np.floor(np.min(self.binding_energies) * 10) / 10
-        max_energy = np.ceil(np.max(self.binding_energies) * 10) / 10
-        bins = np.arange(min_energy, max_energy + bin_width, bin_width)
+    def _run(self, urls, stop_event):
+        cache_limit = self.page_cache.max_bytes * self.cache_share
+        for url in urls:
+            if stop_event.is_set() or self.bytes_used >= self.budget_bytes:
+                return
+            if self.page_cache.total_bytes() >= cache_limit:
+                return
+            started = time.monotonic()
+            status, size = self.page_cache.fetch(url, stop_event=stop_event)
+            self.bytes_used += size
+            # Throttle: wait until the average rate is back under the bandwidth budget
+            wait = size / float(self.max_bytes_per_s) - (time.monotonic() - started)
+            if wait > 0 and stop_event.wait(wait):
+                return
 
-        # Create histogram
-        counts, bins, patches = ax.hist(self.binding_energies, bins=bins,
-                                        alpha=0.7, color='skyblue', edgecolor='black')
 
-        # Add smooth curve
+class WebLoadScheduler:
+    """Queue web view page loads so only a few run at the same time.
+
+    The tab the user is looking at always starts first; hidden tabs are loaded in
+    priority order (lowest number first) once the visible tab is no longer loading.
+    Calling new_generation() stops in-flight loads that belong to a stale element.
+    A stopped load may still report back later; accept_event() filters those events
+    out so they neither free the slot of the newer load nor show an error page.
+    """
+
+    def __init__(self, max_concurrent=2, load_timeout_ms=20000):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.load_timeout_ms = load_timeout_ms
+        self._pending = {}  # key -> job waiting for a free slot
+        self._in_flight = {}  # key -> job currently loading
+        self._stopped = {}  # key -> URLs of stopped loads whose events may still arrive
+        self._visible_key = None
+
+    def request(self, key, view, url, priority, delay_ms=0, start=None, per_element=True):
+        """Queue a load of url into view; a newer request for the same key replaces the old one"""
+        self._stop(self._in_flight.pop(key, None))
+        self._pending[key] = {
+            'key': key,
+            'view': view,
+            'url': url,
+            'priority': priority,
+            'ready_at': time.monotonic() + delay_ms / 1000.0,
+            'start': start,
+            'per_element': per_element,
+            'timer': None,
+        }
+        if delay_ms > 0:
+            wx.CallLater(int(delay_ms), self._pump)
+        self._pump()
+
+    def set_visible(self, key):
+        """Tell the scheduler which tab is on screen so its load jumps the queue"""
+        self._visible_key = key
+        self._pump()
+
+    def accept_event(self, key, event):
+        """Return True if a LOADED/ERROR event is the outcome of key's load, freeing its slot.
+
+        Called first thing by the web view's loaded/error handlers, which should do
+        nothing when this returns False: late events of stopped loads, frame and
+        sub-resource loads while a page is loading, and user-cancelled navigations
+        (a cancelled in-flight load still frees its slot but shows no error page).
+        """
+        try:
+            url = self._normalize(event.GetURL())
+            cancelled = (event.GetEventType() == wx.html2.wxEVT_WEBVIEW_ERROR
+                         and event.GetInt() == wx.html2.WEBVIEW_NAV_ERR_USER_CANCELLED)
+        except Exception:
+            url, cancelled = None, False
+        job = self._in_flight.get(key)
+        if job is not None and url == self._normalize(job['url']):
+            self.finished(key)
+            return not cancelled
+        stopped = self._stopped.get(key, [])
+        if url in stopped:
+            stopped.remove(url)
+            return False
+        if job is not None and url == self._current_url(job):
+            # Redirected or SetPage() load: the view reports its own URL for the main frame
+            self.finished(key)
+            return not cancelled
+        if cancelled:
+            return False
+        # With a load in flight any other URL is a frame or sub-resource of that page
+        return job is None
+
+    def _current_url(self, job):
+        try:
+            return self._normalize(job['view'].GetCurrentURL())
+        except Exception:
+            return None
+
+    @staticmethod
+    def _normalize(url):
+        return (url or '').rstrip('/')
+
+    def finished(self, key):
+        """Free the slot of key's load (see accept_event)"""
+        job = self._in_flight.pop(key, None)
+        if job and job['timer']:
+            job['timer'].Stop()
+        self._pump()
+
+    def cancel(self, key):
+        """Forget a queued load, e.g. when the user navigates that tab by hand"""
+        self._pending.pop(key, None)
+
+    def new_generation(self):
+        """Drop queued and stop in-flight loads for the previous element (a new element was selected)"""
+        for key, job in list(self._pending.items()):
+            if job['per_element']:
+                del self._pending[key]
+        for key, job in list(self._in_flight.items()):
+            if job['per_element']:
+                self._stop(job)
+                del self._in_flight[key]
+
+    def _stop(self, job):
+        if not job:
+            return
+        if job['timer']:
+            job['timer'].Stop()
+        # Remember the URL so the stopped load's late event can be recognised
+        stopped = self._stopped.setdefault(job['key'], [])
+        stopped.append(self._normalize(job['url']))
+        del stopped[:-4]
         try:
-            from scipy.stats import gaussian_kde
-            kde = gaussian_kde(self.binding_energies, bw_method='silverman')
-            x = np.linspace(min_energy, max_energy, 1000)
-            y = kde(x) * len(self.binding_energies) * bin_width
-            ax.plot(x, y, 'r-', linewidth=2)
-        except ImportError:
+            job['view'].Stop()
+        except Exception:
             pass
 
-        # Labels and title
-        element_str = f" for {self.element}" if self.element else ""
-        line_str = f" ({self.line})" if self.line != "All Lines" else ""
-
-        ax.set_xlabel('Binding Energy (eV)')
-        ax.set_ylabel('Number of References')
-        ax.set_title(f'Binding Energy Distribution{element_str}{line_str}')
-        ax.grid(True, linestyle='--', alpha=0.7)
-
-        # REVERSE X-AXIS FOR XPS CONVENTION (low BE left, high BE right)
-        ax.set_xlim(max_energy, min_energy)
-
-        # Add text annotations
-        ax.text(0.98, 0.95, f'Total References: {len(self.binding_energies)}',
-                transform=ax.transAxes, ha='right', va='top',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-
-        ax.text(0.98, 0.90, f'Resolution: {bin_width} eV',
-                transform=ax.transAxes, ha='right', va='top',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    def _next_job(self):
+        now = time.monotonic()
+        ready = [job for job in self._pending.values() if job['ready_at'] <= now]
+        if not ready:
+            return None
+        for job in ready:
+            if job['key'] == self._visible_key:
+                return job
+        # Hidden tabs only load while the visible tab is idle
+        if self._visible_key in self._in_flight:
+            return None
+        return min(ready, key=lambda job: job['priority'])
+
+    def _pump(self):
+        while len(self._in_flight) < self.max_concurrent:
+            job = self._next_job()
+            if job is None:
+                return
+            del self._pending[job['key']]
+            try:
+                if job['start']:
+                    job['start']()
+                else:
+                    job['view'].LoadURL(job['url'])
+            except Exception:
+                continue  # view was destroyed or cannot load; skip it
+            self._in_flight[job['key']] = job
+            job['timer'] = wx.CallLater(self.load_timeout_ms, self._on_timeout, job)
 
-        self.canvas.draw()
+    def _on_timeout(self, job):
+        """Free the slot of a load that never reported back"""
+        if self._in_flight.get(job['key']) is job:
+            self.finished(job['key'])
 
 
 class ElementPropertiesDialog(wx.Frame):
     """Dialog for showing element properties"""
 
-    def __init__(self, parent, element, df, scholar_load_delay=0):
+    # Order in which hidden web tabs are loaded (the visible tab always goes first)
+    WEB_LOAD_PRIORITY = {'xps': 1, 'harwell': 2, 'thermo': 3, 'sss': 4, 'estr': 5}
+
+    def __init__(self, parent, element, df, scholar_load_delay=0, initial_tab=0, page_cache=None):
         super().__init__(parent, title=f"Other Databases & Properties for {element}",
                          size=(1000, 900), style=wx.DEFAULT_FRAME_STYLE)
         set_app_icon(self)
@@ -1397,6 +6338,9 @@ class ElementPropertiesDialog(wx.Frame):
         self.df = df
         # Delay (in seconds) before Scholar tabs auto-load their URLs (0 = load immediately)
         self.scholar_load_delay = max(0, int(scholar_load_delay))
+        # Optional PageCache used for the XPS Fitting, Thermo and Harwell pages
+        self.page_cache = page_cache
+        self._reference_urls = {}  # web view -> URL it should show (ignores fetches for an old element)
 
         # Get element properties
         self.properties = self.get_element_properties(self.element)
@@ -1449,6 +6393,14 @@ class ElementPropertiesDialog(wx.Frame):
         self.notebook = wx.Notebook(panel, style=wx.NB_DEFAULT | wx.BORDER_RAISED)
         self.notebook.SetBackgroundColour(wx.WHITE)
 
+        # Web tabs start as placeholders; builders are keyed by page index and
+        # consumed the first time their tab is selected
+        self._tab_builders = {}
+        self._page_load_keys = {}  # page index -> WebLoadScheduler key
+
+        # All web view loads go through one scheduler (visible tab first, limited concurrency)
+        self.load_scheduler = WebLoadScheduler(max_concurrent=2)
+
         # Create tabs
         self.create_xps_fitting_tab(self.notebook)
         self.create_harwell_tab(self.notebook)
@@ -1462,6 +6414,12 @@ class ElementPropertiesDialog(wx.Frame):
         # Bind notebook page change event to track selections
         self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_tab_changed)
 
+        # Select the remembered tab without firing a change event, then build only that page
+        if 0 <= initial_tab < self.notebook.GetPageCount():
+            self.notebook.ChangeSelection(initial_tab)
+        self.load_scheduler.set_visible(self._page_load_keys.get(self.notebook.GetSelection()))
+        self._ensure_tab_built(self.notebook.GetSelection())
+
 
         # Layout - links come after header, before notebook
         main_sizer.Add(header_panel, 0, wx.ALL | wx.EXPAND, 0)
@@ -1472,8 +6430,87 @@ class ElementPropertiesDialog(wx.Frame):
         # Center on parent
         self.CenterOnParent()
 
+    def _add_lazy_page(self, notebook, title, builder, load_key=None):
+        """Add a lightweight placeholder page whose content is built on first selection"""
+        panel = wx.Panel(notebook)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        placeholder = wx.StaticText(panel, label=f"{title} will load when this tab is opened...")
+        placeholder.SetForegroundColour(wx.Colour(100, 100, 100))
+        sizer.Add(placeholder, 0, wx.ALL, 20)
+        panel.SetSizer(sizer)
+        notebook.AddPage(panel, title)
+        self._tab_builders[notebook.GetPageCount() - 1] = builder
+        if load_key:
+            self._page_load_keys[notebook.GetPageCount() - 1] = load_key
+
+    def _ensure_tab_built(self, index):
+        """Replace a placeholder page with its real content (web view etc.) if not built yet"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        panel = self.notebook.GetPage(index)
+        panel.Freeze()
+        try:
+            panel.DestroyChildren()
+            builder(panel)
+            panel.Layout()
+        finally:
+            panel.Thaw()
+
+    def request_reference_page(self, key, view, url):
+        """Queue a reference page load that is served from the page cache when possible"""
+        self.load_scheduler.request(key, view, url, self.WEB_LOAD_PRIORITY[key],
+                                    start=lambda: self._load_reference_page(view, url))
+
+    def _load_reference_page(self, view, url):
+        """Show a cached copy instantly (revalidated in the background) or fetch it once into the cache"""
+        if not self.page_cache:
+            view.LoadURL(url)
+            return
+        self._reference_urls[view] = url
+        cached = self.page_cache.get(url)
+        if cached is None:
+            # Fetch into the cache and render that copy, so the page is downloaded only once
+            self.page_cache.refresh_async(
+                url, callback=lambda fetched_url, status: wx.CallAfter(self._on_reference_fetched, view, url))
+            return
+
+        html, meta = cached
+        view.SetPage(html, url)
+        if not self.page_cache.is_fresh(meta):
+            self.page_cache.refresh_async(url)
+
+    def _on_reference_fetched(self, view, url):
+        """Show a page fetched on a cache miss; load it live if it could not be cached"""
+        if self._reference_urls.get(view) != url:
+            return  # the view has moved on to another element
+        try:
+            cached = self.page_cache.get(url)
+            if cached is not None:
+                view.SetPage(cached[0], url)
+            else:
+                view.LoadURL(url)  # offline, not HTML or too large for the cache
+        except RuntimeError:
+            pass  # dialog closed while fetching
+
+    def _show_cached_fallback(self, event, view, url):
+        """After a failed live load (e.g. offline), show the cached copy of url if there is one"""
+        try:
+            if event.GetInt() == wx.html2.WEBVIEW_NAV_ERR_USER_CANCELLED:
+                return False
+        except Exception:
+            pass
+        cached = self.page_cache.get(url) if self.page_cache else None
+        if cached is None:
+            return False
+        view.SetPage(cached[0], url)
+        return True
+
     def on_tab_changed(self, event):
-        """Handle tab change to update parent's memory"""
+        """Handle tab change to build the page on first use and update parent's memory"""
+        if event.GetEventObject() is self.notebook:
+            self.load_scheduler.set_visible(self._page_load_keys.get(event.GetSelection()))
+            self._ensure_tab_built(event.GetSelection())
         try:
             # Update parent's tab index memory
             if hasattr(self.GetParent(), 'property_dialog_tab_index'):
@@ -1529,7 +6566,9 @@ class ElementPropertiesDialog(wx.Frame):
         # Insert new header at the beginning
         main_sizer.Insert(0, header_panel, 0, wx.ALL | wx.EXPAND, 0)
 
-        # Update web views URLs WITHOUT destroying them
+        # Update web views URLs WITHOUT destroying them; loads still running for the
+        # previous element are stopped and the new ones are queued by priority
+        self.load_scheduler.new_generation()
         if hasattr(self, 'xps_web_view'):
             try:
                 new_xps_url = self.get_xps_fitting_url(new_element)
@@ -1537,7 +6576,7 @@ class ElementPropertiesDialog(wx.Frame):
                 if hasattr(self, 'xps_loading_text'):
                     self.xps_loading_text.SetLabel(f"Loading XPS Fitting database page for {new_element}...")
                     self.xps_loading_text.Show()
-                wx.CallAfter(self.xps_web_view.LoadURL, new_xps_url)
+                self.request_reference_page('xps', self.xps_web_view, new_xps_url)
             except:
                 pass
 
@@ -1548,7 +6587,7 @@ class ElementPropertiesDialog(wx.Frame):
                 if hasattr(self, 'loading_text'):
                     self.loading_text.SetLabel(f"Loading Thermo Fisher knowledge page for {new_element}...")
                     self.loading_text.Show()
-                wx.CallAfter(self.web_view.LoadURL, new_thermo_url)
+                self.request_reference_page('thermo', self.web_view, new_thermo_url)
             except:
                 pass
 
@@ -1559,7 +6598,7 @@ class ElementPropertiesDialog(wx.Frame):
                 if hasattr(self, 'harwell_loading_text'):
                     self.harwell_loading_text.SetLabel(f"Loading Harwell XPS Guru page for {new_element}...")
                     self.harwell_loading_text.Show()
-                wx.CallAfter(self.harwell_web_view.LoadURL, new_harwell_url)
+                self.request_reference_page('harwell', self.harwell_web_view, new_harwell_url)
             except:
                 pass
 
@@ -1637,50 +6676,51 @@ class ElementPropertiesDialog(wx.Frame):
                 old_sizer.Clear(True)
 
             sizer = wx.BoxSizer(wx.VERTICAL)
-
-            # Get XPS data for new element
-            element_data = self.df[self.df['Element'] == self.element]
-
-            if not element_data.empty:
-                # Create grid
-                grid = wx.grid.Grid(xps_page)
-                grid.HideRowLabels()
-
-                # Group by line
-                lines_summary = element_data.groupby('Line')['BE (eV)'].agg(
-                    ['mean', 'count', 'min', 'max']).reset_index()
-
-                grid.CreateGrid(len(lines_summary), 5)
-                grid.SetColLabelValue(0, "Line")
-                grid.SetColLabelValue(1, "Avg BE (eV)")
-                grid.SetColLabelValue(2, "Min BE (eV)")
-                grid.SetColLabelValue(3, "Max BE (eV)")
-                grid.SetColLabelValue(4, "N# of References")
-
-                grid.SetColSize(0, 80)
-                grid.SetColSize(1, 100)
-                grid.SetColSize(2, 100)
-                grid.SetColSize(3, 100)
-                grid.SetColSize(4, 80)
-
-                for i, (_, row) in enumerate(lines_summary.iterrows()):
-                    grid.SetCellValue(i, 0, str(row['Line']))
-                    grid.SetCellValue(i, 1, f"{row['mean']:.2f}")
-                    grid.SetCellValue(i, 2, f"{row['min']:.2f}")
-                    grid.SetCellValue(i, 3, f"{row['max']:.2f}")
-                    grid.SetCellValue(i, 4, str(int(row['count'])))
-
-                grid.EnableEditing(False)
-                sizer.Add(grid, 1, wx.ALL | wx.EXPAND, 5)
-            else:
-                label = wx.StaticText(xps_page, label=f"No XPS data available for {self.element}")
-                sizer.Add(label, 0, wx.ALL | wx.CENTER, 20)
-
+            self._add_line_summary(xps_page, sizer)
             xps_page.SetSizer(sizer)
             xps_page.Layout()
         except:
             pass
 
+    def get_line_summary(self):
+        """Per-line BE statistics of the current element, from the cached LineStatistics"""
+        line_stats = getattr(self.GetParent(), 'line_stats', None)
+        if line_stats is None:
+            line_stats = LineStatistics.compute(self.df[self.df['Element'] == self.element])
+        return line_stats.for_element(self.element)
+
+    def _add_line_summary(self, parent, sizer):
+        """Add the per-line statistics grid (or a 'no data' label) to sizer"""
+        lines_summary = self.get_line_summary()
+
+        if lines_summary.empty:
+            label = wx.StaticText(parent, label=f"No XPS data available for {self.element}")
+            sizer.Add(label, 0, wx.ALL | wx.CENTER, 20)
+            return
+
+        grid = wx.grid.Grid(parent)
+        grid.HideRowLabels()
+
+        columns = [("Line", 80, None), ("Avg BE (eV)", 90, 'mean'), ("Median BE (eV)", 100, 'median'),
+                   ("Min BE (eV)", 90, 'min'), ("Max BE (eV)", 90, 'max'), ("Std (eV)", 70, 'std'),
+                   ("N# of References", 80, 'count')]
+        grid.CreateGrid(len(lines_summary), len(columns))
+        for col, (label, width, _) in enumerate(columns):
+            grid.SetColLabelValue(col, label)
+            grid.SetColSize(col, width)
+
+        for i, (line, row) in enumerate(lines_summary.iterrows()):
+            grid.SetCellValue(i, 0, str(line))
+            for col, (_, _, key) in enumerate(columns[1:], start=1):
+                value = row[key]
+                if key == 'count':
+                    grid.SetCellValue(i, col, str(int(value)))
+                else:
+                    grid.SetCellValue(i, col, f"{value:.2f}" if pd.notnull(value) else "")
+
+        grid.EnableEditing(False)
+        sizer.Add(grid, 1, wx.ALL | wx.EXPAND, 5)
+
 
     def create_properties_tab(self, notebook):
         """Create general properties tab"""
@@ -1737,56 +6777,16 @@ class ElementPropertiesDialog(wx.Frame):
         """Create XPS data tab"""
         panel = wx.Panel(notebook)
         sizer = wx.BoxSizer(wx.VERTICAL)
-
-        # Get XPS data for element
-        element_data = self.df[self.df['Element'] == self.element]
-
-        if not element_data.empty:
-            # Create grid
-            grid = wx.grid.Grid(panel)
-
-            # Hide row labels (row numbers) - ADD THIS LINE
-            grid.HideRowLabels()
-
-            # Group by line
-            lines_summary = element_data.groupby('Line')['BE (eV)'].agg(
-                ['mean', 'count', 'min', 'max']).reset_index()
-
-            # Create grid
-            grid.CreateGrid(len(lines_summary), 5)
-            grid.SetColLabelValue(0, "Line")
-            grid.SetColLabelValue(1, "Avg BE (eV)")
-            grid.SetColLabelValue(2, "Min BE (eV)")
-            grid.SetColLabelValue(3, "Max BE (eV)")
-            grid.SetColLabelValue(4, "N# of References")
-
-            # Set column widths
-            grid.SetColSize(0, 80)
-            grid.SetColSize(1, 100)
-            grid.SetColSize(2, 100)
-            grid.SetColSize(3, 100)
-            grid.SetColSize(4, 80)
-
-            # Populate grid
-            for i, (_, row) in enumerate(lines_summary.iterrows()):
-                grid.SetCellValue(i, 0, str(row['Line']))
-                grid.SetCellValue(i, 1, f"{row['mean']:.2f}")
-                grid.SetCellValue(i, 2, f"{row['min']:.2f}")
-                grid.SetCellValue(i, 3, f"{row['max']:.2f}")
-                grid.SetCellValue(i, 4, str(int(row['count'])))
-
-            grid.EnableEditing(False)
-            sizer.Add(grid, 1, wx.ALL | wx.EXPAND, 5)
-        else:
-            label = wx.StaticText(panel, label="No XPS data available for this element")
-            sizer.Add(label, 0, wx.ALL | wx.CENTER, 20)
-
+        self._add_line_summary(panel, sizer)
         panel.SetSizer(sizer)
         notebook.AddPage(panel, "XPS Data")
 
     def create_thermo_tab(self, notebook):
-        """Create Thermo Knowledge tab with embedded web browser"""
-        panel = wx.Panel(notebook)
+        """Create Thermo Knowledge tab (web browser is created on first selection)"""
+        self._add_lazy_page(notebook, "Thermo Knowledge", self._build_thermo_tab, "thermo")
+
+    def _build_thermo_tab(self, panel):
+        """Build the Thermo Knowledge embedded web browser inside its page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         try:
@@ -1832,8 +6832,8 @@ class ElementPropertiesDialog(wx.Frame):
             # Get the Thermo Fisher URL for this element
             self.thermo_url = self.get_thermo_url(self.element)
 
-            # Load the webpage
-            self.web_view.LoadURL(self.thermo_url)
+            # Queue the webpage load
+            self.request_reference_page('thermo', self.web_view, self.thermo_url)
 
             # Add loading indicator
             loading_text = wx.StaticText(panel, label="Loading Thermo Fisher knowledge page...")
@@ -1858,11 +6858,13 @@ class ElementPropertiesDialog(wx.Frame):
             sizer.Add(error_text, 1, wx.ALL | wx.EXPAND, 20)
 
         panel.SetSizer(sizer)
-        notebook.AddPage(panel, "Thermo Knowledge")
 
     def create_harwell_tab(self, notebook):
-        """Create Harwell XPS Guru tab with embedded web browser"""
-        panel = wx.Panel(notebook)
+        """Create Harwell XPS Guru tab (web browser is created on first selection)"""
+        self._add_lazy_page(notebook, "Harwell XPS Guru", self._build_harwell_tab, "harwell")
+
+    def _build_harwell_tab(self, panel):
+        """Build the Harwell XPS Guru embedded web browser inside its page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         try:
@@ -1908,8 +6910,8 @@ class ElementPropertiesDialog(wx.Frame):
             # Get the Harwell XPS URL for this element
             self.harwell_url = self.get_harwell_url(self.element)
 
-            # Load the Harwell XPS Guru page immediately (no delay)
-            self.harwell_web_view.LoadURL(self.harwell_url)
+            # Queue the Harwell XPS Guru page load (no delay)
+            self.request_reference_page('harwell', self.harwell_web_view, self.harwell_url)
 
             # Add loading indicator
             harwell_loading_text = wx.StaticText(panel, label="Loading Harwell XPS Guru page...")
@@ -1934,7 +6936,6 @@ class ElementPropertiesDialog(wx.Frame):
             sizer.Add(error_text, 1, wx.ALL | wx.EXPAND, 20)
 
         panel.SetSizer(sizer)
-        notebook.AddPage(panel, "Harwell XPS Guru")
 
     def on_harwell_back(self, event):
         """Navigate back in Harwell web view"""
@@ -2007,6 +7008,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_harwell_page_loaded(self, event):
         """Handle successful Harwell page loading"""
+        if not self.load_scheduler.accept_event('harwell', event):
+            return
         try:
             self.harwell_loading_text.Hide()
 
@@ -2033,6 +7036,10 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_harwell_page_error(self, event):
         """Handle Harwell page loading errors"""
+        if not self.load_scheduler.accept_event('harwell', event):
+            return
+        if self._show_cached_fallback(event, self.harwell_web_view, self.harwell_url):
+            return
         try:
             self.harwell_loading_text.SetLabel("Failed to load webpage. Please check your internet connection.")
             self.harwell_loading_text.SetForegroundColour(wx.Colour(200, 0, 0))
@@ -2073,8 +7080,11 @@ class ElementPropertiesDialog(wx.Frame):
             pass
 
     def create_xps_fitting_tab(self, notebook):
-        """Create XPS Fitting tab with embedded web browser"""
-        panel = wx.Panel(notebook)
+        """Create XPS Fitting tab (web browser is created on first selection)"""
+        self._add_lazy_page(notebook, "XPS Fitting", self._build_xps_fitting_tab, "xps")
+
+    def _build_xps_fitting_tab(self, panel):
+        """Build the XPS Fitting embedded web browser inside its page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         try:
@@ -2119,8 +7129,8 @@ class ElementPropertiesDialog(wx.Frame):
             # Get the XPS Fitting URL for this element
             self.xps_url = self.get_xps_fitting_url(self.element)
 
-            # Load the webpage
-            self.xps_web_view.LoadURL(self.xps_url)
+            # Queue the webpage load
+            self.request_reference_page('xps', self.xps_web_view, self.xps_url)
 
             # Add loading indicator
             xps_loading_text = wx.StaticText(panel, label="Loading XPS Fitting database page...")
@@ -2145,7 +7155,6 @@ class ElementPropertiesDialog(wx.Frame):
             sizer.Add(error_text, 1, wx.ALL | wx.EXPAND, 20)
 
         panel.SetSizer(sizer)
-        notebook.AddPage(panel, "XPS Fitting")
 
     def on_refresh_xps(self, event):
         """Refresh the XPS Fitting page"""
@@ -2182,6 +7191,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_xps_page_loaded(self, event):
         """Handle successful XPS page loading"""
+        if not self.load_scheduler.accept_event('xps', event):
+            return
         try:
             # Hide loading text when page is loaded
             self.xps_loading_text.Hide()
@@ -2191,6 +7202,10 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_xps_page_error(self, event):
         """Handle XPS page loading errors"""
+        if not self.load_scheduler.accept_event('xps', event):
+            return
+        if self._show_cached_fallback(event, self.xps_web_view, self.xps_url):
+            return
         try:
             # Show error message
             self.xps_loading_text.SetLabel("Failed to load webpage. Please check your internet connection.")
@@ -2271,6 +7286,8 @@ class ElementPropertiesDialog(wx.Frame):
             pass
     def on_page_loaded(self, event):
         """Handle successful page loading"""
+        if not self.load_scheduler.accept_event('thermo', event):
+            return
         try:
             # Hide loading text when page is loaded
             self.loading_text.Hide()
@@ -2280,6 +7297,10 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_page_error(self, event):
         """Handle page loading errors"""
+        if not self.load_scheduler.accept_event('thermo', event):
+            return
+        if self._show_cached_fallback(event, self.web_view, self.thermo_url):
+            return
         try:
             # Show error message
             self.loading_text.SetLabel("Failed to load webpage. Please check your internet connection.")
@@ -2287,1936 +7308,34 @@ class ElementPropertiesDialog(wx.Frame):
         except:
             pass
 
+    def get_reference_urls(self, element_symbol):
+        """URLs of the cached reference pages for an element (used by the prefetcher)"""
+        return [self.get_xps_fitting_url(element_symbol),
+                self.get_harwell_url(element_symbol),
+                self.get_thermo_url(element_symbol)]
+
     def get_xps_fitting_url(self, element_symbol):
         """Generate XPS Fitting URL for element"""
-        # Map element symbols to exact names used on xpsfitting.com
-        element_names = {
-            'H': 'Hydrogen', 'He': 'Helium', 'Li': 'Lithium', 'Be': 'Beryllium', 'B': 'Boron',
-            'C': 'carbon', 'N': 'Nitrogen', 'O': 'Oxygen', 'F': 'Fluorine', 'Ne': 'Neon',
-            'Na': 'Sodium', 'Mg': 'Magnesium', 'Al': 'Aluminum', 'Si': 'Silicon', 'P': 'Phosphorus',
-            'S': 'Sulphur', 'Cl': 'Chlorine', 'Ar': 'Argon', 'K': 'Potassium', 'Ca': 'Calcium',
-            'Sc': 'Scandium', 'Ti': 'Titanium', 'V': 'Vanadium', 'Cr': 'Chromium', 'Mn': 'Manganese',
-            'Fe': 'Iron', 'Co': 'Cobalt', 'Ni': 'Nickel', 'Cu': 'Copper', 'Zn': 'Zinc',
-            'Ga': 'Gallium', 'Ge': 'Germanium', 'As': 'Arsenic', 'Se': 'Selenium', 'Br': 'Bromine',
-            'Kr': 'Krypton', 'Rb': 'Rubidium', 'Sr': 'Strontium', 'Y': 'Yttrium', 'Zr': 'Zirconium',
-            'Nb': 'Niobium', 'Mo': 'Molybdenum', 'Tc': 'Technetium', 'Ru': 'Ruthenium', 'Rh': 'Rhodium',
-            'Pd': 'Palladium', 'Ag': 'Silver', 'Cd': 'Cadmium', 'In': 'Indium', 'Sn': 'Tin',
-            'Sb': 'Antimony', 'Te': 'Tellurium', 'I': 'Iodine', 'Xe': 'Xenon', 'Cs': 'Caesium',
-            'Ba': 'Barium', 'La': 'Lanthanum', 'Ce': 'Cerium', 'Pr': 'Praseodymium', 'Nd': 'Neodymium',
-            'Pm': 'Promethium', 'Sm': 'Samarium', 'Eu': 'Europium', 'Gd': 'Gadolinium', 'Tb': 'Terbium',
-            'Dy': 'Dysprosium', 'Ho': 'Holmium', 'Er': 'Erbium', 'Tm': 'Thulium', 'Yb': 'Ytterbium',
-            'Lu': 'Lutetium', 'Hf': 'Hafnium', 'Ta': 'Tantalum', 'W': 'Tungsten', 'Re': 'Rhenium',
-            'Os': 'Osmium', 'Ir': 'Iridium', 'Pt': 'Platinum', 'Au': 'Gold', 'Hg': 'Mercury',
-            'Tl': 'Thallium', 'Pb': 'Lead', 'Bi': 'Bismuth', 'Po': 'Polonium', 'At': 'Astatine',
-            'Rn': 'Radon', 'Fr': 'Francium', 'Ra': 'Radium', 'Ac': 'Actinium', 'Th': 'Thorium',
-            'Pa': 'Protactinium', 'U': 'Uranium', 'Np': 'Neptunium', 'Pu': 'Plutonium', 'Am': 'Americium',
-            'Cm': 'Curium', 'Bk': 'Berkelium', 'Cf': 'Californium', 'Es': 'Einsteinium', 'Fm': 'Fermium',
-            'Md': 'Mendelevium', 'No': 'Nobelium', 'Lr': 'Lawrencium'
-        }
-
-        element_name = element_names.get(element_symbol, element_symbol)
-        return f"https://www.xpsfitting.com/search/label/{element_name}"
+        return get_element_record(element_symbol).xps_fitting_url
 
     def get_thermo_url(self, element_symbol):
         """Generate Thermo Fisher URL for element"""
-        # Map element symbols to their category paths for Thermo URLs
-        element_categories = {
-            'H': 'non-metal/hydrogen', 'He': 'noble-gas/helium', 'Li': 'alkali-metal/lithium',
-            'Be': 'alkaline-earth-metal/beryllium', 'B': 'metalloid/boron', 'C': 'non-metal/carbon',
-            'N': 'non-metal/nitrogen', 'O': 'non-metal/oxygen', 'F': 'halogen/fluorine',
-            'Ne': 'noble-gas/neon', 'Na': 'alkali-metal/sodium', 'Mg': 'alkaline-earth-metal/magnesium',
-            'Al': 'other-metal/aluminium', 'Si': 'metalloid/silicon', 'P': 'non-metal/phosphorus',
-            'S': 'non-metal/sulfur', 'Cl': 'halogen/chlorine', 'Ar': 'noble-gas/argon',
-            'K': 'alkali-metal/potassium', 'Ca': 'alkaline-earth-metal/calcium',
-            'Sc': 'transition-metal/scandium', 'Ti': 'transition-metal/titanium',
-            'V': 'transition-metal/vanadium', 'Cr': 'transition-metal/chromium',
-            'Mn': 'transition-metal/manganese', 'Fe': 'transition-metal/iron',
-            'Co': 'transition-metal/cobalt', 'Ni': 'transition-metal/nickel',
-            'Cu': 'transition-metal/copper', 'Zn': 'transition-metal/zinc',
-            'Ga': 'other-metal/gallium', 'Ge': 'metalloid/germanium',
-            'As': 'metalloid/arsenic', 'Se': 'non-metal/selenium', 'Br': 'halogen/bromine',
-            'Kr': 'noble-gas/krypton', 'Rb': 'alkali-metal/rubidium',
-            'Sr': 'alkaline-earth-metal/strontium', 'Y': 'transition-metal/yttrium',
-            'Zr': 'transition-metal/zirconium', 'Nb': 'transition-metal/niobium',
-            'Mo': 'transition-metal/molybdenum', 'Tc': 'transition-metal/technetium',
-            'Ru': 'transition-metal/ruthenium', 'Rh': 'transition-metal/rhodium',
-            'Pd': 'transition-metal/palladium', 'Ag': 'transition-metal/silver',
-            'Cd': 'transition-metal/cadmium', 'In': 'other-metal/indium',
-            'Sn': 'other-metal/tin', 'Sb': 'metalloid/antimony',
-            'Te': 'metalloid/tellurium', 'I': 'halogen/iodine', 'Xe': 'noble-gas/xenon',
-            'Cs': 'alkali-metal/cesium', 'Ba': 'alkaline-earth-metal/barium',
-            'La': 'lanthanide-rare-earth/lanthanum', 'Ce': 'lanthanide-rare-earth/cerium', 'Pr': 'lanthanide-rare-earth/praseodymium',
-            'Nd': 'lanthanide-rare-earth/neodymium', 'Pm': 'lanthanide-rare-earth/promethium', 'Sm': 'lanthanide-rare-earth/samarium',
-            'Eu': 'lanthanide-rare-earth/europium', 'Gd': 'lanthanide-rare-earth/gadolinium', 'Tb': 'lanthanide-rare-earth/terbium',
-            'Dy': 'lanthanide-rare-earth/dysprosium', 'Ho': 'lanthanide-rare-earth/holmium', 'Er': 'lanthanide-rare-earth/erbium',
-            'Tm': 'lanthanide-rare-earth/thulium', 'Yb': 'lanthanide-rare-earth/ytterbium', 'Lu': 'lanthanide-rare-earth/lutetium',
-            'Hf': 'transition-metal/hafnium', 'Ta': 'transition-metal/tantalum',
-            'W': 'transition-metal/tungsten', 'Re': 'transition-metal/rhenium',
-            'Os': 'transition-metal/osmium', 'Ir': 'transition-metal/iridium',
-            'Pt': 'transition-metal/platinum', 'Au': 'transition-metal/gold',
-            'Hg': 'transition-metal/mercury', 'Tl': 'other-metal/thallium',
-            'Pb': 'other-metal/lead', 'Bi': 'other-metal/bismuth',
-            'Po': 'metalloid/polonium', 'At': 'halogen/astatine', 'Rn': 'noble-gas/radon',
-            'Fr': 'alkali-metal/francium', 'Ra': 'alkaline-earth-metal/radium',
-            'Ac': 'actinide/actinium', 'Th': 'actinide/thorium', 'Pa': 'actinide/protactinium',
-            'U': 'actinide/uranium', 'Np': 'actinide/neptunium', 'Pu': 'actinide/plutonium',
-            'Am': 'actinide/americium', 'Cm': 'actinide/curium', 'Bk': 'actinide/berkelium',
-            'Cf': 'actinide/californium', 'Es': 'actinide/einsteinium', 'Fm': 'actinide/fermium',
-            'Md': 'actinide/mendelevium', 'No': 'actinide/nobelium', 'Lr': 'actinide/lawrencium'
-        }
-
-        category_path = element_categories.get(element_symbol, f'unknown/{element_symbol.lower()}')
-        return f"https://www.thermofisher.com/uk/en/home/materials-science/learning-center/periodic-table/{category_path}.html"
+        return get_element_record(element_symbol).thermo_url
 
     def get_harwell_url(self, element_symbol):
         """Generate Harwell XPS Guru URL for element"""
-        # Map element symbols to full element names in lowercase
-        element_names = {
-            'H': 'hydrogen', 'He': 'helium', 'Li': 'lithium', 'Be': 'beryllium', 'B': 'boron',
-            'C': 'carbon', 'N': 'nitrogen', 'O': 'oxygen', 'F': 'fluorine', 'Ne': 'neon',
-            'Na': 'sodium', 'Mg': 'magnesium', 'Al': 'aluminium', 'Si': 'silicon', 'P': 'phosphorus',
-            'S': 'sulfur', 'Cl': 'chlorine', 'Ar': 'argon', 'K': 'potassium', 'Ca': 'calcium',
-            'Sc': 'scandium', 'Ti': 'titanium', 'V': 'vanadium', 'Cr': 'chromium', 'Mn': 'manganese',
-            'Fe': 'iron', 'Co': 'cobalt', 'Ni': 'nickel', 'Cu': 'copper', 'Zn': 'zinc',
-            'Ga': 'gallium', 'Ge': 'germanium', 'As': 'arsenic', 'Se': 'selenium', 'Br': 'bromine',
-            'Kr': 'krypton', 'Rb': 'rubidium', 'Sr': 'strontium', 'Y': 'yttrium', 'Zr': 'zirconium',
-            'Nb': 'niobium', 'Mo': 'molybdenum', 'Tc': 'technetium', 'Ru': 'ruthenium', 'Rh': 'rhodium',
-            'Pd': 'palladium', 'Ag': 'silver', 'Cd': 'cadmium', 'In': 'indium', 'Sn': 'tin',
-            'Sb': 'antimony', 'Te': 'tellurium', 'I': 'iodine', 'Xe': 'xenon', 'Cs': 'caesium',
-            'Ba': 'barium', 'La': 'lanthanum', 'Ce': 'cerium', 'Pr': 'praseodymium', 'Nd': 'neodymium',
-            'Pm': 'promethium', 'Sm': 'samarium', 'Eu': 'europium', 'Gd': 'gadolinium', 'Tb': 'terbium',
-            'Dy': 'dysprosium', 'Ho': 'holmium', 'Er': 'erbium', 'Tm': 'thulium', 'Yb': 'ytterbium',
-            'Lu': 'lutetium', 'Hf': 'hafnium', 'Ta': 'tantalum', 'W': 'tungsten', 'Re': 'rhenium',
-            'Os': 'osmium', 'Ir': 'iridium', 'Pt': 'platinum', 'Au': 'gold', 'Hg': 'mercury',
-            'Tl': 'thallium', 'Pb': 'lead', 'Bi': 'bismuth', 'Po': 'polonium', 'At': 'astatine',
-            'Rn': 'radon', 'Fr': 'francium', 'Ra': 'radium', 'Ac': 'actinium', 'Th': 'thorium',
-            'Pa': 'protactinium', 'U': 'uranium', 'Np': 'neptunium', 'Pu': 'plutonium', 'Am': 'americium',
-            'Cm': 'curium', 'Bk': 'berkelium', 'Cf': 'californium', 'Es': 'einsteinium', 'Fm': 'fermium',
-            'Md': 'mendelevium', 'No': 'nobelium', 'Lr': 'lawrencium'
-        }
-
-        element_name = element_names.get(element_symbol, element_symbol.lower())
-        return f"https://www.harwellxps.guru/xpskb/{element_name}/"
+        return get_element_record(element_symbol).harwell_url
 
     def get_element_properties(self, element_symbol):
-        """Get properties for a specific element"""
-        # Comprehensive database of element properties based on reference tables
-        element_properties = {
-            "H": {
-                "Name": "Hydrogen",
-                "Atomic Number": 1,
-                "Atomic Mass": "1.00794 u",
-                "Density": "0.0708 g/cm³",
-                "Melting Point": "-259.34 °C",
-                "Boiling Point": "-252.87 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 2.20,
-                "Atomic Radius": "53 pm",
-                "Ionization Energy": "13.598 eV",
-                "Specific Heat": "14.304 J/(g·K)",
-                "Group": 1,
-                "Period": 1,
-                "Category": "Nonmetal",
-                "Common Core Levels": "1s",
-                "Most Intense Line": "1s",
-                "Typical FWHM": "0.9-1.2 eV",
-                "Chemical Shift Range": "0-3 eV"
-            },
-            "He": {
-                "Name": "Helium",
-                "Atomic Number": 2,
-                "Atomic Mass": "4.002602 u",
-                "Density": "0.122 g/cm³",
-                "Melting Point": "— °C",
-                "Boiling Point": "-268.93 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": "N/A",
-                "Atomic Radius": "31 pm",
-                "Ionization Energy": "24.587 eV",
-                "Specific Heat": "5.193 J/(g·K)",
-                "Group": 18,
-                "Period": 1,
-                "Category": "Noble Gas"
-            },
-            "Li": {
-                "Name": "Lithium",
-                "Atomic Number": 3,
-                "Atomic Mass": "6.941 u",
-                "Density": "0.534 g/cm³",
-                "Melting Point": "180.50 °C",
-                "Boiling Point": "1342 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "1s² 2s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.98,
-                "Atomic Radius": "167 pm",
-                "Ionization Energy": "5.392 eV",
-                "Specific Heat": "3.582 J/(g·K)",
-                "Group": 1,
-                "Period": 2,
-                "Category": "Alkali Metal"
-            },
-            "Be": {
-                "Name": "Beryllium",
-                "Atomic Number": 4,
-                "Atomic Mass": "9.012182 u",
-                "Density": "1.848 g/cm³",
-                "Melting Point": "1287 °C",
-                "Boiling Point": "2471 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "1s² 2s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.57,
-                "Atomic Radius": "112 pm",
-                "Ionization Energy": "9.323 eV",
-                "Specific Heat": "1.825 J/(g·K)",
-                "Group": 2,
-                "Period": 2,
-                "Category": "Alkaline Earth Metal"
-            },
-            "B": {
-                "Name": "Boron",
-                "Atomic Number": 5,
-                "Atomic Mass": "10.811 u",
-                "Density": "2.34 g/cm³",
-                "Melting Point": "2075 °C",
-                "Boiling Point": "4000 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "1s² 2s² 2p¹",
-                "Ground State": "²P°₁/₂",
-                "Electronegativity": 2.04,
-                "Atomic Radius": "87 pm",
-                "Ionization Energy": "8.298 eV",
-                "Specific Heat": "1.026 J/(g·K)",
-                "Group": 13,
-                "Period": 2,
-                "Category": "Metalloid"
-            },
-            "C": {
-                "Name": "Carbon",
-                "Atomic Number": 6,
-                "Atomic Mass": "12.0107 u",
-                "Density": "1.9-2.3 (graphite) g/cm³",
-                "Melting Point": "4492 (10.3 MPa) °C",
-                "Boiling Point": "3825ᵇ °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "1s² 2s² 2p²",
-                "Ground State": "³P₀",
-                "Electronegativity": 2.55,
-                "Atomic Radius": "67 pm",
-                "Ionization Energy": "11.260 eV",
-                "Specific Heat": "0.709 J/(g·K)",
-                "Group": 14,
-                "Period": 2,
-                "Category": "Nonmetal",
-                "Common Core Levels": "1s, 2s, 2p",
-                "Most Intense Line": "1s",
-                "Typical FWHM": "0.8-1.2 eV",
-                "Chemical Shift Range": "0-10 eV"
-            },
-            "N": {
-                "Name": "Nitrogen",
-                "Atomic Number": 7,
-                "Atomic Mass": "14.00674 u",
-                "Density": "0.808 g/cm³",
-                "Melting Point": "-210.00 °C",
-                "Boiling Point": "-195.79 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s² 2s² 2p³",
-                "Ground State": "⁴S°₃/₂",
-                "Electronegativity": 3.04,
-                "Atomic Radius": "56 pm",
-                "Ionization Energy": "14.534 eV",
-                "Specific Heat": "1.040 J/(g·K)",
-                "Group": 15,
-                "Period": 2,
-                "Category": "Nonmetal"
-            },
-            "O": {
-                "Name": "Oxygen",
-                "Atomic Number": 8,
-                "Atomic Mass": "15.9994 u",
-                "Density": "1.14 g/cm³",
-                "Melting Point": "-218.79 °C",
-                "Boiling Point": "-182.95 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s² 2s² 2p⁴",
-                "Ground State": "³P₂",
-                "Electronegativity": 3.44,
-                "Atomic Radius": "48 pm",
-                "Ionization Energy": "13.618 eV",
-                "Specific Heat": "0.918 J/(g·K)",
-                "Group": 16,
-                "Period": 2,
-                "Category": "Nonmetal",
-                "Common Core Levels": "1s, 2s, 2p",
-                "Most Intense Line": "1s",
-                "Typical FWHM": "0.9-1.3 eV",
-                "Chemical Shift Range": "0-8 eV"
-            },
-            "F": {
-                "Name": "Fluorine",
-                "Atomic Number": 9,
-                "Atomic Mass": "18.9984032 u",
-                "Density": "1.50 g/cm³",
-                "Melting Point": "-219.62 °C",
-                "Boiling Point": "-188.12 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s² 2s² 2p⁵",
-                "Ground State": "²P°₃/₂",
-                "Electronegativity": 3.98,
-                "Atomic Radius": "42 pm",
-                "Ionization Energy": "17.423 eV",
-                "Specific Heat": "0.824 J/(g·K)",
-                "Group": 17,
-                "Period": 2,
-                "Category": "Halogen"
-            },
-            "Ne": {
-                "Name": "Neon",
-                "Atomic Number": 10,
-                "Atomic Mass": "20.1797 u",
-                "Density": "1.207 g/cm³",
-                "Melting Point": "-248.59 °C",
-                "Boiling Point": "-246.08 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "1s² 2s² 2p⁶",
-                "Ground State": "¹S₀",
-                "Electronegativity": "N/A",
-                "Atomic Radius": "38 pm",
-                "Ionization Energy": "21.565 eV",
-                "Specific Heat": "1.030 J/(g·K)",
-                "Group": 18,
-                "Period": 2,
-                "Category": "Noble Gas"
-            },
-            "Na": {
-                "Name": "Sodium",
-                "Atomic Number": 11,
-                "Atomic Mass": "22.989770 u",
-                "Density": "0.971 g/cm³",
-                "Melting Point": "97.80 °C",
-                "Boiling Point": "883 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.93,
-                "Atomic Radius": "190 pm",
-                "Ionization Energy": "5.139 eV",
-                "Specific Heat": "1.228 J/(g·K)",
-                "Group": 1,
-                "Period": 3,
-                "Category": "Alkali Metal"
-            },
-            "Mg": {
-                "Name": "Magnesium",
-                "Atomic Number": 12,
-                "Atomic Mass": "24.3050 u",
-                "Density": "1.738 g/cm³",
-                "Melting Point": "650 °C",
-                "Boiling Point": "1090 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.31,
-                "Atomic Radius": "145 pm",
-                "Ionization Energy": "7.646 eV",
-                "Specific Heat": "1.023 J/(g·K)",
-                "Group": 2,
-                "Period": 3,
-                "Category": "Alkaline Earth Metal"
-            },
-            "Al": {
-                "Name": "Aluminum",
-                "Atomic Number": 13,
-                "Atomic Mass": "26.981538 u",
-                "Density": "2.6989 g/cm³",
-                "Melting Point": "660.32 °C",
-                "Boiling Point": "2519 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s² 3p¹",
-                "Ground State": "²P°₁/₂",
-                "Electronegativity": 1.61,
-                "Atomic Radius": "118 pm",
-                "Ionization Energy": "5.986 eV",
-                "Specific Heat": "0.897 J/(g·K)",
-                "Group": 13,
-                "Period": 3,
-                "Category": "Post-Transition Metal"
-            },
-            "Si": {
-                "Name": "Silicon",
-                "Atomic Number": 14,
-                "Atomic Mass": "28.0855 u",
-                "Density": "2.3325 g/cm³",
-                "Melting Point": "1414 °C",
-                "Boiling Point": "3265 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s² 3p²",
-                "Ground State": "³P₀",
-                "Electronegativity": 1.90,
-                "Atomic Radius": "111 pm",
-                "Ionization Energy": "8.152 eV",
-                "Specific Heat": "0.705 J/(g·K)",
-                "Group": 14,
-                "Period": 3,
-                "Category": "Metalloid"
-            },
-            "P": {
-                "Name": "Phosphorus",
-                "Atomic Number": 15,
-                "Atomic Mass": "30.973761 u",
-                "Density": "1.82 g/cm³",
-                "Melting Point": "44.15 °C",
-                "Boiling Point": "280.5 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s² 3p³",
-                "Ground State": "⁴S°₃/₂",
-                "Electronegativity": 2.19,
-                "Atomic Radius": "98 pm",
-                "Ionization Energy": "10.487 eV",
-                "Specific Heat": "0.769 J/(g·K)",
-                "Group": 15,
-                "Period": 3,
-                "Category": "Nonmetal"
-            },
-            "S": {
-                "Name": "Sulphur",
-                "Atomic Number": 16,
-                "Atomic Mass": "32.066 u",
-                "Density": "2.07 g/cm³",
-                "Melting Point": "119.6 °C",
-                "Boiling Point": "444.60 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ne] 3s² 3p⁴",
-                "Ground State": "³P₂",
-                "Electronegativity": 2.58,
-                "Atomic Radius": "88 pm",
-                "Ionization Energy": "10.360 eV",
-                "Specific Heat": "0.710 J/(g·K)",
-                "Group": 16,
-                "Period": 3,
-                "Category": "Nonmetal"
-            },
-            "Cl": {
-                "Name": "Chlorine",
-                "Atomic Number": 17,
-                "Atomic Mass": "35.4527 u",
-                "Density": "1.56 (3.3, 6) g/cm³",
-                "Melting Point": "-101.5 °C",
-                "Boiling Point": "-34.04 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "[Ne] 3s² 3p⁵",
-                "Ground State": "²P°₃/₂",
-                "Electronegativity": 3.16,
-                "Atomic Radius": "79 pm",
-                "Ionization Energy": "12.968 eV",
-                "Specific Heat": "0.479 J/(g·K)",
-                "Group": 17,
-                "Period": 3,
-                "Category": "Halogen"
-            },
-            "Ar": {
-                "Name": "Argon",
-                "Atomic Number": 18,
-                "Atomic Mass": "39.948 u",
-                "Density": "1.40 g/cm³",
-                "Melting Point": "-189.35 °C",
-                "Boiling Point": "-185.85 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "[Ne] 3s² 3p⁶",
-                "Ground State": "¹S₀",
-                "Electronegativity": "N/A",
-                "Atomic Radius": "71 pm",
-                "Ionization Energy": "15.760 eV",
-                "Specific Heat": "0.520 J/(g·K)",
-                "Group": 18,
-                "Period": 3,
-                "Category": "Noble Gas"
-            },
-            "K": {
-                "Name": "Potassium",
-                "Atomic Number": 19,
-                "Atomic Mass": "39.0983 u",
-                "Density": "0.862 g/cm³",
-                "Melting Point": "63.5 °C",
-                "Boiling Point": "759 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 4s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.82,
-                "Atomic Radius": "243 pm",
-                "Ionization Energy": "4.341 eV",
-                "Specific Heat": "0.757 J/(g·K)",
-                "Group": 1,
-                "Period": 4,
-                "Category": "Alkali Metal"
-            },
-            "Ca": {
-                "Name": "Calcium",
-                "Atomic Number": 20,
-                "Atomic Mass": "40.078 u",
-                "Density": "1.55 g/cm³",
-                "Melting Point": "842 °C",
-                "Boiling Point": "1484 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 4s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.00,
-                "Atomic Radius": "194 pm",
-                "Ionization Energy": "6.113 eV",
-                "Specific Heat": "0.647 J/(g·K)",
-                "Group": 2,
-                "Period": 4,
-                "Category": "Alkaline Earth Metal"
-            },
-            "Sc": {
-                "Name": "Scandium",
-                "Atomic Number": 21,
-                "Atomic Mass": "44.955912 u",
-                "Density": "2.989 g/cm³",
-                "Melting Point": "1541 °C",
-                "Boiling Point": "2836 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹ 4s²",
-                "Ground State": "²D₃/₂",
-                "Electronegativity": 1.36,
-                "Atomic Radius": "184 pm",
-                "Ionization Energy": "6.561 eV",
-                "Specific Heat": "0.568 J/(g·K)",
-                "Group": 3,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Lars Fredrik Nilson",
-                "Year of Discovery": 1879
-            },
-            "Ti": {
-                "Name": "Titanium",
-                "Atomic Number": 22,
-                "Atomic Mass": "47.867 u",
-                "Density": "4.54 g/cm³",
-                "Melting Point": "1668 °C",
-                "Boiling Point": "3287 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d² 4s²",
-                "Ground State": "³F₂",
-                "Electronegativity": 1.54,
-                "Atomic Radius": "176 pm",
-                "Ionization Energy": "6.828 eV",
-                "Specific Heat": "0.523 J/(g·K)",
-                "Group": 4,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "William Gregor",
-                "Year of Discovery": 1791
-            },
-            "V": {
-                "Name": "Vanadium",
-                "Atomic Number": 23,
-                "Atomic Mass": "50.9415 u",
-                "Density": "6.11 g/cm³",
-                "Melting Point": "1910 °C",
-                "Boiling Point": "3407 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d³ 4s²",
-                "Ground State": "⁴F₃/₂",
-                "Electronegativity": 1.63,
-                "Atomic Radius": "171 pm",
-                "Ionization Energy": "6.746 eV",
-                "Specific Heat": "0.489 J/(g·K)",
-                "Group": 5,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Andrés Manuel del Río",
-                "Year of Discovery": 1801
-            },
-            "Cr": {
-                "Name": "Chromium",
-                "Atomic Number": 24,
-                "Atomic Mass": "51.9961 u",
-                "Density": "7.15 g/cm³",
-                "Melting Point": "1907 °C",
-                "Boiling Point": "2671 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d⁵ 4s¹",
-                "Ground State": "⁷S₃",
-                "Electronegativity": 1.66,
-                "Atomic Radius": "166 pm",
-                "Ionization Energy": "6.767 eV",
-                "Specific Heat": "0.449 J/(g·K)",
-                "Group": 6,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Louis Nicolas Vauquelin",
-                "Year of Discovery": 1797
-            },
-            "Mn": {
-                "Name": "Manganese",
-                "Atomic Number": 25,
-                "Atomic Mass": "54.938045 u",
-                "Density": "7.44 g/cm³",
-                "Melting Point": "1246 °C",
-                "Boiling Point": "2061 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d⁵ 4s²",
-                "Ground State": "⁶S₅/₂",
-                "Electronegativity": 1.55,
-                "Atomic Radius": "161 pm",
-                "Ionization Energy": "7.434 eV",
-                "Specific Heat": "0.479 J/(g·K)",
-                "Group": 7,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Johan Gottlieb Gahn",
-                "Year of Discovery": 1774
-            },
-            "Fe": {
-                "Name": "Iron",
-                "Atomic Number": 26,
-                "Atomic Mass": "55.845 u",
-                "Density": "7.874 g/cm³",
-                "Melting Point": "1538 °C",
-                "Boiling Point": "2861 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d⁶ 4s²",
-                "Ground State": "⁵D₄",
-                "Electronegativity": 1.83,
-                "Atomic Radius": "156 pm",
-                "Ionization Energy": "7.902 eV",
-                "Specific Heat": "0.449 J/(g·K)",
-                "Group": 8,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Co": {
-                "Name": "Cobalt",
-                "Atomic Number": 27,
-                "Atomic Mass": "58.933200 u",
-                "Density": "8.9 g/cm³",
-                "Melting Point": "1495 °C",
-                "Boiling Point": "2927 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d⁷ 4s²",
-                "Ground State": "⁴F₉/₂",
-                "Electronegativity": 1.88,
-                "Atomic Radius": "152 pm",
-                "Ionization Energy": "7.881 eV",
-                "Specific Heat": "0.421 J/(g·K)",
-                "Group": 9,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Georg Brandt",
-                "Year of Discovery": 1735
-            },
-            "Ni": {
-                "Name": "Nickel",
-                "Atomic Number": 28,
-                "Atomic Mass": "58.6934 u",
-                "Density": "8.90225 g/cm³",
-                "Melting Point": "1455 °C",
-                "Boiling Point": "2913 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d⁸ 4s²",
-                "Ground State": "³F₄",
-                "Electronegativity": 1.91,
-                "Atomic Radius": "149 pm",
-                "Ionization Energy": "7.640 eV",
-                "Specific Heat": "0.444 J/(g·K)",
-                "Group": 10,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Axel Fredrik Cronstedt",
-                "Year of Discovery": 1751
-            },
-            "Cu": {
-                "Name": "Copper",
-                "Atomic Number": 29,
-                "Atomic Mass": "63.546 u",
-                "Density": "8.96 g/cm³",
-                "Melting Point": "1084.62 °C",
-                "Boiling Point": "2562 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 1.90,
-                "Atomic Radius": "145 pm",
-                "Ionization Energy": "7.726 eV",
-                "Specific Heat": "0.385 J/(g·K)",
-                "Group": 11,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Zn": {
-                "Name": "Zinc",
-                "Atomic Number": 30,
-                "Atomic Mass": "65.39 u",
-                "Density": "7.13325 g/cm³",
-                "Melting Point": "419.53 °C",
-                "Boiling Point": "907 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.65,
-                "Atomic Radius": "142 pm",
-                "Ionization Energy": "9.394 eV",
-                "Specific Heat": "0.388 J/(g·K)",
-                "Group": 12,
-                "Period": 4,
-                "Category": "Transition Metal",
-                "Discovered By": "Andreas Sigismund Marggraf",
-                "Year of Discovery": 1746
-            },
-            # Continue with all other elements...
-            # I'll provide a few more key examples, but you should follow this pattern for all elements:
-
-            "Ga": {
-                "Name": "Gallium",
-                "Atomic Number": 31,
-                "Atomic Mass": "69.723 u",
-                "Density": "5.90429.6 g/cm³",
-                "Melting Point": "29.76 °C",
-                "Boiling Point": "2204 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p¹",
-                "Ground State": "²P₁/₂",
-                "Electronegativity": 1.81,
-                "Atomic Radius": "136 pm",
-                "Ionization Energy": "5.999 eV",
-                "Specific Heat": "0.371 J/(g·K)",
-                "Group": 13,
-                "Period": 4,
-                "Category": "Post-transition Metal",
-                "Discovered By": "Lecoq de Boisbaudran",
-                "Year of Discovery": 1875
-            },
-            "Ge": {
-            "Name": "Germanium",
-            "Atomic Number": 32,
-            "Atomic Mass": "72.61 u",
-            "Density": "5.32325 g/cm³",
-            "Melting Point": "938.25 °C",
-            "Boiling Point": "2833 °C",
-            "State at 20°C": "Solid",
-            "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p²",
-            "Ground State": "³P₀",
-            "Electronegativity": 2.01,
-            "Atomic Radius": "125 pm",
-            "Ionization Energy": "7.899 eV",
-            "Specific Heat": "0.320 J/(g·K)",
-            "Group": 14,
-            "Period": 4,
-            "Category": "Metalloid",
-            "Discovered By": "Clemens Winkler",
-            "Year of Discovery": 1886
-            },
-            "As": {
-                "Name": "Arsenic",
-                "Atomic Number": 33,
-                "Atomic Mass": "74.92160 u",
-                "Density": "5.73 g/cm³",
-                "Melting Point": "817 °C (at 28 atm)",
-                "Boiling Point": "603 °C (sublimes)",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p³",
-                "Ground State": "⁴S³/₂",
-                "Electronegativity": 2.18,
-                "Atomic Radius": "114 pm",
-                "Ionization Energy": "9.789 eV",
-                "Specific Heat": "0.329 J/(g·K)",
-                "Group": 15,
-                "Period": 4,
-                "Category": "Metalloid",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Se": {
-                "Name": "Selenium",
-                "Atomic Number": 34,
-                "Atomic Mass": "78.96 u",
-                "Density": "4.79 g/cm³",
-                "Melting Point": "220.5 °C",
-                "Boiling Point": "685 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁴",
-                "Ground State": "³P₂",
-                "Electronegativity": 2.55,
-                "Atomic Radius": "103 pm",
-                "Ionization Energy": "9.752 eV",
-                "Specific Heat": "0.321 J/(g·K)",
-                "Group": 16,
-                "Period": 4,
-                "Category": "Nonmetal",
-                "Discovered By": "Jöns Jakob Berzelius",
-                "Year of Discovery": 1817
-            },
-            "Br": {
-                "Name": "Bromine",
-                "Atomic Number": 35,
-                "Atomic Mass": "79.904 u",
-                "Density": "3.12 g/cm³",
-                "Melting Point": "-7.2 °C",
-                "Boiling Point": "58.8 °C",
-                "State at 20°C": "Liquid",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁵",
-                "Ground State": "²P₃/₂",
-                "Electronegativity": 2.96,
-                "Atomic Radius": "94 pm",
-                "Ionization Energy": "11.814 eV",
-                "Specific Heat": "0.226 J/(g·K)",
-                "Group": 17,
-                "Period": 4,
-                "Category": "Halogen",
-                "Discovered By": "Antoine Jérôme Balard",
-                "Year of Discovery": 1826
-            },
-            "Kr": {
-                "Name": "Krypton",
-                "Atomic Number": 36,
-                "Atomic Mass": "83.80 u",
-                "Density": "2.16 g/cm³",
-                "Melting Point": "-157.37 °C (at 73.2 kPa)",
-                "Boiling Point": "-153.22 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "[Ar] 3d¹⁰ 4s² 4p⁶",
-                "Ground State": "¹S₀",
-                "Electronegativity": 3.00,
-                "Atomic Radius": "88 pm",
-                "Ionization Energy": "14.000 eV",
-                "Specific Heat": "0.248 J/(g·K)",
-                "Group": 18,
-                "Period": 4,
-                "Category": "Noble Gas",
-                "Discovered By": "William Ramsay and Morris Travers",
-                "Year of Discovery": 1898
-            },
-            "Rb": {
-                "Name": "Rubidium",
-                "Atomic Number": 37,
-                "Atomic Mass": "85.4678 u",
-                "Density": "1.532 g/cm³",
-                "Melting Point": "39.30 °C",
-                "Boiling Point": "688 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 5s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.82,
-                "Atomic Radius": "265 pm",
-                "Ionization Energy": "4.177 eV",
-                "Specific Heat": "0.363 J/(g·K)",
-                "Group": 1,
-                "Period": 5,
-                "Category": "Alkali Metal",
-                "Discovered By": "Robert Bunsen and Gustav Kirchhoff",
-                "Year of Discovery": 1861
-            },
-            "Sr": {
-                "Name": "Strontium",
-                "Atomic Number": 38,
-                "Atomic Mass": "87.62 u",
-                "Density": "2.54 g/cm³",
-                "Melting Point": "777 °C",
-                "Boiling Point": "1382 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 5s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 0.95,
-                "Atomic Radius": "219 pm",
-                "Ionization Energy": "5.695 eV",
-                "Specific Heat": "0.301 J/(g·K)",
-                "Group": 2,
-                "Period": 5,
-                "Category": "Alkaline Earth Metal",
-                "Discovered By": "Adair Crawford",
-                "Year of Discovery": 1790
-            },
-            "Y": {
-                "Name": "Yttrium",
-                "Atomic Number": 39,
-                "Atomic Mass": "88.90585 u",
-                "Density": "4.46925 g/cm³",
-                "Melting Point": "1522 °C",
-                "Boiling Point": "3345 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹ 5s²",
-                "Ground State": "²D₃/₂",
-                "Electronegativity": 1.22,
-                "Atomic Radius": "212 pm",
-                "Ionization Energy": "6.217 eV",
-                "Specific Heat": "0.298 J/(g·K)",
-                "Group": 3,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Johan Gadolin",
-                "Year of Discovery": 1794
-            },
-            "Zr": {
-                "Name": "Zirconium",
-                "Atomic Number": 40,
-                "Atomic Mass": "91.224 u",
-                "Density": "6.506 g/cm³",
-                "Melting Point": "1855 °C",
-                "Boiling Point": "4409 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d² 5s²",
-                "Ground State": "³F₂",
-                "Electronegativity": 1.33,
-                "Atomic Radius": "206 pm",
-                "Ionization Energy": "6.634 eV",
-                "Specific Heat": "0.278 J/(g·K)",
-                "Group": 4,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Martin Heinrich Klaproth",
-                "Year of Discovery": 1789
-            },
-            "Nb": {
-                "Name": "Niobium",
-                "Atomic Number": 41,
-                "Atomic Mass": "92.90638 u",
-                "Density": "8.57 g/cm³",
-                "Melting Point": "2477 °C",
-                "Boiling Point": "4744 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d⁴ 5s¹",
-                "Ground State": "⁶D₁/₂",
-                "Electronegativity": 1.6,
-                "Atomic Radius": "198 pm",
-                "Ionization Energy": "6.759 eV",
-                "Specific Heat": "0.265 J/(g·K)",
-                "Group": 5,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Charles Hatchett",
-                "Year of Discovery": 1801
-            },
-            "Mo": {
-                "Name": "Molybdenum",
-                "Atomic Number": 42,
-                "Atomic Mass": "95.94 u",
-                "Density": "10.22 g/cm³",
-                "Melting Point": "2623 °C",
-                "Boiling Point": "4639 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d⁵ 5s¹",
-                "Ground State": "⁷S₃",
-                "Electronegativity": 2.16,
-                "Atomic Radius": "190 pm",
-                "Ionization Energy": "7.092 eV",
-                "Specific Heat": "0.251 J/(g·K)",
-                "Group": 6,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Carl Wilhelm Scheele",
-                "Year of Discovery": 1778
-            },
-            "Tc": {
-                "Name": "Technetium",
-                "Atomic Number": 43,
-                "Atomic Mass": "(98) u",
-                "Density": "11.50 g/cm³",
-                "Melting Point": "2157 °C",
-                "Boiling Point": "4265 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d⁵ 5s²",
-                "Ground State": "⁶S₅/₂",
-                "Electronegativity": 1.9,
-                "Atomic Radius": "183 pm",
-                "Ionization Energy": "7.28 eV",
-                "Specific Heat": "—",
-                "Group": 7,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Carlo Perrier and Emilio Segrè",
-                "Year of Discovery": 1937
-            },
-            "Ru": {
-                "Name": "Ruthenium",
-                "Atomic Number": 44,
-                "Atomic Mass": "101.07 u",
-                "Density": "12.41 g/cm³",
-                "Melting Point": "2334 °C",
-                "Boiling Point": "4150 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d⁷ 5s¹",
-                "Ground State": "⁵F₅",
-                "Electronegativity": 2.2,
-                "Atomic Radius": "178 pm",
-                "Ionization Energy": "7.360 eV",
-                "Specific Heat": "0.238 J/(g·K)",
-                "Group": 8,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Karl Ernst Claus",
-                "Year of Discovery": 1844
-            },
-            "Rh": {
-                "Name": "Rhodium",
-                "Atomic Number": 45,
-                "Atomic Mass": "102.90550 u",
-                "Density": "12.41 g/cm³",
-                "Melting Point": "1964 °C",
-                "Boiling Point": "3695 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d⁸ 5s¹",
-                "Ground State": "⁴F₉/₂",
-                "Electronegativity": 2.28,
-                "Atomic Radius": "173 pm",
-                "Ionization Energy": "7.459 eV",
-                "Specific Heat": "0.243 J/(g·K)",
-                "Group": 9,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "William Hyde Wollaston",
-                "Year of Discovery": 1804
-            },
-            "Pd": {
-                "Name": "Palladium",
-                "Atomic Number": 46,
-                "Atomic Mass": "106.42 u",
-                "Density": "12.02 g/cm³",
-                "Melting Point": "1554.9 °C",
-                "Boiling Point": "2963 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰",
-                "Ground State": "¹S₀",
-                "Electronegativity": 2.20,
-                "Atomic Radius": "169 pm",
-                "Ionization Energy": "8.337 eV",
-                "Specific Heat": "0.246 J/(g·K)",
-                "Group": 10,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "William Hyde Wollaston",
-                "Year of Discovery": 1803
-            },
-            "Ag": {
-                "Name": "Silver",
-                "Atomic Number": 47,
-                "Atomic Mass": "107.8682 u",
-                "Density": "10.50 g/cm³",
-                "Melting Point": "961.78 °C",
-                "Boiling Point": "2162 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 1.93,
-                "Atomic Radius": "165 pm",
-                "Ionization Energy": "7.576 eV",
-                "Specific Heat": "0.235 J/(g·K)",
-                "Group": 11,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Cd": {
-                "Name": "Cadmium",
-                "Atomic Number": 48,
-                "Atomic Mass": "112.411 u",
-                "Density": "8.65 g/cm³",
-                "Melting Point": "321.07 °C",
-                "Boiling Point": "767 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.69,
-                "Atomic Radius": "161 pm",
-                "Ionization Energy": "8.994 eV",
-                "Specific Heat": "0.232 J/(g·K)",
-                "Group": 12,
-                "Period": 5,
-                "Category": "Transition Metal",
-                "Discovered By": "Friedrich Stromeyer",
-                "Year of Discovery": 1817
-            },
-            "In": {
-                "Name": "Indium",
-                "Atomic Number": 49,
-                "Atomic Mass": "114.818 u",
-                "Density": "7.31 g/cm³",
-                "Melting Point": "156.60 °C",
-                "Boiling Point": "2072 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p¹",
-                "Ground State": "²P₁/₂",
-                "Electronegativity": 1.78,
-                "Atomic Radius": "156 pm",
-                "Ionization Energy": "5.786 eV",
-                "Specific Heat": "0.233 J/(g·K)",
-                "Group": 13,
-                "Period": 5,
-                "Category": "Post-transition Metal",
-                "Discovered By": "Ferdinand Reich and Hieronymous Theodor Richter",
-                "Year of Discovery": 1863
-            },
-            "Sn": {
-                "Name": "Tin",
-                "Atomic Number": 50,
-                "Atomic Mass": "118.710 u",
-                "Density": "7.31 g/cm³",
-                "Melting Point": "231.93 °C",
-                "Boiling Point": "2602 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p²",
-                "Ground State": "³P₀",
-                "Electronegativity": 1.96,
-                "Atomic Radius": "145 pm",
-                "Ionization Energy": "7.344 eV",
-                "Specific Heat": "0.228 J/(g·K)",
-                "Group": 14,
-                "Period": 5,
-                "Category": "Post-transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Sb": {
-                "Name": "Antimony",
-                "Atomic Number": 51,
-                "Atomic Mass": "121.760 u",
-                "Density": "6.691 g/cm³",
-                "Melting Point": "630.73 °C",
-                "Boiling Point": "1587 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p³",
-                "Ground State": "⁴S₃/₂",
-                "Electronegativity": 2.05,
-                "Atomic Radius": "133 pm",
-                "Ionization Energy": "8.608 eV",
-                "Specific Heat": "0.207 J/(g·K)",
-                "Group": 15,
-                "Period": 5,
-                "Category": "Metalloid",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Te": {
-                "Name": "Tellurium",
-                "Atomic Number": 52,
-                "Atomic Mass": "127.60 u",
-                "Density": "6.24 g/cm³",
-                "Melting Point": "449.51 °C",
-                "Boiling Point": "988 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁴",
-                "Ground State": "³P₂",
-                "Electronegativity": 2.1,
-                "Atomic Radius": "123 pm",
-                "Ionization Energy": "9.010 eV",
-                "Specific Heat": "0.202 J/(g·K)",
-                "Group": 16,
-                "Period": 5,
-                "Category": "Metalloid",
-                "Discovered By": "Franz-Joseph Müller von Reichenstein",
-                "Year of Discovery": 1782
-            },
-            "I": {
-                "Name": "Iodine",
-                "Atomic Number": 53,
-                "Atomic Mass": "126.90447 u",
-                "Density": "4.93 g/cm³",
-                "Melting Point": "113.7 °C",
-                "Boiling Point": "184.4 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁵",
-                "Ground State": "²P₃/₂",
-                "Electronegativity": 2.66,
-                "Atomic Radius": "115 pm",
-                "Ionization Energy": "10.451 eV",
-                "Specific Heat": "0.145 J/(g·K)",
-                "Group": 17,
-                "Period": 5,
-                "Category": "Halogen",
-                "Discovered By": "Bernard Courtois",
-                "Year of Discovery": 1811
-            },
-            "Xe": {
-                "Name": "Xenon",
-                "Atomic Number": 54,
-                "Atomic Mass": "131.29 u",
-                "Density": "3.52 g/cm³",
-                "Melting Point": "-111.79 °C (at 81.6 kPa)",
-                "Boiling Point": "-108.12 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "[Kr] 4d¹⁰ 5s² 5p⁶",
-                "Ground State": "¹S₀",
-                "Electronegativity": 2.60,
-                "Atomic Radius": "108 pm",
-                "Ionization Energy": "12.130 eV",
-                "Specific Heat": "0.158 J/(g·K)",
-                "Group": 18,
-                "Period": 5,
-                "Category": "Noble Gas",
-                "Discovered By": "William Ramsay and Morris Travers",
-                "Year of Discovery": 1898
-            },
-            "Cs": {
-                "Name": "Cesium",
-                "Atomic Number": 55,
-                "Atomic Mass": "132.90545 u",
-                "Density": "1.873 g/cm³",
-                "Melting Point": "28.5 °C",
-                "Boiling Point": "671 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 6s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.79,
-                "Atomic Radius": "298 pm",
-                "Ionization Energy": "3.894 eV",
-                "Specific Heat": "0.242 J/(g·K)",
-                "Group": 1,
-                "Period": 6,
-                "Category": "Alkali Metal",
-                "Discovered By": "Robert Bunsen and Gustav Kirchhoff",
-                "Year of Discovery": 1860
-            },
-            "Ba": {
-                "Name": "Barium",
-                "Atomic Number": 56,
-                "Atomic Mass": "137.327 u",
-                "Density": "3.5 g/cm³",
-                "Melting Point": "727 °C",
-                "Boiling Point": "1897 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 6s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 0.89,
-                "Atomic Radius": "253 pm",
-                "Ionization Energy": "5.212 eV",
-                "Specific Heat": "0.204 J/(g·K)",
-                "Group": 2,
-                "Period": 6,
-                "Category": "Alkaline Earth Metal",
-                "Discovered By": "Humphry Davy",
-                "Year of Discovery": 1808
-            },
-            "La": {
-                "Name": "Lanthanum",
-                "Atomic Number": 57,
-                "Atomic Mass": "138.9055 u",
-                "Density": "6.14525 g/cm³",
-                "Melting Point": "918 °C",
-                "Boiling Point": "3464 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 5d¹ 6s²",
-                "Ground State": "²D₃/₂",
-                "Electronegativity": 1.10,
-                "Atomic Radius": "240 pm",
-                "Ionization Energy": "5.577 eV",
-                "Specific Heat": "0.195 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Carl Gustaf Mosander",
-                "Year of Discovery": 1839
-            },
-            "Ce": {
-                "Name": "Cerium",
-                "Atomic Number": 58,
-                "Atomic Mass": "140.116 u",
-                "Density": "6.77025 g/cm³",
-                "Melting Point": "798 °C",
-                "Boiling Point": "3443 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹ 5d¹ 6s²",
-                "Ground State": "¹G₄",
-                "Electronegativity": 1.12,
-                "Atomic Radius": "235 pm",
-                "Ionization Energy": "5.539 eV",
-                "Specific Heat": "0.192 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Martin Heinrich Klaproth, Jöns Jakob Berzelius, Wilhelm Hisinger",
-                "Year of Discovery": 1803
-            },
-            "Pr": {
-                "Name": "Praseodymium",
-                "Atomic Number": 59,
-                "Atomic Mass": "140.90765 u",
-                "Density": "6.773 g/cm³",
-                "Melting Point": "931 °C",
-                "Boiling Point": "3520 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f³ 6s²",
-                "Ground State": "⁴I₉/₂",
-                "Electronegativity": 1.13,
-                "Atomic Radius": "239 pm",
-                "Ionization Energy": "5.473 eV",
-                "Specific Heat": "0.193 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Carl Auer von Welsbach",
-                "Year of Discovery": 1885
-            },
-            "Nd": {
-                "Name": "Neodymium",
-                "Atomic Number": 60,
-                "Atomic Mass": "144.24 u",
-                "Density": "7.00825 g/cm³",
-                "Melting Point": "1021 °C",
-                "Boiling Point": "3074 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁴ 6s²",
-                "Ground State": "⁵I₄",
-                "Electronegativity": 1.14,
-                "Atomic Radius": "229 pm",
-                "Ionization Energy": "5.525 eV",
-                "Specific Heat": "0.190 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Carl Auer von Welsbach",
-                "Year of Discovery": 1885
-            },
-            "Pm": {
-                "Name": "Promethium",
-                "Atomic Number": 61,
-                "Atomic Mass": "(145) u",
-                "Density": "7.26425 g/cm³",
-                "Melting Point": "1042 °C",
-                "Boiling Point": "3000 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁵ 6s²",
-                "Ground State": "⁶H₅/₂",
-                "Electronegativity": 1.13,
-                "Atomic Radius": "236 pm",
-                "Ionization Energy": "5.582 eV",
-                "Specific Heat": "—",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Jacob A. Marinsky, Lawrence E. Glendenin, Charles D. Coryell",
-                "Year of Discovery": 1945
-            },
-            "Sm": {
-                "Name": "Samarium",
-                "Atomic Number": 62,
-                "Atomic Mass": "150.36 u",
-                "Density": "7.52025 g/cm³",
-                "Melting Point": "1074 °C",
-                "Boiling Point": "1794 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁶ 6s²",
-                "Ground State": "⁷F₀",
-                "Electronegativity": 1.17,
-                "Atomic Radius": "229 pm",
-                "Ionization Energy": "5.644 eV",
-                "Specific Heat": "0.197 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Paul Émile Lecoq de Boisbaudran",
-                "Year of Discovery": 1879
-            },
-            "Eu": {
-                "Name": "Europium",
-                "Atomic Number": 63,
-                "Atomic Mass": "151.964 u",
-                "Density": "5.24425 g/cm³",
-                "Melting Point": "822 °C",
-                "Boiling Point": "1529 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁷ 6s²",
-                "Ground State": "⁸S₇/₂",
-                "Electronegativity": 1.2,
-                "Atomic Radius": "233 pm",
-                "Ionization Energy": "5.670 eV",
-                "Specific Heat": "0.182 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Eugène-Anatole Demarçay",
-                "Year of Discovery": 1901
-            },
-            "Gd": {
-                "Name": "Gadolinium",
-                "Atomic Number": 64,
-                "Atomic Mass": "157.25 u",
-                "Density": "7.90125 g/cm³",
-                "Melting Point": "1313 °C",
-                "Boiling Point": "3273 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁷ 5d¹ 6s²",
-                "Ground State": "⁹D₂",
-                "Electronegativity": 1.20,
-                "Atomic Radius": "237 pm",
-                "Ionization Energy": "6.150 eV",
-                "Specific Heat": "0.236 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Jean Charles Galissard de Marignac",
-                "Year of Discovery": 1880
-            },
-            "Tb": {
-                "Name": "Terbium",
-                "Atomic Number": 65,
-                "Atomic Mass": "158.92534 u",
-                "Density": "8.230 g/cm³",
-                "Melting Point": "1356 °C",
-                "Boiling Point": "3230 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f⁹ 6s²",
-                "Ground State": "⁶H₁₅/₂",
-                "Electronegativity": 1.10,
-                "Atomic Radius": "221 pm",
-                "Ionization Energy": "5.864 eV",
-                "Specific Heat": "0.182 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Carl Gustaf Mosander",
-                "Year of Discovery": 1843
-            },
-            "Dy": {
-                "Name": "Dysprosium",
-                "Atomic Number": 66,
-                "Atomic Mass": "162.50 u",
-                "Density": "8.55125 g/cm³",
-                "Melting Point": "1412 °C",
-                "Boiling Point": "2567 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁰ 6s²",
-                "Ground State": "⁵I₈",
-                "Electronegativity": 1.22,
-                "Atomic Radius": "229 pm",
-                "Ionization Energy": "5.939 eV",
-                "Specific Heat": "0.170 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Paul Émile Lecoq de Boisbaudran",
-                "Year of Discovery": 1886
-            },
-            "Ho": {
-                "Name": "Holmium",
-                "Atomic Number": 67,
-                "Atomic Mass": "164.93032 u",
-                "Density": "8.79525 g/cm³",
-                "Melting Point": "1474 °C",
-                "Boiling Point": "2700 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹¹ 6s²",
-                "Ground State": "⁴I₁₅/₂",
-                "Electronegativity": 1.23,
-                "Atomic Radius": "216 pm",
-                "Ionization Energy": "6.022 eV",
-                "Specific Heat": "0.165 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Marc Delafontaine, Jacques-Louis Soret",
-                "Year of Discovery": 1878
-            },
-            "Er": {
-                "Name": "Erbium",
-                "Atomic Number": 68,
-                "Atomic Mass": "167.26 u",
-                "Density": "9.06625 g/cm³",
-                "Melting Point": "1529 °C",
-                "Boiling Point": "2868 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹² 6s²",
-                "Ground State": "³H₆",
-                "Electronegativity": 1.24,
-                "Atomic Radius": "235 pm",
-                "Ionization Energy": "6.108 eV",
-                "Specific Heat": "0.168 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Carl Gustaf Mosander",
-                "Year of Discovery": 1843
-            },
-            "Tm": {
-                "Name": "Thulium",
-                "Atomic Number": 69,
-                "Atomic Mass": "168.93421 u",
-                "Density": "9.32125 g/cm³",
-                "Melting Point": "1545 °C",
-                "Boiling Point": "1950 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹³ 6s²",
-                "Ground State": "²F₇/₂",
-                "Electronegativity": 1.25,
-                "Atomic Radius": "227 pm",
-                "Ionization Energy": "6.184 eV",
-                "Specific Heat": "0.160 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Per Teodor Cleve",
-                "Year of Discovery": 1879
-            },
-            "Yb": {
-                "Name": "Ytterbium",
-                "Atomic Number": 70,
-                "Atomic Mass": "173.04 u",
-                "Density": "6.966 g/cm³",
-                "Melting Point": "819 °C",
-                "Boiling Point": "1196 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 6s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 1.1,
-                "Atomic Radius": "242 pm",
-                "Ionization Energy": "6.254 eV",
-                "Specific Heat": "0.155 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Jean Charles Galissard de Marignac",
-                "Year of Discovery": 1878
-            },
-            "Lu": {
-                "Name": "Lutetium",
-                "Atomic Number": 71,
-                "Atomic Mass": "174.967 u",
-                "Density": "9.84125 g/cm³",
-                "Melting Point": "1663 °C",
-                "Boiling Point": "3402 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹ 6s²",
-                "Ground State": "²D₃/₂",
-                "Electronegativity": 1.27,
-                "Atomic Radius": "221 pm",
-                "Ionization Energy": "5.426 eV",
-                "Specific Heat": "0.154 J/(g·K)",
-                "Group": 3,
-                "Period": 6,
-                "Category": "Lanthanide",
-                "Discovered By": "Georges Urbain",
-                "Year of Discovery": 1907
-            },
-            "Hf": {
-                "Name": "Hafnium",
-                "Atomic Number": 72,
-                "Atomic Mass": "178.49 u",
-                "Density": "13.31 g/cm³",
-                "Melting Point": "2233 °C",
-                "Boiling Point": "4603 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d² 6s²",
-                "Ground State": "³F₂",
-                "Electronegativity": 1.3,
-                "Atomic Radius": "212 pm",
-                "Ionization Energy": "6.825 eV",
-                "Specific Heat": "0.144 J/(g·K)",
-                "Group": 4,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Dirk Coster and George de Hevesy",
-                "Year of Discovery": 1923
-            },
-            "Ta": {
-                "Name": "Tantalum",
-                "Atomic Number": 73,
-                "Atomic Mass": "180.9479 u",
-                "Density": "16.654 g/cm³",
-                "Melting Point": "3017 °C",
-                "Boiling Point": "5458 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d³ 6s²",
-                "Ground State": "⁴F₃/₂",
-                "Electronegativity": 1.5,
-                "Atomic Radius": "206 pm",
-                "Ionization Energy": "7.550 eV",
-                "Specific Heat": "0.140 J/(g·K)",
-                "Group": 5,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Anders Gustaf Ekeberg",
-                "Year of Discovery": 1802
-            },
-            "W": {
-                "Name": "Tungsten",
-                "Atomic Number": 74,
-                "Atomic Mass": "183.84 u",
-                "Density": "19.3 g/cm³",
-                "Melting Point": "3422 °C",
-                "Boiling Point": "5555 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d⁴ 6s²",
-                "Ground State": "⁵D₀",
-                "Electronegativity": 2.36,
-                "Atomic Radius": "200 pm",
-                "Ionization Energy": "7.864 eV",
-                "Specific Heat": "0.132 J/(g·K)",
-                "Group": 6,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Fausto and Juan José de Elhuyar",
-                "Year of Discovery": 1783
-            },
-            "Re": {
-                "Name": "Rhenium",
-                "Atomic Number": 75,
-                "Atomic Mass": "186.207 u",
-                "Density": "21.02 g/cm³",
-                "Melting Point": "3186 °C",
-                "Boiling Point": "5596 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d⁵ 6s²",
-                "Ground State": "⁶S₅/₂",
-                "Electronegativity": 1.9,
-                "Atomic Radius": "197 pm",
-                "Ionization Energy": "7.834 eV",
-                "Specific Heat": "0.137 J/(g·K)",
-                "Group": 7,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Masataka Ogawa, Walter Noddack, Ida Tacke, Otto Berg",
-                "Year of Discovery": 1925
-            },
-            "Os": {
-                "Name": "Osmium",
-                "Atomic Number": 76,
-                "Atomic Mass": "190.23 u",
-                "Density": "22.57 g/cm³",
-                "Melting Point": "3033 °C",
-                "Boiling Point": "5012 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d⁶ 6s²",
-                "Ground State": "⁵D₄",
-                "Electronegativity": 2.2,
-                "Atomic Radius": "193 pm",
-                "Ionization Energy": "8.438 eV",
-                "Specific Heat": "0.130 J/(g·K)",
-                "Group": 8,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Smithson Tennant",
-                "Year of Discovery": 1803
-            },
-            "Ir": {
-                "Name": "Iridium",
-                "Atomic Number": 77,
-                "Atomic Mass": "192.217 u",
-                "Density": "22.4217 g/cm³",
-                "Melting Point": "2446 °C",
-                "Boiling Point": "4428 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d⁷ 6s²",
-                "Ground State": "⁴F₉/₂",
-                "Electronegativity": 2.20,
-                "Atomic Radius": "190 pm",
-                "Ionization Energy": "8.967 eV",
-                "Specific Heat": "0.131 J/(g·K)",
-                "Group": 9,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Smithson Tennant",
-                "Year of Discovery": 1803
-            },
-            "Pt": {
-                "Name": "Platinum",
-                "Atomic Number": 78,
-                "Atomic Mass": "195.078 u",
-                "Density": "21.45 g/cm³",
-                "Melting Point": "1768.4 °C",
-                "Boiling Point": "3825 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d⁹ 6s¹",
-                "Ground State": "³D₃",
-                "Electronegativity": 2.28,
-                "Atomic Radius": "187 pm",
-                "Ionization Energy": "8.959 eV",
-                "Specific Heat": "0.133 J/(g·K)",
-                "Group": 10,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Antonio de Ulloa",
-                "Year of Discovery": 1735
-            },
-            "Au": {
-                "Name": "Gold",
-                "Atomic Number": 79,
-                "Atomic Mass": "196.96655 u",
-                "Density": "19.3 g/cm³",
-                "Melting Point": "1064.18 °C",
-                "Boiling Point": "2856 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 2.54,
-                "Atomic Radius": "184 pm",
-                "Ionization Energy": "9.226 eV",
-                "Specific Heat": "0.129 J/(g·K)",
-                "Group": 11,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Hg": {
-                "Name": "Mercury",
-                "Atomic Number": 80,
-                "Atomic Mass": "200.59 u",
-                "Density": "13.546 g/cm³",
-                "Melting Point": "-38.83 °C",
-                "Boiling Point": "356.73 °C",
-                "State at 20°C": "Liquid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 2.00,
-                "Atomic Radius": "181 pm",
-                "Ionization Energy": "10.438 eV",
-                "Specific Heat": "0.140 J/(g·K)",
-                "Group": 12,
-                "Period": 6,
-                "Category": "Transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Tl": {
-                "Name": "Thallium",
-                "Atomic Number": 81,
-                "Atomic Mass": "204.3833 u",
-                "Density": "11.85 g/cm³",
-                "Melting Point": "304 °C",
-                "Boiling Point": "1473 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p¹",
-                "Ground State": "²P₁/₂",
-                "Electronegativity": 1.62,
-                "Atomic Radius": "156 pm",
-                "Ionization Energy": "6.108 eV",
-                "Specific Heat": "0.129 J/(g·K)",
-                "Group": 13,
-                "Period": 6,
-                "Category": "Post-transition Metal",
-                "Discovered By": "William Crookes",
-                "Year of Discovery": 1861
-            },
-            "Pb": {
-                "Name": "Lead",
-                "Atomic Number": 82,
-                "Atomic Mass": "207.2 u",
-                "Density": "11.35 g/cm³",
-                "Melting Point": "327.46 °C",
-                "Boiling Point": "1749 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p²",
-                "Ground State": "³P₀",
-                "Electronegativity": 1.87,
-                "Atomic Radius": "154 pm",
-                "Ionization Energy": "7.417 eV",
-                "Specific Heat": "0.129 J/(g·K)",
-                "Group": 14,
-                "Period": 6,
-                "Category": "Post-transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Bi": {
-                "Name": "Bismuth",
-                "Atomic Number": 83,
-                "Atomic Mass": "208.98038 u",
-                "Density": "9.747 g/cm³",
-                "Melting Point": "271.40 °C",
-                "Boiling Point": "1564 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p³",
-                "Ground State": "⁴S₃/₂",
-                "Electronegativity": 2.02,
-                "Atomic Radius": "143 pm",
-                "Ionization Energy": "7.286 eV",
-                "Specific Heat": "0.122 J/(g·K)",
-                "Group": 15,
-                "Period": 6,
-                "Category": "Post-transition Metal",
-                "Discovered By": "Known since ancient times",
-                "Year of Discovery": "prehistoric"
-            },
-            "Po": {
-                "Name": "Polonium",
-                "Atomic Number": 84,
-                "Atomic Mass": "(209) u",
-                "Density": "9.32 g/cm³",
-                "Melting Point": "254 °C",
-                "Boiling Point": "962 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁴",
-                "Ground State": "³P₂",
-                "Electronegativity": 2.0,
-                "Atomic Radius": "135 pm",
-                "Ionization Energy": "8.417 eV",
-                "Specific Heat": "—",
-                "Group": 16,
-                "Period": 6,
-                "Category": "Metalloid",
-                "Discovered By": "Marie and Pierre Curie",
-                "Year of Discovery": 1898
-            },
-            "At": {
-                "Name": "Astatine",
-                "Atomic Number": 85,
-                "Atomic Mass": "(210) u",
-                "Density": "—",
-                "Melting Point": "302 °C",
-                "Boiling Point": "—",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁵",
-                "Ground State": "²P₃/₂",
-                "Electronegativity": 2.2,
-                "Atomic Radius": "127 pm",
-                "Ionization Energy": "—",
-                "Specific Heat": "—",
-                "Group": 17,
-                "Period": 6,
-                "Category": "Halogen",
-                "Discovered By": "Dale R. Corson, Kenneth Ross MacKenzie, Emilio Segrè",
-                "Year of Discovery": 1940
-            },
-            "Rn": {
-                "Name": "Radon",
-                "Atomic Number": 86,
-                "Atomic Mass": "(222) u",
-                "Density": "—",
-                "Melting Point": "-71 °C",
-                "Boiling Point": "-61.7 °C",
-                "State at 20°C": "Gas",
-                "Electron Configuration": "[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁶",
-                "Ground State": "¹S₀",
-                "Electronegativity": 2.2,
-                "Atomic Radius": "120 pm",
-                "Ionization Energy": "10.748 eV",
-                "Specific Heat": "0.094 J/(g·K)",
-                "Group": 18,
-                "Period": 6,
-                "Category": "Noble Gas",
-                "Discovered By": "Friedrich Ernst Dorn",
-                "Year of Discovery": 1900
-            },
-            "Fr": {
-                "Name": "Francium",
-                "Atomic Number": 87,
-                "Atomic Mass": "(223) u",
-                "Density": "—",
-                "Melting Point": "27 °C",
-                "Boiling Point": "—",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Rn] 7s¹",
-                "Ground State": "²S₁/₂",
-                "Electronegativity": 0.79,
-                "Atomic Radius": "348 pm",
-                "Ionization Energy": "4.073 eV",
-                "Specific Heat": "—",
-                "Group": 1,
-                "Period": 7,
-                "Category": "Alkali Metal",
-                "Discovered By": "Marguerite Perey",
-                "Year of Discovery": 1939
-            },
-            "Ra": {
-                "Name": "Radium",
-                "Atomic Number": 88,
-                "Atomic Mass": "(226) u",
-                "Density": "—",
-                "Melting Point": "700 °C",
-                "Boiling Point": "—",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Rn] 7s²",
-                "Ground State": "¹S₀",
-                "Electronegativity": 0.9,
-                "Atomic Radius": "283 pm",
-                "Ionization Energy": "5.278 eV",
-                "Specific Heat": "—",
-                "Group": 2,
-                "Period": 7,
-                "Category": "Alkaline Earth Metal",
-                "Discovered By": "Marie and Pierre Curie",
-                "Year of Discovery": 1898
-            },
-            "Ac": {
-                "Name": "Actinium",
-                "Atomic Number": 89,
-                "Atomic Mass": "(227) u",
-                "Density": "—",
-                "Melting Point": "1051 °C",
-                "Boiling Point": "3198 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Rn] 6d¹ 7s²",
-                "Ground State": "²D₃/₂",
-                "Electronegativity": 1.1,
-                "Atomic Radius": "260 pm",
-                "Ionization Energy": "5.17 eV",
-                "Specific Heat": "0.120 J/(g·K)",
-                "Group": 3,
-                "Period": 7,
-                "Category": "Actinide",
-                "Discovered By": "André-Louis Debierne, Friedrich Oskar Giesel",
-                "Year of Discovery": 1899
-            },
-            "Th": {
-                "Name": "Thorium",
-                "Atomic Number": 90,
-                "Atomic Mass": "232.0381 u",
-                "Density": "11.72 g/cm³",
-                "Melting Point": "1750 °C",
-                "Boiling Point": "4788 °C",
-                "State at 20°C": "Solid",
-                "Electron Configuration": "[Rn] 6d² 7s²",
-                "Ground State": "³F₂",
-                "Electronegativity": 1.3,
-                "Atomic Radius": "237 pm",
-                "Ionization Energy": "6.307 eV",
-                "Specific Heat": "0.113 J/(g·K)",
-                "Group": 3,
-                "Period": 7,
-                "Category": "Actinide",
-                "Discovered By": "Jöns Jakob Berzelius",
-                "Year of Discovery": 1829
-            }
-
-        }
-
-        # Add more elements as needed...
-
-        # Default properties for elements not explicitly defined
-        default_properties = {
-            "Name": element_symbol,
-            "Atomic Number": "N/A",
-            "Atomic Mass": "N/A",
-            "Density": "N/A",
-            "Melting Point": "N/A",
-            "Boiling Point": "N/A",
-            "State at 20°C": "N/A",
-            "Electron Configuration": "N/A",
-            "Ground State": "N/A",
-            "Electronegativity": "N/A",
-            "Ionization Energy": "N/A",
-            "Specific Heat": "N/A",
-            "Group": "N/A",
-            "Period": "N/A",
-            "Category": "N/A",
-            "Common Core Levels": "N/A",
-            "Most Intense Line": "N/A",
-            "Typical FWHM": "N/A",
-            "Chemical Shift Range": "N/A"
-        }
-
-        # Get known properties or default set
-        properties = element_properties.get(element_symbol, default_properties)
-
-        # Add URLs to properties
-        properties["XPS Fitting URL"] = self.get_xps_fitting_url(element_symbol)
-        properties["Thermo Fisher URL"] = self.get_thermo_url(element_symbol)
-
-        return properties
+        """Get properties for a specific element (read-only mapping, includes the reference URLs)"""
+        return get_element_record(element_symbol).properties
 
     def create_sss_scholar_tab(self, notebook):
-        """Create SSS from Scholar tab with search and navigation"""
-        panel = wx.Panel(notebook)
+        """Create SSS from Scholar tab (web browser is created on first selection)"""
+        self._add_lazy_page(notebook, "SSS from Scholar", self._build_sss_scholar_tab, "sss")
+
+    def _build_sss_scholar_tab(self, panel):
+        """Build the SSS from Scholar search, navigation and web view inside its page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         try:
@@ -4290,9 +7409,9 @@ class ElementPropertiesDialog(wx.Frame):
                     f"</body></html>"
                 )
                 self.sss_web_view.SetPage(placeholder_html, "")
-                wx.CallLater(delay_sec * 1000, self._sss_deferred_load)
-            else:
-                self.sss_web_view.LoadURL(self.sss_home_url)
+            self.load_scheduler.request('sss', self.sss_web_view, self.sss_home_url,
+                                        self.WEB_LOAD_PRIORITY['sss'], delay_ms=delay_sec * 1000,
+                                        per_element=False)
 
             # Add loading indicator
             sss_loading_text = wx.StaticText(panel, label="Ready to search Surface Science Spectra...")
@@ -4320,7 +7439,6 @@ class ElementPropertiesDialog(wx.Frame):
             sizer.Add(error_text, 1, wx.ALL | wx.EXPAND, 20)
 
         panel.SetSizer(sizer)
-        notebook.AddPage(panel, "SSS from Scholar")
 
     def on_sss_search(self, event):
         """Perform Surface Science Spectra search on Google Scholar"""
@@ -4328,6 +7446,7 @@ class ElementPropertiesDialog(wx.Frame):
             search_terms = self.sss_search_ctrl.GetValue().strip()
             if not search_terms:
                 return
+            self.load_scheduler.cancel('sss')
 
             # Build the search query
             import urllib.parse
@@ -4360,6 +7479,7 @@ class ElementPropertiesDialog(wx.Frame):
     def on_sss_home(self, event):
         """Go to home page (Google Scholar)"""
         try:
+            self.load_scheduler.cancel('sss')
             self.sss_loading_text.SetLabel("Loading Google Scholar...")
             self.sss_loading_text.Show()
             self.sss_web_view.LoadURL(self.sss_home_url)
@@ -4413,6 +7533,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_sss_page_loaded(self, event):
         """Handle successful SSS page loading"""
+        if not self.load_scheduler.accept_event('sss', event):
+            return
         try:
             self.sss_loading_text.Hide()
             self.Layout()
@@ -4421,6 +7543,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_sss_page_error(self, event):
         """Handle SSS page loading errors"""
+        if not self.load_scheduler.accept_event('sss', event):
+            return
         try:
             self.sss_loading_text.SetLabel("Failed to load webpage. Please check your internet connection.")
             self.sss_loading_text.SetForegroundColour(wx.Colour(200, 0, 0))
@@ -4456,59 +7580,19 @@ class ElementPropertiesDialog(wx.Frame):
             self.sss_web_view.LoadURL(url)
 
     def download_file(self, url):
-        """Download a file to the Downloads folder"""
-        try:
-            import urllib.request
-            import os
-            from pathlib import Path
-
-            # Get the Downloads folder
-            if os.name == 'nt':  # Windows
-                downloads_folder = str(Path.home() / "Downloads")
-            else:  # Mac/Linux
-                downloads_folder = str(Path.home() / "Downloads")
-
-            # Extract filename from URL
-            filename = url.split('/')[-1].split('?')[0]  # Remove query parameters
-            if not filename:
-                filename = "download"
-
-            filepath = os.path.join(downloads_folder, filename)
-
-            # Show downloading message
-            dlg = wx.ProgressDialog("Downloading",
-                                    f"Downloading {filename}...",
-                                    maximum=100,
-                                    parent=self,
-                                    style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE)
-
-            # Download the file
-            def download_progress(block_count, block_size, total_size):
-                if total_size > 0:
-                    percent = int((block_count * block_size * 100) / total_size)
-                    wx.CallAfter(dlg.Update, min(percent, 100))
-
-            urllib.request.urlretrieve(url, filepath, reporthook=download_progress)
-            dlg.Destroy()
-
-            # Show success message
-            wx.MessageBox(f"File downloaded successfully to:\n{filepath}",
-                          "Download Complete",
-                          wx.OK | wx.ICON_INFORMATION)
-
-        except Exception as e:
-            try:
-                dlg.Destroy()
-            except:
-                pass
-            wx.MessageBox(f"Download failed: {str(e)}\n\nURL: {url}",
-                          "Download Error",
-                          wx.OK | wx.ICON_ERROR)
-
+        """Download a file to the Downloads folder in the background (non-blocking)"""
+        parent = self.GetParent()
+        if hasattr(parent, 'start_download'):
+            parent.start_download(url, element=self.element)
+        else:
+            webbrowser.open(url)
 
     def create_estr_scholar_tab(self, notebook):
-        """Create Electronic Structure Scholar tab with search and navigation"""
-        panel = wx.Panel(notebook)
+        """Create Electronic Structure Scholar tab (web browser is created on first selection)"""
+        self._add_lazy_page(notebook, "Good paper Scholar", self._build_estr_scholar_tab, "estr")
+
+    def _build_estr_scholar_tab(self, panel):
+        """Build the Electronic Structure Scholar search, navigation and web view inside its page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         try:
@@ -4587,9 +7671,9 @@ class ElementPropertiesDialog(wx.Frame):
                     f"</body></html>"
                 )
                 self.estr_web_view.SetPage(placeholder_html, "")
-                wx.CallLater(delay_sec * 1000, self._estr_deferred_load)
-            else:
-                self.estr_web_view.LoadURL(self.estr_home_url)
+            self.load_scheduler.request('estr', self.estr_web_view, self.estr_home_url,
+                                        self.WEB_LOAD_PRIORITY['estr'], delay_ms=delay_sec * 1000,
+                                        per_element=False)
 
             # Add loading indicator
             estr_loading_text = wx.StaticText(panel, label="Ready to search electronic structure papers...")
@@ -4617,31 +7701,6 @@ class ElementPropertiesDialog(wx.Frame):
             sizer.Add(error_text, 1, wx.ALL | wx.EXPAND, 20)
 
         panel.SetSizer(sizer)
-        notebook.AddPage(panel, "Good paper Scholar")
-
-    def _harwell_deferred_load(self):
-        """Called by wx.CallLater to load the Harwell XPS Guru tab after 10 seconds."""
-        try:
-            if hasattr(self, 'harwell_web_view') and self.harwell_web_view:
-                self.harwell_web_view.LoadURL(self.harwell_url)
-        except Exception:
-            pass
-
-    def _sss_deferred_load(self):
-        """Called by wx.CallLater to load the SSS Scholar tab after the configured delay."""
-        try:
-            if hasattr(self, 'sss_web_view') and self.sss_web_view:
-                self.sss_web_view.LoadURL(self.sss_home_url)
-        except Exception:
-            pass
-
-    def _estr_deferred_load(self):
-        """Called by wx.CallLater to load the Good paper Scholar tab after the configured delay."""
-        try:
-            if hasattr(self, 'estr_web_view') and self.estr_web_view:
-                self.estr_web_view.LoadURL(self.estr_home_url)
-        except Exception:
-            pass
 
     def on_estr_search(self, event):
         """Perform Electronic Structure search on Google Scholar"""
@@ -4649,6 +7708,7 @@ class ElementPropertiesDialog(wx.Frame):
             search_terms = self.estr_search_ctrl.GetValue().strip()
             if not search_terms:
                 return
+            self.load_scheduler.cancel('estr')
 
             # Build the search query with "electronic structure" always included
             import urllib.parse
@@ -4692,6 +7752,7 @@ class ElementPropertiesDialog(wx.Frame):
     def on_estr_home(self, event):
         """Go to home page (Google Scholar)"""
         try:
+            self.load_scheduler.cancel('estr')
             self.estr_loading_text.SetLabel("Loading Google Scholar...")
             self.estr_loading_text.Show()
             self.estr_web_view.LoadURL(self.estr_home_url)
@@ -4747,6 +7808,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_estr_page_loaded(self, event):
         """Handle successful E-Structure page loading"""
+        if not self.load_scheduler.accept_event('estr', event):
+            return
         try:
             self.estr_loading_text.Hide()
             self.Layout()
@@ -4756,6 +7819,8 @@ class ElementPropertiesDialog(wx.Frame):
 
     def on_estr_page_error(self, event):
         """Handle E-Structure page loading errors"""
+        if not self.load_scheduler.accept_event('estr', event):
+            return
         try:
             self.estr_loading_text.SetLabel("Failed to load webpage. Please check your internet connection.")
             self.estr_loading_text.SetForegroundColour(wx.Colour(200, 0, 0))
@@ -4972,6 +8037,117 @@ class ElementPropertiesDialog(wx.Frame):
         except:
             pass
 
+class TaskProgressFrame(wx.Frame):
+    """Non-modal window listing background tasks with a progress gauge and Cancel button each"""
+
+    def __init__(self, parent):
+        super().__init__(parent, title="Background Tasks", size=(520, 300),
+                         style=wx.DEFAULT_FRAME_STYLE | wx.FRAME_FLOAT_ON_PARENT)
+        set_app_icon(self)
+
+        self.scrolled = wx.ScrolledWindow(self)
+        self.scrolled.SetScrollRate(0, 20)
+        self.rows_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.scrolled.SetSizer(self.rows_sizer)
+
+        self._rows = {}
+        self._next_id = 0
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def on_close(self, event):
+        """Hide instead of destroying so running tasks keep reporting progress"""
+        if event.CanVeto():
+            self.Hide()
+            event.Veto()
+        else:
+            event.Skip()
+
+    def add_task(self, title, on_cancel=None):
+        """Add a task row and show the window; returns the task id"""
+        task_id = self._next_id
+        self._next_id += 1
+
+        row = wx.Panel(self.scrolled, style=wx.BORDER_THEME)
+        row_sizer = wx.BoxSizer(wx.VERTICAL)
+        line_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        title_text = wx.StaticText(row, label=title)
+        font = title_text.GetFont()
+        font.SetWeight(wx.FONTWEIGHT_BOLD)
+        title_text.SetFont(font)
+        gauge = wx.Gauge(row, range=1000, size=(-1, 14))
+        status_text = wx.StaticText(row, label="Waiting...")
+        status_text.SetForegroundColour(wx.Colour(100, 100, 100))
+        button = wx.Button(row, label="Cancel")
+        button.Bind(wx.EVT_BUTTON, lambda evt, tid=task_id: self.on_task_button(tid))
+
+        line_sizer.Add(gauge, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 3)
+        line_sizer.Add(button, 0, wx.ALL, 3)
+        row_sizer.Add(title_text, 0, wx.LEFT | wx.TOP, 5)
+        row_sizer.Add(line_sizer, 0, wx.EXPAND)
+        row_sizer.Add(status_text, 0, wx.LEFT | wx.BOTTOM, 5)
+        row.SetSizer(row_sizer)
+
+        self._rows[task_id] = {'panel': row, 'gauge': gauge, 'status': status_text, 'button': button,
+                               'on_cancel': on_cancel, 'action': None, 'done': False}
+        self.rows_sizer.Add(row, 0, wx.ALL | wx.EXPAND, 4)
+        self.scrolled.FitInside()
+        self.Layout()
+        self.Show()
+        self.Raise()
+        return task_id
+
+    def update_task(self, task_id, fraction, text):
+        """Update a running task; fraction None means unknown size (pulsing gauge)"""
+        row = self._rows.get(task_id)
+        if not row or row['done']:
+            return
+        if fraction is None:
+            row['gauge'].Pulse()
+        else:
+            row['gauge'].SetValue(int(max(0.0, min(1.0, fraction)) * 1000))
+        row['status'].SetLabel(text)
+
+    def finish_task(self, task_id, text, success=True, action=None):
+        """Mark a task finished; action is an optional (label, callback) for the button"""
+        row = self._rows.get(task_id)
+        if not row:
+            return
+        row['done'] = True
+        row['action'] = action
+        row['gauge'].SetValue(1000 if success else 0)
+        row['status'].SetLabel(text)
+        if not success:
+            row['status'].SetForegroundColour(wx.Colour(200, 0, 0))
+        row['button'].SetLabel(action[0] if action else "Remove")
+        row['button'].Enable()
+        row['panel'].Layout()
+
+    def remove_task(self, task_id):
+        row = self._rows.pop(task_id, None)
+        if not row:
+            return
+        self.rows_sizer.Detach(row['panel'])
+        row['panel'].Destroy()
+        self.scrolled.FitInside()
+        self.Layout()
+
+    def on_task_button(self, task_id):
+        row = self._rows.get(task_id)
+        if not row:
+            return
+        if not row['done']:
+            if row['on_cancel']:
+                row['on_cancel']()
+            row['status'].SetLabel("Cancelling...")
+            row['button'].Disable()
+        elif row['action']:
+            row['action'][1]()
+        else:
+            self.remove_task(task_id)
+
+
 class ElementTile(wx.Panel):
     """Custom widget for periodic table element tiles"""
 
@@ -4990,6 +8166,11 @@ class ElementTile(wx.Panel):
         self.hover = False
         self.pressed = False
         self.simplified = False  # Set by refresh_periodic_table from config
+        self.heatmap = False  # Colour comes from the heat map (shown in simplified mode too)
+
+        # Pre-rendered bitmaps per (state, size, DPI scale, mode); painting is a single blit
+        self._bitmap_cache = {}
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
 
         self._is_macos = platform.system() == 'Darwin'
         self._build_fonts()
@@ -5005,6 +8186,8 @@ class ElementTile(wx.Panel):
 
         self.click_callback = None
         self.double_click_callback = None
+        self.tooltip_callback = None
+        self._tooltip_set = False
 
     def _tile_pixels(self):
         if self.mini:
@@ -5050,6 +8233,7 @@ class ElementTile(wx.Panel):
         self._apply_min_size(size)
         self.SetSize((size, size))
         self._build_fonts()
+        self.invalidate_cache()
         self.Refresh()
 
         # Bind paint and mouse events
@@ -5065,23 +8249,86 @@ class ElementTile(wx.Panel):
         self.click_callback = None
         self.double_click_callback = None
 
+    def set_simplified(self, simplified):
+        """Switch between simplified and full drawing mode, dropping cached bitmaps."""
+        if self.simplified == bool(simplified):
+            return
+        self.simplified = bool(simplified)
+        self.invalidate_cache()
+        self.Refresh()
+
+    def set_color(self, color, heatmap=False):
+        """Change the tile colour; only repaints when something actually changed"""
+        if color == self.color and heatmap == self.heatmap:
+            return
+        self.color = color
+        self.heatmap = heatmap
+        self.invalidate_cache()
+        self.Refresh()
+
+    def invalidate_cache(self):
+        """Forget all pre-rendered state bitmaps (call after any appearance change)."""
+        self._bitmap_cache.clear()
+
+    def _current_state(self):
+        if not self.enabled:
+            return 'disabled'
+        if self.pressed and self.hover:
+            return 'pressed'
+        if self.hover:
+            return 'hover'
+        return 'normal'
+
+    def _get_state_bitmap(self, state, width, height):
+        """Return the cached bitmap for a state, rendering it on first use."""
+        scale = self.GetContentScaleFactor()
+        key = (state, width, height, scale, self.simplified, self.mini)
+        bitmap = self._bitmap_cache.get(key)
+        if bitmap is None:
+            bitmap = self._render_state_bitmap(state, width, height, scale)
+            self._bitmap_cache[key] = bitmap
+        return bitmap
+
+    def _render_state_bitmap(self, state, width, height, scale):
+        """Draw one tile state into an off-screen bitmap"""
+        bitmap = wx.Bitmap()
+        try:
+            bitmap.CreateWithLogicalSize(width, height, scale)
+        except Exception:
+            bitmap = wx.Bitmap(width, height)
+
+        mdc = wx.MemoryDC(bitmap)
+        mdc.SetBackground(wx.Brush(self.GetParent().GetBackgroundColour()))
+        mdc.Clear()
+        gc = wx.GraphicsContext.Create(mdc)
+        self._draw_tile(gc, state, width, height)
+        del gc
+        mdc.SelectObject(wx.NullBitmap)
+        return bitmap
+
     def on_paint(self, event):
-        """Draw the element tile with atomic number, element symbol, core level, and binding energy"""
+        """Blit the pre-rendered bitmap for the current tile state"""
         dc = wx.PaintDC(self)
-        gc = wx.GraphicsContext.Create(dc)
         width, height = self.GetSize()
+        if width <= 0 or height <= 0:
+            return
+        dc.DrawBitmap(self._get_state_bitmap(self._current_state(), width, height), 0, 0)
 
+    def _draw_tile(self, gc, state, width, height):
+        """Draw the element tile with atomic number, element symbol, core level, and binding energy"""
         # ── Simplified mode: plain bg, element symbol only ────────────────────
         if self.simplified:
             external_color = wx.Colour(self.color) if isinstance(self.color, str) else self.color
             r, g, b = external_color.Red(), external_color.Green(), external_color.Blue()
             is_legacy_green = (r == 0 and g == 255 and b == 0)
             is_brand_green = (r == 79 and g == 190 and b == 159)
-            if not self.enabled:
+            if state == 'disabled':
                 bg = wx.Colour(220, 220, 220)
+            elif self.heatmap:
+                bg = external_color if state == 'normal' else external_color.ChangeLightness(85)
             elif is_brand_green or is_legacy_green:
                 bg = wx.Colour(79, 190, 159)
-            elif self.hover:
+            elif state in ('hover', 'pressed'):
                 bg = wx.Colour(210, 210, 210)
             else:
                 bg = wx.Colour(245, 245, 245)
@@ -5096,21 +8343,21 @@ class ElementTile(wx.Panel):
 
         # ── Full mode (default) ───────────────────────────────────────────────
         # Determine the actual color to use (existing color logic)
-        if not self.enabled:
+        if state == 'disabled':
             base_color = wx.Colour(self.color)
             r, g, b = base_color.Red(), base_color.Green(), base_color.Blue()
             r = min(255, int(r * 1.3))
             g = min(255, int(g * 1.3))
             b = min(255, int(b * 1.3))
             actual_color = wx.Colour(r, g, b)
-        elif self.pressed and self.hover:
+        elif state == 'pressed':
             base_color = wx.Colour(self.color)
             r, g, b = base_color.Red(), base_color.Green(), base_color.Blue()
             r = max(0, int(r * 0.8))
             g = max(0, int(g * 0.8))
             b = max(0, int(b * 0.8))
             actual_color = wx.Colour(r, g, b)
-        elif self.hover:
+        elif state == 'hover':
             base_color = wx.Colour(self.color)
             r, g, b = base_color.Red(), base_color.Green(), base_color.Blue()
             r = max(0, int(r * 0.9))
@@ -5201,15 +8448,20 @@ class ElementTile(wx.Panel):
 
     def on_enter(self, event):
         """Handle mouse enter"""
-        if self.enabled:
+        # The tooltip text is only built the first time the tile is hovered
+        if self.tooltip_callback and not self._tooltip_set:
+            self._tooltip_set = True
+            self.SetToolTip(self.tooltip_callback(self.element))
+        if self.enabled and not self.hover:
             self.hover = True
             self.Refresh()
 
     def on_leave(self, event):
         """Handle mouse leave"""
-        self.hover = False
-        self.pressed = False
-        self.Refresh()
+        if self.hover or self.pressed:
+            self.hover = False
+            self.pressed = False
+            self.Refresh()
 
     def on_motion(self, event):
         """Handle mouse motion"""
@@ -5224,6 +8476,11 @@ class ElementTile(wx.Panel):
         """Set the double-click callback"""
         self.double_click_callback = callback
 
+    def set_tooltip_callback(self, callback):
+        """Set the callback returning the tooltip text for this tile's element"""
+        self.tooltip_callback = callback
+        self._tooltip_set = False
+
     def Destroy(self):
         """Override Destroy to properly clean up web views"""
         try:
@@ -5270,4 +8527,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # needed by the atlas export process pool in frozen builds
     main()
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""Rendering of the BE distribution atlas (one figure per element/line).
+
+This module runs in worker processes, so it only uses matplotlib's Agg canvas
+and never imports wx. The main application prepares the binned data and
+statistics for each group; workers draw and save the figures.
+"""
+import html
+import importlib.machinery
+import multiprocessing
+import os
+import re
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def atlas_file_stem(element, line):
+    """File-system safe name for an element/line figure (e.g. 'Fe_2p3-2')"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', f"{element}_{line.replace('/', '-')}")
+
+
+def render_group(task):
+    """Draw one element/line figure and save it in every requested format.
+
+    task is a dict with element, line, edges, counts, kde_x, kde_y (or None),
+    stats (dict), resolution, out_dir and formats. Returns (stem, [file names]).
+    """
+    element, line = task['element'], task['line']
+    stats = task['stats']
+    stem = atlas_file_stem(element, line)
+
+    figure = Figure(figsize=(8, 5.5), dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+
+    ax.stairs(task['counts'], task['edges'], fill=True, alpha=0.7, facecolor='skyblue', edgecolor='black')
+    if task['kde_x'] is not None:
+        ax.plot(task['kde_x'], task['kde_y'], 'r-', linewidth=2)
+
+    if stats.get('median') is not None:
+        ax.axvspan(stats['q25'], stats['q75'], color='orange', alpha=0.15,
+                   label=f"IQR {stats['q25']:.2f}-{stats['q75']:.2f} eV")
+        ax.axvline(stats['median'], color='darkorange', linestyle='--', linewidth=1.5,
+                   label=f"Median {stats['median']:.2f} eV (MAD {stats['mad']:.2f})")
+        ax.legend(loc='upper left', fontsize='small')
+
+    ax.set_xlabel('Binding Energy (eV)')
+    ax.set_ylabel('Number of References')
+    ax.set_title(f'Binding Energy Distribution for {element} ({line})')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    # XPS convention: reversed BE axis
+    ax.set_xlim(task['edges'][-1], task['edges'][0])
+
+    summary = [f"Total References: {stats['count']}", f"Resolution: {task['resolution']} eV"]
+    if stats.get('std') is not None:
+        summary.append(f"Std: {stats['std']:.2f} eV")
+    ax.text(0.98, 0.95, "\n".join(summary), transform=ax.transAxes, ha='right', va='top',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    files = []
+    for fmt in task['formats']:
+        name = f"{stem}.{fmt}"
+        figure.savefig(os.path.join(task['out_dir'], name), format=fmt)
+        files.append(name)
+    return stem, files
+
+
+_main_spec_lock = threading.Lock()  # create_pool() calls from different threads
+
+
+def _init_worker():
+    """Pool initializer: workers never need an interactive backend"""
+    matplotlib.use('Agg')
+
+
+def _started():
+    """No-op task submitted once per worker so the pool starts its processes up front"""
+    return None
+
+
+def create_pool(workers):
+    """Pool of spawned worker processes that import only this module.
+
+    A spawned child re-runs the parent's __main__ (the GUI script, with wx) unless its
+    spec names a '__main__' module. That spec is swapped in only while the workers are
+    started, all of them eagerly, and restored before the pool is returned; a full pool
+    never starts another process. Frozen builds handle this through freeze_support().
+    """
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_init_worker)
+    main = sys.modules.get('__main__')
+    if main is None or getattr(sys, 'frozen', False):
+        return pool
+    with _main_spec_lock:
+        saved = getattr(main, '__spec__', None)
+        main.__spec__ = importlib.machinery.ModuleSpec('__main__', None)
+        try:
+            # Each submit without an idle worker starts one process before returning
+            for _ in range(workers):
+                pool.submit(_started)
+        finally:
+            main.__spec__ = saved
+    return pool
+
+
+def render_groups(tasks, workers, cancel_event=None):
+    """Render task dicts (see render_group) on a pool of spawned worker processes.
+
+    tasks may be a lazy iterable: at most two tasks per worker are in flight, so the
+    next payloads are built while earlier figures render. Yields (task, result, error)
+    as each figure finishes; stops submitting once cancel_event is set.
+    """
+    tasks = iter(tasks)
+    pending = {}
+    exhausted = False
+    with create_pool(workers) as pool:
+        while True:
+            while not exhausted and len(pending) < 2 * workers:
+                if cancel_event is not None and cancel_event.is_set():
+                    exhausted = True
+                    break
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                pending[pool.submit(render_group, task)] = task
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = pending.pop(future)
+                try:
+                    yield task, future.result(), None
+                except Exception as e:
+                    yield task, None, e
+            if cancel_event is not None and cancel_event.is_set():
+                pool.shutdown(wait=False, cancel_futures=True)
+                return
+
+
+def write_index(out_dir, entries, title="NIST XPS Binding Energy Atlas"):
+    """Write index.html listing the rendered figures.
+
+    entries: list of dicts with element, line, count, median and files, in display order.
+    """
+    sections = []
+    current = None
+    for entry in entries:
+        if entry['element'] != current:
+            if current is not None:
+                sections.append('</div>')
+            current = entry['element']
+            sections.append(f'<h2 id="{html.escape(current)}">{html.escape(current)}</h2><div class="grid">')
+
+        png = next((name for name in entry['files'] if name.endswith('.png')), None)
+        links = " ".join(f'<a href="{html.escape(name)}">{html.escape(name.rsplit(".", 1)[1].upper())}</a>'
+                         for name in entry['files'])
+        median = f"{entry['median']:.2f} eV" if entry['median'] is not None else "-"
+        image = f'<a href="{html.escape(png)}"><img src="{html.escape(png)}" loading="lazy"></a>' if png else ""
+        sections.append(f'<div class="card">{image}<p><b>{html.escape(entry["line"])}</b> '
+                        f'- n={entry["count"]}, median {median}<br>{links}</p></div>')
+    if current is not None:
+        sections.append('</div>')
+
+    toc = " ".join(f'<a href="#{html.escape(e)}">{html.escape(e)}</a>'
+                   for e in dict.fromkeys(entry['element'] for entry in entries))
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 20px; }}
+.grid {{ display: flex; flex-wrap: wrap; gap: 12px; }}
+.card {{ width: 330px; border: 1px solid #ccc; padding: 6px; }}
+.card img {{ width: 100%; }}
+</style></head>
+<body><h1>{html.escape(title)}</h1><p>{toc}</p>
+{chr(10).join(sections)}
+</body></html>
+"""
+    path = os.path.join(out_dir, 'index.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return path
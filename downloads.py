@@ -0,0 +1,131 @@
+"""Background downloads of papers into '.part' files with HTTP Range resume.
+
+Kept free of wx so it can be used from worker threads and tested on its own.
+"""
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DownloadJob:
+    """State of one background download; cancel() may be called from any thread"""
+
+    def __init__(self, url, path, title=None, element=None):
+        self.url = url
+        self.path = path
+        self.part_path = path + '.part'
+        self.title = title
+        self.element = element
+        self.bytes_done = 0
+        self.total = None
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+class DownloadManager:
+    """Worker pool that streams downloads to '.part' files in chunks.
+
+    An interrupted or cancelled download keeps its '.part' file and is resumed with an
+    HTTP Range request the next time the same job is submitted. Callbacks run on the
+    worker thread: on_progress(job) and on_done(job, status, error) where status is
+    'done', 'cancelled' or 'failed'. Only one job per URL runs at a time, since jobs for
+    the same URL share a '.part' file.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    USER_AGENT = 'Mozilla/5.0 (KherveDB downloader)'
+
+    def __init__(self, max_workers=3, timeout=30):
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='download')
+        self._lock = threading.Lock()
+        self._active = {}  # url -> (job, future) for queued and running jobs
+
+    def submit(self, job, on_progress=None, on_done=None):
+        """Queue job; returns its future, or None if that URL is already being downloaded"""
+        with self._lock:
+            if job.url in self._active:
+                return None
+            future = self._executor.submit(self._run, job, on_progress, on_done)
+            self._active[job.url] = (job, future)
+        future.add_done_callback(lambda f, url=job.url: self._forget(url, f))
+        return future
+
+    def is_active(self, url):
+        with self._lock:
+            return url in self._active
+
+    def _forget(self, url, future):
+        with self._lock:
+            if self._active.get(url, (None, None))[1] is future:
+                del self._active[url]
+
+    def shutdown(self):
+        """Cancel every job and stop accepting work; running ones stop after their current chunk"""
+        with self._lock:
+            jobs = [job for job, _ in self._active.values()]
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, on_progress, on_done):
+        try:
+            self._download(job, on_progress)
+        except Exception as e:
+            if on_done:
+                on_done(job, 'cancelled' if job.cancelled else 'failed', str(e))
+            return
+        if on_done:
+            on_done(job, 'cancelled' if job.cancelled else 'done', None)
+
+    def _download(self, job, on_progress):
+        offset = os.path.getsize(job.part_path) if os.path.exists(job.part_path) else 0
+        request = urllib.request.Request(job.url, headers={'User-Agent': self.USER_AGENT})
+        if offset:
+            request.add_header('Range', f'bytes={offset}-')
+
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                # Range not satisfiable: the .part file already holds the whole file
+                os.replace(job.part_path, job.path)
+                return
+            raise
+
+        with response:
+            if offset and response.status != 206:
+                offset = 0  # server ignored the Range header; start over
+            length = response.headers.get('Content-Length')
+            job.total = offset + int(length) if length else None
+            job.bytes_done = offset
+            last_report = 0.0
+
+            with open(job.part_path, 'ab' if offset else 'wb') as f:
+                while not job.cancelled:
+                    chunk = response.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    job.bytes_done += len(chunk)
+                    now = time.monotonic()
+                    if on_progress and now - last_report > 0.2:
+                        last_report = now
+                        on_progress(job)
+
+        if job.cancelled:
+            return  # keep the .part file so the download can be resumed
+        if job.total is not None and job.bytes_done < job.total:
+            raise IOError("Connection closed before the download finished")
+        os.replace(job.part_path, job.path)
+        if on_progress:
+            on_progress(job)
@@ -0,0 +1,203 @@
+"""On-disk cache of reference web pages (XPS Fitting, Thermo Fisher, Harwell).
+
+Kept free of wx so it can be used from worker threads and tested on its own.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+class PageCache:
+    """Size-capped on-disk cache of reference web pages, keyed by URL.
+
+    Entries older than ttl_seconds are revalidated with ETag / Last-Modified, the least
+    recently used pages are evicted once max_bytes is exceeded, and a stale copy is
+    still served when the network is unavailable. Safe to use from worker threads.
+    """
+
+    INDEX_NAME = 'index.json'
+    USER_AGENT = 'Mozilla/5.0 (KherveDB page cache)'
+
+    def __init__(self, directory, ttl_seconds=7 * 24 * 3600, max_bytes=50 * 1024 * 1024, timeout=15):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._refreshing = {}  # url -> callbacks waiting for its fetch
+        self._dirty = False  # LRU touches not yet written to index.json
+        self._index = self._load_index()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, self.INDEX_NAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_NAME)
+        try:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(path + '.tmp', path)
+            self._dirty = False
+        except Exception as e:
+            print(f"Could not save page cache index: {e}")
+
+    def flush(self):
+        """Write pending LRU updates to index.json (call at shutdown)"""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def get(self, url):
+        """Return (html_text, meta) for a cached URL, or None.
+
+        Marks the entry as recently used in memory only; the access time reaches
+        index.json with the next store or flush(), so a hit does no index write.
+        """
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            if not meta:
+                return None
+            try:
+                with open(os.path.join(self.directory, meta['file']), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                self._index.pop(self._key(url), None)
+                self._save_index()
+                return None
+            meta['accessed_at'] = time.time()
+            self._dirty = True
+            return body.decode(meta.get('charset') or 'utf-8', errors='replace'), dict(meta)
+
+    def contains(self, url):
+        with self._lock:
+            return self._key(url) in self._index
+
+    def is_fresh(self, meta):
+        return time.time() - meta.get('fetched_at', 0) < self.ttl_seconds
+
+    def has_fresh(self, url):
+        """True if url is cached and still within its TTL (does not touch the LRU order)"""
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            return bool(meta) and self.is_fresh(meta)
+
+    def total_bytes(self):
+        with self._lock:
+            return sum(meta.get('size', 0) for meta in self._index.values())
+
+    def fetch(self, url, stop_event=None):
+        """Fetch or revalidate url; returns 'updated', 'not-modified' or 'error' and the bytes read.
+
+        stop_event (a threading.Event) aborts the download between chunks.
+        """
+        with self._lock:
+            meta = dict(self._index.get(self._key(url)) or {})
+
+        request = urllib.request.Request(url, headers={'User-Agent': self.USER_AGENT})
+        if meta.get('etag'):
+            request.add_header('If-None-Match', meta['etag'])
+        if meta.get('last_modified'):
+            request.add_header('If-Modified-Since', meta['last_modified'])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if 'html' not in content_type.lower():
+                    return 'error', 0
+                chunks = []
+                while True:
+                    if stop_event is not None and stop_event.is_set():
+                        return 'error', sum(len(c) for c in chunks)
+                    chunk = response.read(64 * 1024)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                body = b''.join(chunks)
+                self._store(url, body, response.headers, response.headers.get_content_charset())
+                return 'updated', len(body)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and meta:
+                with self._lock:
+                    entry = self._index.get(self._key(url))
+                    if entry:
+                        entry['fetched_at'] = time.time()
+                        self._save_index()
+                return 'not-modified', 0
+            return 'error', 0
+        except Exception:
+            return 'error', 0
+
+    def refresh_async(self, url, callback=None):
+        """Revalidate url on a background thread; callback(url, status) runs on that thread.
+
+        A second request for a URL that is already being fetched only adds its callback.
+        """
+        with self._lock:
+            if url in self._refreshing:
+                if callback:
+                    self._refreshing[url].append(callback)
+                return
+            self._refreshing[url] = [callback] if callback else []
+
+        def worker():
+            status = 'error'
+            try:
+                status, _ = self.fetch(url)
+            finally:
+                with self._lock:
+                    callbacks = self._refreshing.pop(url, [])
+                for pending in callbacks:
+                    pending(url, status)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _store(self, url, body, headers, charset):
+        if len(body) > self.max_bytes:
+            return  # never let one huge page flush the whole cache
+        key = self._key(url)
+        with self._lock:
+            file_name = key + '.html'
+            try:
+                with open(os.path.join(self.directory, file_name), 'wb') as f:
+                    f.write(body)
+            except OSError as e:
+                print(f"Could not write page cache entry: {e}")
+                return
+            now = time.time()
+            self._index[key] = {
+                'url': url,
+                'file': file_name,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'charset': charset or 'utf-8',
+                'size': len(body),
+                'fetched_at': now,
+                'accessed_at': now,
+            }
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = sum(meta.get('size', 0) for meta in self._index.values())
+        for key, meta in sorted(self._index.items(), key=lambda item: item[1].get('accessed_at', 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, meta['file']))
+            except OSError:
+                pass
+            total -= meta.get('size', 0)
+            del self._index[key]
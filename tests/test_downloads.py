@@ -0,0 +1,152 @@
+"""DownloadManager against a local HTTP server."""
+import http.server
+import os
+import re
+import tempfile
+import threading
+import unittest
+
+from downloads import DownloadJob, DownloadManager
+
+PAYLOAD = bytes(range(256)) * 40  # 10 KB
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    honour_range = True
+    gate = None  # threading.Event the handler waits on after the first chunk, if set
+    ranges = []
+
+    def do_GET(self):
+        requested = self.headers.get('Range')
+        type(self).ranges.append(requested)
+        start = 0
+        if requested and self.honour_range:
+            start = int(re.match(r'bytes=(\d+)-', requested).group(1))
+            if start >= len(PAYLOAD):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(PAYLOAD)}')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}')
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body[:1024])
+            self.wfile.flush()
+            if self.gate is not None:
+                self.gate.wait(5)
+            self.wfile.write(body[1024:])
+        except OSError:
+            pass  # the client went away (cancelled download)
+
+    def log_message(self, *args):
+        pass
+
+
+class DownloadManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        _Handler.honour_range = True
+        _Handler.gate = None
+        _Handler.ranges = []
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/paper.pdf'
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'paper.pdf')
+        self.manager = DownloadManager(max_workers=2, timeout=5)
+        self.manager.CHUNK_SIZE = 1024
+
+    def tearDown(self):
+        if _Handler.gate is not None:
+            _Handler.gate.set()
+        self.manager.shutdown()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _run(self, job, on_progress=None):
+        results = []
+        future = self.manager.submit(job, on_progress, lambda job, status, error: results.append((status, error)))
+        future.result(10)
+        return results[0]
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_download_writes_part_file_in_chunks(self):
+        seen = []
+
+        def on_progress(job):
+            seen.append((job.bytes_done, os.path.exists(job.part_path), os.path.exists(job.path)))
+
+        job = DownloadJob(self.url, self.path)
+        self.assertEqual(self._run(job, on_progress), ('done', None))
+        self.assertEqual(self._read(self.path), PAYLOAD)
+        self.assertFalse(os.path.exists(job.part_path))
+        self.assertEqual((job.bytes_done, job.total), (len(PAYLOAD), len(PAYLOAD)))
+        self.assertEqual(seen[0], (1024, True, False))  # reported after the first chunk, into the .part file
+        self.assertEqual(_Handler.ranges, [None])
+
+    def test_resume_with_range_request(self):
+        with open(self.path + '.part', 'wb') as f:
+            f.write(PAYLOAD[:3000])
+        self.assertEqual(self._run(DownloadJob(self.url, self.path)), ('done', None))
+        self.assertEqual(_Handler.ranges, ['bytes=3000-'])
+        self.assertEqual(self._read(self.path), PAYLOAD)
+
+    def test_server_ignoring_range_starts_over(self):
+        _Handler.honour_range = False
+        with open(self.path + '.part', 'wb') as f:
+            f.write(b'stale bytes')
+        self.assertEqual(self._run(DownloadJob(self.url, self.path)), ('done', None))
+        self.assertEqual(self._read(self.path), PAYLOAD)
+
+    def test_part_file_already_complete(self):
+        with open(self.path + '.part', 'wb') as f:
+            f.write(PAYLOAD)
+        job = DownloadJob(self.url, self.path)
+        self.assertEqual(self._run(job), ('done', None))
+        self.assertEqual(_Handler.ranges, [f'bytes={len(PAYLOAD)}-'])
+        self.assertEqual(self._read(self.path), PAYLOAD)
+        self.assertFalse(os.path.exists(job.part_path))
+
+    def test_cancel_keeps_part_file_for_resume(self):
+        _Handler.gate = threading.Event()
+        job = DownloadJob(self.url, self.path)
+        self.assertEqual(self._run(job, on_progress=lambda job: job.cancel()), ('cancelled', None))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(os.path.getsize(job.part_path), 1024)
+
+        _Handler.gate.set()
+        self.assertEqual(self._run(DownloadJob(self.url, self.path)), ('done', None))
+        self.assertEqual(_Handler.ranges[-1], 'bytes=1024-')
+        self.assertEqual(self._read(self.path), PAYLOAD)
+
+    def test_one_job_per_url_and_shutdown_cancels(self):
+        _Handler.gate = threading.Event()
+        started = threading.Event()
+        results = []
+        job = DownloadJob(self.url, self.path)
+        future = self.manager.submit(job, lambda job: started.set(),
+                                     lambda job, status, error: results.append(status))
+        self.assertTrue(started.wait(5))
+        self.assertTrue(self.manager.is_active(self.url))
+        self.assertIsNone(self.manager.submit(DownloadJob(self.url, self.path)))
+
+        self.manager.shutdown()
+        self.assertTrue(job.cancelled)
+        _Handler.gate.set()
+        future.result(5)
+        self.assertEqual(results, ['cancelled'])
+        self.assertFalse(self.manager.is_active(self.url))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""PageCache against a local HTTP server."""
+import http.server
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from page_cache import PageCache
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    pages = {}  # path -> (etag, body)
+    hits = []
+    gate = None  # threading.Event the handler waits on before answering, if set
+
+    def do_GET(self):
+        type(self).hits.append(self.path)
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.path not in self.pages:
+            self.send_error(404)
+            return
+        etag, body = self.pages[self.path]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PageCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        _Handler.pages = {
+            '/a': ('"a1"', b'<html>alpha</html>'),
+            '/b': ('"b1"', b'<html>' + b'b' * 100 + b'</html>'),
+        }
+        _Handler.hits = []
+        _Handler.gate = None
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PageCache(self.tmp.name, ttl_seconds=60, timeout=5)
+
+    def tearDown(self):
+        self._stop_server()
+        self.tmp.cleanup()
+
+    def _stop_server(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def _index_on_disk(self):
+        with open(os.path.join(self.tmp.name, PageCache.INDEX_NAME), encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_miss_then_fetch_stores_page(self):
+        url = self.base + '/a'
+        self.assertIsNone(self.cache.get(url))
+        self.assertEqual(self.cache.fetch(url)[0], 'updated')
+        html, meta = self.cache.get(url)
+        self.assertEqual(html, '<html>alpha</html>')
+        self.assertEqual(meta['etag'], '"a1"')
+        self.assertTrue(self.cache.has_fresh(url))
+
+    def test_etag_revalidation_keeps_body(self):
+        url = self.base + '/a'
+        self.cache.fetch(url)
+        self.assertEqual(self.cache.fetch(url), ('not-modified', 0))
+        self.assertEqual(self.cache.get(url)[0], '<html>alpha</html>')
+
+    def test_stale_copy_served_when_offline(self):
+        url = self.base + '/a'
+        self.cache.fetch(url)
+        self.cache.ttl_seconds = 0
+        self._stop_server()
+        self.assertEqual(self.cache.fetch(url)[0], 'error')
+        self.assertFalse(self.cache.has_fresh(url))
+        self.assertEqual(self.cache.get(url)[0], '<html>alpha</html>')
+
+    def test_non_html_and_missing_pages_are_not_stored(self):
+        url = self.base + '/missing'
+        self.assertEqual(self.cache.fetch(url)[0], 'error')
+        self.assertFalse(self.cache.contains(url))
+
+    def test_lru_eviction(self):
+        self.cache.max_bytes = 120
+        a, b = self.base + '/a', self.base + '/b'
+        self.cache.fetch(a)
+        time.sleep(0.01)
+        self.cache.fetch(b)
+        self.assertFalse(self.cache.contains(a))
+        self.assertTrue(self.cache.contains(b))
+        self.assertLessEqual(self.cache.total_bytes(), 120)
+
+    def test_get_defers_index_write_until_flush(self):
+        url = self.base + '/a'
+        self.cache.fetch(url)
+        stored = self._index_on_disk()
+        time.sleep(0.01)
+        self.cache.get(url)
+        self.assertEqual(self._index_on_disk(), stored)
+        self.cache.flush()
+        key = PageCache._key(url)
+        self.assertGreater(self._index_on_disk()[key]['accessed_at'], stored[key]['accessed_at'])
+
+    def test_refresh_async_fetches_once_for_concurrent_callers(self):
+        url = self.base + '/a'
+        done = threading.Event()
+        results = []
+
+        def callback(fetched_url, status):
+            results.append(status)
+            if len(results) == 2:
+                done.set()
+
+        _Handler.gate = threading.Event()
+        self.cache.refresh_async(url, callback)
+        self.cache.refresh_async(url, callback)
+        _Handler.gate.set()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(results, ['updated', 'updated'])
+        self.assertEqual(_Handler.hits.count('/a'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()